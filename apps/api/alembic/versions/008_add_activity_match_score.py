@@ -0,0 +1,52 @@
+"""Cache latest match score on job activities.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-01-20 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add cached match score columns to job_activities
+    op.add_column('job_activities', sa.Column('match_score_cached', sa.SmallInteger(), nullable=True))
+    op.add_column('job_activities', sa.Column('match_updated_at', sa.DateTime(timezone=True), nullable=True))
+    
+    # Backfill from the most recent match for each (user, job)
+    op.execute(
+        """
+        UPDATE job_activities SET
+            match_score_cached = (
+                SELECT CAST(ROUND(m.match_score) AS SMALLINT) FROM job_matches m
+                WHERE m.user_id = job_activities.user_id AND m.job_id = job_activities.job_id
+                ORDER BY m.created_at DESC LIMIT 1
+            ),
+            match_updated_at = (
+                SELECT m.created_at FROM job_matches m
+                WHERE m.user_id = job_activities.user_id AND m.job_id = job_activities.job_id
+                ORDER BY m.created_at DESC LIMIT 1
+            )
+        """
+    )
+    
+    # Composite index for tracker/dashboard listings sorted by score
+    op.create_index(
+        'ix_job_activities_user_status_score',
+        'job_activities',
+        ['user_id', 'status', sa.text('match_score_cached DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_activities_user_status_score', 'job_activities')
+    op.drop_column('job_activities', 'match_updated_at')
+    op.drop_column('job_activities', 'match_score_cached')
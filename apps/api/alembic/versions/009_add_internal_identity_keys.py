@@ -0,0 +1,59 @@
+"""Use sequential internal keys for append-only tables.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-01-21 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+# Append-only tables whose UUID primary key moves to a unique secondary key
+TABLES = ['job_matches', 'job_activities', 'notification_logs']
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    
+    for table in TABLES:
+        if bind.dialect.name == 'postgresql':
+            op.add_column(
+                table,
+                sa.Column('internal_id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+            )
+            op.drop_constraint(f'{table}_pkey', table, type_='primary')
+            op.create_primary_key(f'{table}_pkey', table, ['internal_id'])
+        else:
+            # SQLite can't change a primary key in place; rebuild the table
+            # with an INTEGER PRIMARY KEY so existing rows get rowid values
+            with op.batch_alter_table(table, recreate='always') as batch_op:
+                batch_op.add_column(
+                    sa.Column('internal_id', sa.Integer(), nullable=True),
+                    insert_before='id',
+                )
+                batch_op.create_primary_key(f'{table}_pkey', ['internal_id'])
+        
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_id', table)
+        
+        if bind.dialect.name == 'postgresql':
+            op.drop_constraint(f'{table}_pkey', table, type_='primary')
+            op.create_primary_key(f'{table}_pkey', table, ['id'])
+            op.drop_column(table, 'internal_id')
+        else:
+            with op.batch_alter_table(table, recreate='always') as batch_op:
+                batch_op.create_primary_key(f'{table}_pkey', ['id'])
+                batch_op.drop_column('internal_id')
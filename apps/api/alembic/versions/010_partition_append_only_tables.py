@@ -0,0 +1,100 @@
+"""Partition notification logs and job matches by month.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-01-22 00:00:00.000000
+
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.partitions import MONTHS_AHEAD, month_bounds, partition_ddl
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# Secondary indexes per table; the UUID index includes created_at because
+# unique indexes on a partitioned table must contain the partition key
+INDEXES = {
+    'job_matches': {
+        'ix_job_matches_user_id': ['user_id'],
+        'ix_job_matches_job_id': ['job_id'],
+        'ix_job_matches_resume_id': ['resume_id'],
+        'ix_job_matches_created_at': ['created_at'],
+    },
+    'notification_logs': {
+        'ix_notification_logs_user_id': ['user_id'],
+        'ix_notification_logs_notification_type': ['notification_type'],
+        'ix_notification_logs_related_job_id': ['related_job_id'],
+        'ix_notification_logs_created_at': ['created_at'],
+    },
+}
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """Copy table into a fresh (partitioned or plain) table of the same shape."""
+    bind = op.get_bind()
+    old = f'{table}_old'
+    
+    op.execute(f"UPDATE {table} SET created_at = now() WHERE created_at IS NULL")
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+    
+    partition_clause = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS){partition_clause}")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL")
+    
+    if partitioned:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (internal_id, created_at)")
+        
+        # Monthly partitions from the oldest row through the months ahead
+        oldest = bind.execute(sa.text(f"SELECT min(created_at) FROM {old}")).scalar()
+        month_start = (oldest.date() if oldest else date.today()).replace(day=1)
+        last_month = date.today().replace(day=1)
+        for _ in range(MONTHS_AHEAD):
+            last_month = month_bounds(last_month)[1]
+        while month_start <= last_month:
+            op.execute(partition_ddl(table, month_start))
+            month_start = month_bounds(month_start)[1]
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    else:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (internal_id)")
+    
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old} CASCADE")
+    
+    # Identity columns aren't supported on partitioned tables before
+    # Postgres 17, so internal_id is fed from a plain sequence instead
+    op.execute(f"CREATE SEQUENCE IF NOT EXISTS {table}_internal_id_seq OWNED BY {table}.internal_id")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN internal_id SET DEFAULT nextval('{table}_internal_id_seq')")
+    op.execute(
+        f"SELECT setval('{table}_internal_id_seq', "
+        f"COALESCE((SELECT max(internal_id) FROM {table}), 0) + 1, false)"
+    )
+    
+    for name, columns in INDEXES[table].items():
+        op.create_index(name, table, columns)
+    id_columns = ['id', 'created_at'] if partitioned else ['id']
+    op.create_index(f'ix_{table}_id', table, id_columns, unique=True)
+
+
+def upgrade() -> None:
+    # Declarative partitioning is Postgres-only; SQLite keeps plain tables
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in INDEXES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in INDEXES:
+        _rebuild(table, partitioned=False)
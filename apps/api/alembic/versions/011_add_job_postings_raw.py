@@ -0,0 +1,46 @@
+"""Move job posting raw payloads to a sidecar table.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-01-23 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_postings_raw',
+        sa.Column('job_id', sa.String(36), nullable=False),
+        sa.Column('raw_data', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['job_postings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id'),
+    )
+    
+    op.execute(
+        "INSERT INTO job_postings_raw (job_id, raw_data) "
+        "SELECT id, raw_data FROM job_postings WHERE raw_data IS NOT NULL"
+    )
+    
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.drop_column('raw_data')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.add_column(sa.Column('raw_data', sa.Text(), nullable=True))
+    
+    op.execute(
+        "UPDATE job_postings SET raw_data = "
+        "(SELECT raw_data FROM job_postings_raw WHERE job_postings_raw.job_id = job_postings.id)"
+    )
+    
+    op.drop_table('job_postings_raw')
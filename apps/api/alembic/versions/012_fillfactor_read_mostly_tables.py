@@ -0,0 +1,37 @@
+"""Pack read-mostly tables with fillfactor 100.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-01-24 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# skill_market_data isn't managed by alembic; its fillfactor comes from the
+# model's postgresql_with table option. notification_settings is updated by
+# users, so it keeps the default fillfactor for HOT updates (see revision 024)
+TABLES = ['job_sources']
+
+
+def upgrade() -> None:
+    # Storage parameters are Postgres-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 100)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,49 @@
+"""Drop low-cardinality indexes.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-01-25 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c['name'] == column for c in columns)
+
+
+def upgrade() -> None:
+    # Covered by ix_job_activities_user_status_score (every status filter is per user)
+    op.drop_index('ix_job_activities_status', 'job_activities')
+    
+    # Version tracking columns were added outside alembic, so their
+    # indexes may or may not exist
+    op.execute("DROP INDEX IF EXISTS ix_apply_kits_version")
+    op.execute("DROP INDEX IF EXISTS ix_apply_kits_is_active")
+    
+    if _has_column('apply_kits', 'is_active'):
+        op.create_index(
+            'ix_apply_kits_active',
+            'apply_kits',
+            ['user_id', 'job_id'],
+            postgresql_where=sa.text('is_active'),
+            sqlite_where=sa.text('is_active'),
+        )
+
+
+def downgrade() -> None:
+    if _has_column('apply_kits', 'is_active'):
+        op.drop_index('ix_apply_kits_active', 'apply_kits')
+        op.create_index('ix_apply_kits_is_active', 'apply_kits', ['is_active'])
+        op.create_index('ix_apply_kits_version', 'apply_kits', ['version'])
+    
+    op.create_index('ix_job_activities_status', 'job_activities', ['status'])
@@ -0,0 +1,82 @@
+"""Store notification digest time and match threshold as native types.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-01-26 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE notification_settings ALTER COLUMN daily_digest_time DROP DEFAULT")
+        op.execute("ALTER TABLE notification_settings ALTER COLUMN high_match_threshold DROP DEFAULT")
+        op.alter_column(
+            'notification_settings', 'daily_digest_time',
+            type_=sa.Time(),
+            postgresql_using='daily_digest_time::time',
+            server_default=sa.text("'09:00:00'"),
+        )
+        op.alter_column(
+            'notification_settings', 'high_match_threshold',
+            type_=sa.SmallInteger(),
+            postgresql_using='high_match_threshold::smallint',
+            server_default=sa.text('85'),
+        )
+    else:
+        # SQLite batch copies cast TIME to a number, so the HH:MM text is
+        # moved through a new column instead (read back as HH:MM:SS)
+        op.add_column('notification_settings', sa.Column('daily_digest_at', sa.Time(), nullable=True))
+        op.execute(sa.text(
+            "UPDATE notification_settings SET daily_digest_at = daily_digest_time || '\\:00'"
+        ))
+        with op.batch_alter_table('notification_settings') as batch_op:
+            batch_op.drop_column('daily_digest_time')
+            batch_op.alter_column(
+                'daily_digest_at',
+                new_column_name='daily_digest_time',
+                existing_type=sa.Time(),
+                nullable=False,
+                server_default=sa.text("'09:00:00'"),
+            )
+            batch_op.alter_column(
+                'high_match_threshold',
+                type_=sa.SmallInteger(),
+                server_default=sa.text('85'),
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("ALTER TABLE notification_settings ALTER COLUMN daily_digest_time DROP DEFAULT")
+        op.execute("ALTER TABLE notification_settings ALTER COLUMN high_match_threshold DROP DEFAULT")
+        op.alter_column(
+            'notification_settings', 'daily_digest_time',
+            type_=sa.String(5),
+            postgresql_using="to_char(daily_digest_time, 'HH24:MI')",
+            server_default='09:00',
+        )
+        op.alter_column(
+            'notification_settings', 'high_match_threshold',
+            type_=sa.String(3),
+            postgresql_using='high_match_threshold::text',
+            server_default='85',
+        )
+    else:
+        with op.batch_alter_table('notification_settings') as batch_op:
+            batch_op.alter_column('daily_digest_time', type_=sa.String(5), server_default='09:00')
+            batch_op.alter_column('high_match_threshold', type_=sa.String(3), server_default='85')
+        op.execute(
+            "UPDATE notification_settings "
+            "SET daily_digest_time = substr(daily_digest_time, 1, 5), "
+            "high_match_threshold = CAST(high_match_threshold AS TEXT)"
+        )
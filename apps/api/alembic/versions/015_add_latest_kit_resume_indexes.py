@@ -0,0 +1,54 @@
+"""Add partial indexes for latest interview kit and parsed resume lookups.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-01-27 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_index(table: str, name: str) -> bool:
+    return any(index['name'] == name for index in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade() -> None:
+    # Both indexes are declared on the models, so create_all may have made them
+    if not _has_index('resumes', 'ix_resumes_user_parsed_uploaded'):
+        op.create_index(
+            'ix_resumes_user_parsed_uploaded',
+            'resumes',
+            ['user_id', 'uploaded_at'],
+            postgresql_where=sa.text('is_parsed'),
+            sqlite_where=sa.text('is_parsed'),
+        )
+    
+    # Interview tables are created outside alembic, so they may not exist yet
+    if _has_table('interview_kits') and not _has_index('interview_kits', 'ix_interview_kits_active'):
+        op.create_index(
+            'ix_interview_kits_active',
+            'interview_kits',
+            ['user_id', 'job_id', 'created_at'],
+            postgresql_where=sa.text('is_active'),
+            sqlite_where=sa.text('is_active'),
+        )
+
+
+def downgrade() -> None:
+    if _has_table('interview_kits') and _has_index('interview_kits', 'ix_interview_kits_active'):
+        op.drop_index('ix_interview_kits_active', 'interview_kits')
+    
+    if _has_index('resumes', 'ix_resumes_user_parsed_uploaded'):
+        op.drop_index('ix_resumes_user_parsed_uploaded', 'resumes')
@@ -0,0 +1,51 @@
+"""Make company_insights.company_name unique for upserts.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-01-28 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    # Interview tables are created outside alembic, so they may not exist yet
+    if not _has_table('company_insights'):
+        return
+    
+    # Keep the newest insight per company
+    op.execute(
+        "DELETE FROM company_insights WHERE id NOT IN ("
+        "SELECT id FROM ("
+        "SELECT id, ROW_NUMBER() OVER ("
+        "PARTITION BY company_name ORDER BY last_updated DESC NULLS LAST, created_at DESC NULLS LAST"
+        ") AS rn FROM company_insights"
+        ") ranked WHERE rn = 1)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_company_insights_company_name")
+    op.create_index(
+        'ix_company_insights_company_name',
+        'company_insights',
+        ['company_name'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    if not _has_table('company_insights'):
+        return
+    
+    op.drop_index('ix_company_insights_company_name', 'company_insights')
+    op.create_index('ix_company_insights_company_name', 'company_insights', ['company_name'])
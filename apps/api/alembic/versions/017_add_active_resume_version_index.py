@@ -0,0 +1,46 @@
+"""Add partial index for the latest active resume version lookup.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-01-29 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_index(table: str, name: str) -> bool:
+    return any(index['name'] == name for index in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade() -> None:
+    # AI resume tables are created outside alembic from the models, so they
+    # may not exist yet, or may already carry the index
+    if _has_table('ai_resume_versions') and not _has_index(
+        'ai_resume_versions', 'ix_ai_resume_versions_active'
+    ):
+        op.create_index(
+            'ix_ai_resume_versions_active',
+            'ai_resume_versions',
+            ['user_id', 'job_id', sa.text('created_at DESC')],
+            postgresql_where=sa.text('is_active'),
+            sqlite_where=sa.text('is_active'),
+        )
+
+
+def downgrade() -> None:
+    if _has_table('ai_resume_versions') and _has_index(
+        'ai_resume_versions', 'ix_ai_resume_versions_active'
+    ):
+        op.drop_index('ix_ai_resume_versions_active', 'ai_resume_versions')
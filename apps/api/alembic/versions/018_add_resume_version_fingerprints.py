@@ -0,0 +1,44 @@
+"""Add per-field content fingerprints to resume versions.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-01-30 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_column(table: str, column: str) -> bool:
+    return any(col['name'] == column for col in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade() -> None:
+    # AI resume tables are created outside alembic from the models, so they
+    # may not exist yet, or may already have the column
+    if _has_table('ai_resume_versions') and not _has_column(
+        'ai_resume_versions', 'content_fingerprints'
+    ):
+        op.add_column(
+            'ai_resume_versions',
+            sa.Column('content_fingerprints', sa.Text(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    if _has_table('ai_resume_versions') and _has_column(
+        'ai_resume_versions', 'content_fingerprints'
+    ):
+        with op.batch_alter_table('ai_resume_versions') as batch_op:
+            batch_op.drop_column('content_fingerprints')
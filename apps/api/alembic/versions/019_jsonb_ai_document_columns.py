@@ -0,0 +1,76 @@
+"""Store AI resume and interview documents as JSONB on Postgres.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-01-31 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+# JSON document columns per table (previously JSON encoded into TEXT)
+JSON_COLUMNS = {
+    'ai_resume_versions': ('optimized_content', 'keyword_density', 'content_fingerprints', 'formats'),
+    'resume_optimization_logs': ('ai_parameters', 'optimization_focus'),
+    'interview_kits': (
+        'questions', 'talking_points', 'company_insights', 'star_examples', 'preparation_checklist'
+    ),
+    'interview_questions': ('suggested_answer', 'key_points', 'follow_up_questions'),
+    'star_examples': ('source_experience',),
+}
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_index(table: str, name: str) -> bool:
+    return any(index['name'] == name for index in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade() -> None:
+    # SQLite reads the existing TEXT values through the JSON type as-is
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # AI tables are created outside alembic, so they may not exist yet
+    for table, columns in JSON_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+    
+    if _has_table('ai_resume_versions') and not _has_index(
+        'ai_resume_versions', 'ix_ai_resume_versions_content_gin'
+    ):
+        op.create_index(
+            'ix_ai_resume_versions_content_gin',
+            'ai_resume_versions',
+            ['optimized_content'],
+            postgresql_using='gin',
+            postgresql_ops={'optimized_content': 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    if _has_table('ai_resume_versions') and _has_index(
+        'ai_resume_versions', 'ix_ai_resume_versions_content_gin'
+    ):
+        op.drop_index('ix_ai_resume_versions_content_gin', 'ai_resume_versions')
+    
+    for table, columns in JSON_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text USING {column}::text")
@@ -0,0 +1,53 @@
+"""Store skill gap analyses and learning paths as JSONB on Postgres.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-02-01 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+# JSON document columns per table (previously JSON encoded into TEXT)
+JSON_COLUMNS = {
+    'skill_gap_analyses': (
+        'missing_skills', 'learning_recommendations', 'estimated_timeline', 'priority_score', 'market_demand'
+    ),
+    'learning_paths': ('learning_steps', 'milestones', 'skill_progression', 'priority_order'),
+}
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    # SQLite reads the existing TEXT values through the JSON type as-is
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    # AI tables are created outside alembic, so they may not exist yet
+    for table, columns in JSON_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table, columns in JSON_COLUMNS.items():
+        if not _has_table(table):
+            continue
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text USING {column}::text")
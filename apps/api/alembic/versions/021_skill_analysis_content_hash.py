@@ -0,0 +1,44 @@
+"""Add a resume and job content hash to skill gap analyses.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-02-02 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_column(table: str, column: str) -> bool:
+    return any(col['name'] == column for col in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def upgrade() -> None:
+    # AI skill tables are created outside alembic from the models, so they
+    # may not exist yet, or may already have the column
+    if _has_table('skill_gap_analyses') and not _has_column('skill_gap_analyses', 'content_hash'):
+        op.add_column(
+            'skill_gap_analyses',
+            sa.Column('content_hash', sa.String(64), nullable=True),
+        )
+        op.create_index(
+            'ix_skill_gap_analyses_content_hash', 'skill_gap_analyses', ['content_hash']
+        )
+
+
+def downgrade() -> None:
+    if _has_table('skill_gap_analyses') and _has_column('skill_gap_analyses', 'content_hash'):
+        op.drop_index('ix_skill_gap_analyses_content_hash', 'skill_gap_analyses')
+        with op.batch_alter_table('skill_gap_analyses') as batch_op:
+            batch_op.drop_column('content_hash')
@@ -0,0 +1,61 @@
+"""Make skill progress records unique per user and skill for upserts.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-02-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def _has_index(table: str, index: str) -> bool:
+    return any(ix['name'] == index for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade() -> None:
+    # AI skill tables are created outside alembic from the models, so they
+    # may not exist yet, or may already have the index
+    if not _has_table('skill_progress_tracking') or _has_index(
+        'skill_progress_tracking', 'ix_skill_progress_tracking_user_skill'
+    ):
+        return
+    
+    # Keep the most recently updated record per user and skill
+    op.execute(
+        "DELETE FROM skill_progress_tracking WHERE id NOT IN ("
+        "SELECT id FROM ("
+        "SELECT id, ROW_NUMBER() OVER ("
+        "PARTITION BY user_id, skill_name ORDER BY last_updated DESC NULLS LAST, created_at DESC NULLS LAST"
+        ") AS rn FROM skill_progress_tracking"
+        ") ranked WHERE rn = 1)"
+    )
+    if _has_table('skill_progress_feedback'):
+        op.execute(
+            "DELETE FROM skill_progress_feedback "
+            "WHERE progress_id NOT IN (SELECT id FROM skill_progress_tracking)"
+        )
+    op.create_index(
+        'ix_skill_progress_tracking_user_skill',
+        'skill_progress_tracking',
+        ['user_id', 'skill_name'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    if _has_table('skill_progress_tracking') and _has_index(
+        'skill_progress_tracking', 'ix_skill_progress_tracking_user_skill'
+    ):
+        op.drop_index('ix_skill_progress_tracking_user_skill', 'skill_progress_tracking')
@@ -0,0 +1,101 @@
+"""Turn job_matches back into a plain table with a unique match id.
+
+Matches are now updated in place (one row per user, job and resume), so
+job_matches is no longer append-only. On a partitioned table a unique index
+must include created_at, which leaves ON CONFLICT (id) nothing to infer from.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2025-02-04 00:00:00.000000
+
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.partitions import MONTHS_AHEAD, month_bounds, partition_ddl
+
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'ix_job_matches_user_id': ['user_id'],
+    'ix_job_matches_job_id': ['job_id'],
+    'ix_job_matches_resume_id': ['resume_id'],
+    'ix_job_matches_created_at': ['created_at'],
+}
+
+
+def _is_partitioned() -> bool:
+    return op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'job_matches'::regclass"
+    )).scalar() is not None
+
+
+def _rebuild(partitioned: bool) -> None:
+    """Copy job_matches into a fresh (partitioned or plain) table of the same shape."""
+    bind = op.get_bind()
+    
+    op.execute("ALTER TABLE job_matches RENAME TO job_matches_old")
+    op.execute("ALTER TABLE job_matches_old RENAME CONSTRAINT job_matches_pkey TO job_matches_old_pkey")
+    
+    partition_clause = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(f"CREATE TABLE job_matches (LIKE job_matches_old INCLUDING DEFAULTS){partition_clause}")
+    
+    if partitioned:
+        op.execute("ALTER TABLE job_matches ADD CONSTRAINT job_matches_pkey PRIMARY KEY (internal_id, created_at)")
+        
+        # Monthly partitions from the oldest row through the months ahead
+        oldest = bind.execute(sa.text("SELECT min(created_at) FROM job_matches_old")).scalar()
+        month_start = (oldest.date() if oldest else date.today()).replace(day=1)
+        last_month = date.today().replace(day=1)
+        for _ in range(MONTHS_AHEAD):
+            last_month = month_bounds(last_month)[1]
+        while month_start <= last_month:
+            op.execute(partition_ddl('job_matches', month_start))
+            month_start = month_bounds(month_start)[1]
+        op.execute("CREATE TABLE job_matches_default PARTITION OF job_matches DEFAULT")
+        op.execute("INSERT INTO job_matches SELECT * FROM job_matches_old")
+    else:
+        op.execute("ALTER TABLE job_matches ADD CONSTRAINT job_matches_pkey PRIMARY KEY (internal_id)")
+        
+        # Racing stores could leave duplicate ids; keep the latest row of each
+        op.execute(
+            "INSERT INTO job_matches SELECT * FROM ("
+            "SELECT DISTINCT ON (id) * FROM job_matches_old "
+            "ORDER BY id, updated_at DESC NULLS LAST, internal_id DESC"
+            ") latest"
+        )
+    op.execute("DROP TABLE job_matches_old CASCADE")
+    
+    # The sequence was owned by the old table's column and dropped with it
+    op.execute("CREATE SEQUENCE IF NOT EXISTS job_matches_internal_id_seq OWNED BY job_matches.internal_id")
+    op.execute("ALTER TABLE job_matches ALTER COLUMN internal_id SET DEFAULT nextval('job_matches_internal_id_seq')")
+    op.execute(
+        "SELECT setval('job_matches_internal_id_seq', "
+        "COALESCE((SELECT max(internal_id) FROM job_matches), 0) + 1, false)"
+    )
+    
+    for name, columns in INDEXES.items():
+        op.create_index(name, 'job_matches', columns)
+    id_columns = ['id', 'created_at'] if partitioned else ['id']
+    op.create_index('ix_job_matches_id', 'job_matches', id_columns, unique=True)
+
+
+def upgrade() -> None:
+    # Partitioning only ever applied on Postgres (see revision 010)
+    if op.get_bind().dialect.name != 'postgresql' or not _is_partitioned():
+        return
+    
+    _rebuild(partitioned=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql' or _is_partitioned():
+        return
+    
+    _rebuild(partitioned=True)
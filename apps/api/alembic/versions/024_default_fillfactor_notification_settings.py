@@ -0,0 +1,32 @@
+"""Restore the default fillfactor on notification_settings.
+
+Revision 012 used to pack notification_settings with fillfactor 100, but
+users update their settings in place, and those updates need free space on
+the page to stay HOT.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2025-02-05 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Storage parameters are Postgres-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    op.execute("ALTER TABLE notification_settings RESET (fillfactor)")
+
+
+def downgrade() -> None:
+    # Nothing to undo: revision 012 no longer sets a fillfactor on this table
+    pass
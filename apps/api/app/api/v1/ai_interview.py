@@ -11,6 +11,7 @@ from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.ai.interview_prep import InterviewPreparationEngine
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -334,11 +335,11 @@ async def get_interview_questions(
                 "text": q.question_text,
                 "category": q.category,
                 "difficulty": q.difficulty,
-                "suggested_answer": json.loads(q.suggested_answer) if q.suggested_answer else {},
-                "key_points": json.loads(q.key_points) if q.key_points else [],
-                "follow_up_questions": json.loads(q.follow_up_questions) if q.follow_up_questions else [],
+                "suggested_answer": q.suggested_answer or {},
+                "key_points": q.key_points or [],
+                "follow_up_questions": q.follow_up_questions or [],
                 "user_answer": q.user_answer,
-                "ai_feedback": json.loads(q.ai_feedback) if q.ai_feedback else {},
+                "ai_feedback": orjson.loads(q.ai_feedback) if q.ai_feedback else {},
                 "feedback_score": q.feedback_score,
                 "is_practiced": q.is_practiced,
                 "order_index": q.order_index
@@ -439,8 +440,9 @@ async def get_interview_analytics(
         from sqlalchemy import select, func
         from app.models.ai_interview import InterviewKit, InterviewQuestion
         
-        # Get interview kit for this job
-        kit_result = await db.execute(
+        # Latest active kit and its question stats in one round trip; a kit
+        # without questions still yields one row with NULL question columns
+        latest_kit = (
             select(InterviewKit)
             .where(
                 InterviewKit.user_id == current_user.id,
@@ -448,22 +450,32 @@ async def get_interview_analytics(
                 InterviewKit.is_active == True
             )
             .order_by(InterviewKit.created_at.desc())
+            .limit(1)
+            .subquery()
         )
-        kit = kit_result.scalar_one_or_none()
+        rows = (await db.execute(
+            select(
+                latest_kit.c.id,
+                latest_kit.c.estimated_prep_time,
+                latest_kit.c.difficulty_level,
+                latest_kit.c.created_at,
+                InterviewQuestion.category,
+                InterviewQuestion.is_practiced,
+                InterviewQuestion.feedback_score,
+            )
+            .select_from(latest_kit)
+            .outerjoin(InterviewQuestion, InterviewQuestion.kit_id == latest_kit.c.id)
+        )).all()
         
-        if not kit:
+        if not rows:
             return {
                 "job_id": job_id,
                 "kit_exists": False,
                 "analytics": {}
             }
         
-        # Get questions analytics
-        questions_result = await db.execute(
-            select(InterviewQuestion)
-            .where(InterviewQuestion.kit_id == kit.id)
-        )
-        questions = questions_result.scalars().all()
+        kit = rows[0]
+        questions = [q for q in rows if q.category is not None]
         
         # Calculate analytics
         total_questions = len(questions)
@@ -7,15 +7,35 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.services.ai.skill_analyzer import SkillAnalyzerEngine
+from app.services.ai.skill_queue import SkillAnalyzeProducer
+import functools
+import redis.asyncio as redis
 
 router = APIRouter()
 skill_analyzer = SkillAnalyzerEngine()
 
 
+@functools.lru_cache(maxsize=1)
+def _skill_queue() -> SkillAnalyzeProducer:
+    # One connection pool per process; connections are opened on first use
+    return SkillAnalyzeProducer(redis.from_url(settings.REDIS_URL, decode_responses=True))
+
+
+def get_skill_queue() -> SkillAnalyzeProducer:
+    """Producer for queued skill analyses; 503 when Redis is disabled."""
+    if not settings.REDIS_URL:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Queued skill analysis is unavailable"
+        )
+    return _skill_queue()
+
+
 # Request/Response Models
 class SkillGapAnalysisRequest(BaseModel):
     job_id: str = Field(..., description="Job posting ID to analyze against")
@@ -48,6 +68,13 @@ class SkillGapAnalysisResponse(BaseModel):
     updated_at: Optional[str]
 
 
+class SkillAnalysisTaskResponse(BaseModel):
+    task_id: str
+    status: str
+    error: Optional[str] = None
+    analysis: Optional[SkillGapAnalysisResponse] = None
+
+
 class SkillProgressResponse(BaseModel):
     skill_name: str
     current_level: float
@@ -117,6 +144,82 @@ async def analyze_skill_gaps(
         )
 
 
+@router.post(
+    "/analyze/tasks",
+    response_model=SkillAnalysisTaskResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def queue_skill_gap_analysis(
+    request: SkillGapAnalysisRequest,
+    current_user: User = Depends(get_current_user),
+    queue: SkillAnalyzeProducer = Depends(get_skill_queue)
+):
+    """
+    Queue a skill gap analysis for a specific job posting.
+    
+    Returns a task id right away; an analysis worker runs the same analysis
+    as `POST /analyze`. Poll `GET /analysis/tasks/{task_id}` for the result.
+    """
+    try:
+        task_id = await queue.enqueue(
+            user_id=current_user.id,
+            job_id=request.job_id,
+            include_market_data=request.include_market_data,
+            regenerate=request.regenerate
+        )
+    except redis.RedisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to queue skill analysis: {str(e)}"
+        )
+    
+    return SkillAnalysisTaskResponse(task_id=task_id, status="queued")
+
+
+@router.get("/analysis/tasks/{task_id}", response_model=SkillAnalysisTaskResponse)
+async def get_skill_analysis_task(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    queue: SkillAnalyzeProducer = Depends(get_skill_queue)
+):
+    """
+    Get the status of a queued skill gap analysis.
+    
+    Status is queued, running, completed or failed; completed tasks include
+    the analysis. Tasks are kept for an hour.
+    """
+    try:
+        task = await queue.get_status(task_id)
+    except redis.RedisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to read skill analysis task: {str(e)}"
+        )
+    
+    if not task or task.get("user_id") != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skill analysis task not found"
+        )
+    
+    analysis = None
+    if task["status"] == "completed":
+        result = await skill_analyzer.get_skill_analysis(
+            db=db,
+            user_id=current_user.id,
+            job_id=task["job_id"]
+        )
+        analysis = SkillGapAnalysisResponse(**result) if result else None
+    
+    return SkillAnalysisTaskResponse(
+        task_id=task_id,
+        status=task["status"],
+        error=task.get("error"),
+        analysis=analysis
+    )
+
+
 @router.get("/analysis/{job_id}", response_model=Optional[SkillGapAnalysisResponse])
 async def get_skill_analysis(
     job_id: str,
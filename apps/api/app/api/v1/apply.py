@@ -6,6 +6,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
+from app.core.responses import ORJSONPydanticResponse, list_envelope
 from app.api.v1.auth import get_current_user
 from app.services.apply_service import ApplyKitService, ActivityService
 from app.services.pdf_generator import PDFGenerator  # Task 2.5
@@ -18,12 +19,12 @@ from app.schemas.apply import (
     SetActivityStatusResponse,
     JobActivityResponse,
     JobActivityListResponse,
-    ActivityStatusEnum,
+    ACTIVITY_LIST_ADAPTER,
 )
 from app.models.user import User
 from app.models.apply import ActivityStatus
 from app.models.job import JobPosting
-from typing import Dict
+from typing import Dict, Literal
 import math
 import json
 import logging
@@ -121,7 +122,7 @@ async def get_apply_kit(
                 detail="Apply kit not found"
             )
         
-        return apply_kit
+        return ApplyKitResponse.from_orm_fast(apply_kit)
         
     except HTTPException:
         raise
@@ -168,7 +169,7 @@ async def update_apply_kit(
         
         await db.commit()
         
-        return apply_kit
+        return ApplyKitResponse.from_orm_fast(apply_kit)
         
     except HTTPException:
         raise
@@ -300,7 +301,7 @@ async def get_specific_version(
                 detail=f"Version {version_number} not found"
             )
         
-        return apply_kit
+        return ApplyKitResponse.from_orm_fast(apply_kit)
         
     except HTTPException:
         raise
@@ -347,7 +348,7 @@ async def activate_version(
         
         await db.commit()
         
-        return apply_kit
+        return ApplyKitResponse.from_orm_fast(apply_kit)
         
     except HTTPException:
         raise
@@ -456,7 +457,7 @@ async def set_activity_status(
     """
     try:
         # Convert string status to enum
-        status_enum = ActivityStatus(request.status.value)
+        status_enum = ActivityStatus(request.status)
         
         activity = await ActivityService.set_activity_status(
             db=db,
@@ -471,7 +472,7 @@ async def set_activity_status(
         return SetActivityStatusResponse(
             activity_id=activity.id,
             job_id=job_id,
-            status=ActivityStatusEnum(activity.status.value),
+            status=activity.status.value,
             message=f"Status updated to {activity.status.value}",
         )
         
@@ -488,11 +489,12 @@ async def set_activity_status(
         )
 
 
-@router.get("/tracker", response_model=JobActivityListResponse)
+@router.get("/tracker", response_model=JobActivityListResponse, response_class=ORJSONPydanticResponse)
 async def get_activities(
     status: str = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    sort_by: Literal["updated", "match_score"] = Query("updated", description="Sort order"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -503,6 +505,7 @@ async def get_activities(
         status: Optional status filter
         page: Page number
         page_size: Items per page
+        sort_by: "updated" (newest changes first) or "match_score" (best matches first)
         
     Returns:
         Paginated list of activities
@@ -519,17 +522,21 @@ async def get_activities(
             status=status_enum,
             page=page,
             page_size=page_size,
+            sort_by=sort_by,
         )
         
         total_pages = math.ceil(total / page_size) if total > 0 else 0
         
-        return JobActivityListResponse(
-            activities=activities,
+        return ORJSONPydanticResponse(list_envelope(
+            "activities",
+            ACTIVITY_LIST_ADAPTER.dump_json(
+                [JobActivityResponse.from_orm_fast(a) for a in activities], by_alias=True
+            ),
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-        )
+        ))
         
     except ValueError as e:
         raise HTTPException(
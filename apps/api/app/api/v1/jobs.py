@@ -4,6 +4,7 @@ Job sources and postings API endpoints.
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
+from app.core.responses import ORJSONPydanticResponse, list_envelope
 from app.services.auth import get_current_user_from_cookie
 from app.services.job_service import JobService
 from app.schemas.job import (
@@ -15,8 +16,9 @@ from app.schemas.job import (
     JobFilters,
     FetchJobsResponse,
 )
+from app.schemas.structs import dump_job_postings
 from app.models.user import User
-from typing import List
+from typing import Annotated, List
 import math
 
 router = APIRouter()
@@ -226,20 +228,12 @@ async def create_job(
     await db.commit()
     await db.refresh(job)
     
-    return job
+    return JobPostingResponse.from_orm_fast(job)
 
 
-@router.get("/jobs", response_model=JobPostingListResponse)
+@router.get("/jobs", response_model=JobPostingListResponse, response_class=ORJSONPydanticResponse)
 async def get_jobs(
-    title: str = Query(None, description="Filter by title"),
-    company: str = Query(None, description="Filter by company"),
-    location: str = Query(None, description="Filter by location"),
-    work_type: str = Query(None, description="Filter by work type"),
-    min_salary: int = Query(None, description="Minimum salary"),
-    source_id: str = Query(None, description="Filter by source ID"),
-    is_active: bool = Query(True, description="Filter active jobs"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    filters: Annotated[JobFilters, Query()],
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -247,33 +241,23 @@ async def get_jobs(
     Get job postings with filtering and pagination.
     
     Args:
-        Various filter parameters
+        filters: Filter and pagination query parameters, validated once
+            as a JobFilters model
         
     Returns:
         Paginated list of job postings
     """
-    filters = JobFilters(
-        title=title,
-        company=company,
-        location=location,
-        work_type=work_type,
-        min_salary=min_salary,
-        source_id=source_id,
-        is_active=is_active,
-        page=page,
-        page_size=page_size,
-    )
-    
     jobs, total = await JobService.get_jobs(db, filters)
-    total_pages = math.ceil(total / page_size) if total > 0 else 0
+    total_pages = math.ceil(total / filters.page_size) if total > 0 else 0
     
-    return JobPostingListResponse(
-        jobs=jobs,
+    return ORJSONPydanticResponse(list_envelope(
+        "jobs",
+        dump_job_postings(jobs),
         total=total,
-        page=page,
-        page_size=page_size,
+        page=filters.page,
+        page_size=filters.page_size,
         total_pages=total_pages,
-    )
+    ))
 
 
 @router.get("/jobs/{job_id}", response_model=JobPostingResponse)
@@ -305,7 +289,7 @@ async def get_job(
             detail="Job not found"
         )
     
-    return job
+    return JobPostingResponse.from_orm_fast(job)
 
 
 @router.post("/jobs/bulk", status_code=status.HTTP_201_CREATED)
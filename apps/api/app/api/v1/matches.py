@@ -4,6 +4,7 @@ Job matches API endpoints.
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
+from app.core.responses import ORJSONPydanticResponse, list_envelope
 from app.services.auth import get_current_user_from_cookie
 from app.services.match_service import MatchDatabaseService, MatchComputationService
 from app.schemas.match import (
@@ -13,7 +14,9 @@ from app.schemas.match import (
     RecomputeMatchesResponse,
     MatchSuggestionsResponse,
     NoMatchesSuggestion,
+    match_from_orm,
 )
+from app.schemas.structs import dump_matches
 from app.models.user import User
 import math
 import logging
@@ -71,7 +74,7 @@ async def recompute_matches(
         )
 
 
-@router.get("/matches", response_model=JobMatchListResponse)
+@router.get("/matches", response_model=JobMatchListResponse, response_class=ORJSONPydanticResponse)
 async def get_matches(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -101,13 +104,14 @@ async def get_matches(
         
         total_pages = math.ceil(total / page_size) if total > 0 else 0
         
-        return JobMatchListResponse(
-            matches=matches,
+        return ORJSONPydanticResponse(list_envelope(
+            "matches",
+            dump_matches(matches),
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error fetching matches for user {current_user.id}: {e}")
@@ -148,7 +152,7 @@ async def get_match(
                 detail="Not authorized to view this match"
             )
         
-        return match
+        return match_from_orm(match)
         
     except HTTPException:
         raise
@@ -4,6 +4,7 @@ Notification API endpoints.
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
+from app.core.responses import ORJSONPydanticResponse, list_envelope
 from app.api.v1.auth import get_current_user
 from app.services.notification_service import (
     NotificationSettingsService,
@@ -18,6 +19,7 @@ from app.schemas.notification import (
     SendTestEmailRequest,
     SendTestEmailResponse,
 )
+from app.schemas.structs import dump_notification_logs
 from app.models.user import User
 import logging
 
@@ -92,7 +94,7 @@ async def update_notification_settings(
 
 
 # Notification History Endpoints
-@router.get("/notifications/history", response_model=NotificationHistoryResponse)
+@router.get("/notifications/history", response_model=NotificationHistoryResponse, response_class=ORJSONPydanticResponse)
 async def get_notification_history(
     limit: int = 20,
     current_user: User = Depends(get_current_user),
@@ -114,10 +116,11 @@ async def get_notification_history(
             limit=limit,
         )
         
-        return NotificationHistoryResponse(
-            notifications=notifications,
+        return ORJSONPydanticResponse(list_envelope(
+            "notifications",
+            dump_notification_logs(notifications),
             total=len(notifications),
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error fetching notification history: {e}")
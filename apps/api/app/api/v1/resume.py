@@ -11,6 +11,7 @@ from slowapi.util import get_remote_address
 import os
 
 from app.core.database import get_db
+from app.core.responses import ORJSONPydanticResponse
 from app.services.auth import get_current_user_from_cookie
 from app.services.resume import ResumeService
 from app.models.user import User
@@ -167,7 +168,7 @@ async def upload_resume(
     )
 
 
-@router.get("/list", response_model=List[ResumeListItem])
+@router.get("/list", response_model=List[ResumeListItem], response_class=ORJSONPydanticResponse)
 async def list_resumes(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -180,16 +181,17 @@ async def list_resumes(
         # Get scorecard if exists
         scorecard = await ResumeService.get_scorecard(db, resume.id, str(current_user.id))
         
-        result.append(ResumeListItem(
-            id=resume.id,
-            filename=resume.filename,
-            file_size=resume.file_size,
-            is_parsed=resume.is_parsed,
-            uploaded_at=resume.uploaded_at,
-            ats_score=scorecard.ats_score if scorecard else None
-        ))
-    
-    return result
+        # Ids are stored as UUID text already; write them through as-is
+        result.append({
+            "id": resume.id,
+            "filename": resume.filename,
+            "file_size": resume.file_size,
+            "is_parsed": resume.is_parsed,
+            "uploaded_at": resume.uploaded_at,
+            "ats_score": scorecard.ats_score if scorecard else None,
+        })
+    
+    return ORJSONPydanticResponse(result)
 
 
 @router.get("/{resume_id}", response_model=ResumeDetail)
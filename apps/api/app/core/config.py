@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     # Rate Limiting Control - PATCH 13: Disable in test mode
     RATE_LIMIT_ENABLED: bool = True
     
+    # Encode hot list responses with msgspec when installed (perf extra)
+    MSGSPEC_RESPONSES: bool = True
+    
     # JWT Configuration - SECURITY P0: Must be from environment
     JWT_SECRET: str = ""  # REQUIRED in production
     JWT_ALGORITHM: str = "HS256"
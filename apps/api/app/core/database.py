@@ -3,14 +3,20 @@ Database connection and session management.
 Uses SQLAlchemy async engine with proper session lifecycle.
 PATCH 14: True async-scoped sessions for concurrency safety.
 """
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, List
 from app.core.config import settings
+from app.core.json import dumps_text
+import asyncio
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
+
 # Create async engine with proper configuration
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -22,6 +28,8 @@ engine = create_async_engine(
     max_overflow=10 if "sqlite" in settings.DATABASE_URL else 20,
     pool_timeout=30,
     pool_recycle=3600,
+    json_serializer=dumps_text,
+    json_deserializer=orjson.loads,
 )
 
 # PATCH 14: Session factory with proper async configuration
@@ -36,6 +44,43 @@ AsyncSessionLocal = async_sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# JSON document column: JSONB on Postgres, JSON text elsewhere. Python None
+# is stored as SQL NULL rather than a JSON null.
+JSONDocument = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+# Side sessions gather_reads may hold at once across the process, so
+# concurrent reads can't drain the pool the request sessions need
+GATHER_READS_LIMIT = 4
+_gather_reads_slots = asyncio.Semaphore(GATHER_READS_LIMIT)
+
+
+async def gather_reads(
+    db: AsyncSession, *reads: Callable[[AsyncSession], Awaitable[Any]]
+) -> List[Any]:
+    """
+    Run independent read-only queries concurrently and return their results.
+
+    An AsyncSession can't run statements concurrently, so each read gets a
+    short-lived session on db's engine, at most GATHER_READS_LIMIT at a time.
+    ORM objects in the results are merged into db without reloading, so the
+    caller gets objects attached to its own session. The reads don't see
+    db's uncommitted changes. When db is bound to a single connection
+    instead of an engine, the reads run one after another on db.
+    """
+    if not isinstance(db.bind, AsyncEngine):
+        return [await read(db) for read in reads]
+
+    async def run(read):
+        async with _gather_reads_slots:
+            async with AsyncSession(db.bind, expire_on_commit=False) as session:
+                return await read(session)
+
+    results = await asyncio.gather(*(run(read) for read in reads))
+    return [
+        await db.merge(result, load=False) if isinstance(result, Base) else result
+        for result in results
+    ]
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -0,0 +1,10 @@
+"""
+JSON encoding for text storage.
+"""
+from typing import Any
+import orjson
+
+
+def dumps_text(value: Any) -> str:
+    """Encode a payload for a TEXT or JSON column (orjson, compact UTF-8)."""
+    return orjson.dumps(value).decode()
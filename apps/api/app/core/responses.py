@@ -0,0 +1,61 @@
+"""
+Response classes.
+ORJSONPydanticResponse serializes already-built payloads with orjson, so
+list endpoints skip FastAPI's jsonable_encoder and response model
+re-validation passes.
+"""
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from typing import Any
+from decimal import Decimal
+import orjson
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        # Python-mode dump keeps datetime/UUID/Enum values as objects so
+        # orjson formats them itself instead of Pydantic building strings
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONPydanticResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Accepts pre-rendered JSON bytes, a Pydantic model (dumped with
+    model_dump_json) or plain JSON-compatible content. Returning it from
+    a route bypasses the route's response_model validation, so use it
+    only for trusted, server-built payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode("utf-8")
+        # UUID, datetime, Enum and dataclass values are written natively by orjson
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+def list_envelope(field: str, items_json: bytes, **meta: Any) -> bytes:
+    """
+    Render {field: items_json, **meta} as JSON bytes.
+
+    items_json is an already-encoded JSON array (from a module-level
+    TypeAdapter or app.schemas.structs); the small envelope is spliced
+    around it without building a wrapper model.
+    """
+    body = b'{"' + field.encode("utf-8") + b'":' + items_json
+    if meta:
+        body += b"," + orjson.dumps(meta, default=_default)[1:]
+    else:
+        body += b"}"
+    return body
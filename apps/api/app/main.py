@@ -15,6 +15,7 @@ from slowapi.errors import RateLimitExceeded
 from app.api.v1.router import api_router
 from app.core.config import settings, limit_if_enabled
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.ai.skill_kernels import warm_up as warm_up_skill_kernels
 from app.middleware.security import SecurityHeadersMiddleware, RequestLoggingMiddleware
 from app.core.errors import (
     APIError,
@@ -45,6 +46,9 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    # Compile numeric kernels before the first request needs them
+    warm_up_skill_kernels()
+    
     start_scheduler()
     yield
     # Shutdown
@@ -2,7 +2,7 @@
 from app.models.user import User, Session, AuditLog
 from app.models.resume import Resume, ResumeScorecard, ResumeShareLink
 from app.models.preferences import UserPreferences
-from app.models.job import JobSource, JobPosting
+from app.models.job import JobSource, JobPosting, JobPostingRaw
 from app.models.match import JobMatch
 from app.models.apply import ApplyKit, JobActivity, ActivityStatus
 from app.models.notification import NotificationSettings, NotificationLog, NotificationType
@@ -10,19 +10,21 @@ from app.models.ai_resume import AIResumeVersion, ResumeOptimizationLog, ResumeV
 from app.models.ai_interview import InterviewKit, InterviewQuestion, STARExample, InterviewSession, CompanyInsight
 from app.models.ai_skills import (
     SkillGapAnalysis, SkillGap, LearningResource, 
-    SkillProgressTracking, SkillMarketData, LearningPath
+    SkillProgressTracking, SkillProgressFeedback, SkillMarketData, LearningPath,
+    SkillCategory, SkillImportance, DifficultyLevel, ResourceType
 )
 
 __all__ = [
     "User", "Session", "AuditLog", 
     "Resume", "ResumeScorecard", "ResumeShareLink", 
     "UserPreferences",
-    "JobSource", "JobPosting",
+    "JobSource", "JobPosting", "JobPostingRaw",
     "JobMatch",
     "ApplyKit", "JobActivity", "ActivityStatus",
     "NotificationSettings", "NotificationLog", "NotificationType",
     "AIResumeVersion", "ResumeOptimizationLog", "ResumeVersionComparison",
     "InterviewKit", "InterviewQuestion", "STARExample", "InterviewSession", "CompanyInsight",
     "SkillGapAnalysis", "SkillGap", "LearningResource", 
-    "SkillProgressTracking", "SkillMarketData", "LearningPath"
+    "SkillProgressTracking", "SkillProgressFeedback", "SkillMarketData", "LearningPath",
+    "SkillCategory", "SkillImportance", "DifficultyLevel", "ResourceType"
 ]
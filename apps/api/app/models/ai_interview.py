@@ -2,10 +2,12 @@
 AI Interview Preparation models.
 Handles interview questions, coaching, and preparation kits.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Float
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Float, Index
+import sqlalchemy as sa
 from sqlalchemy.sql import func
 import uuid
-from app.core.database import Base
+from app.core.database import Base, JSONDocument
+from app.core.ids import uuid7
 
 
 class InterviewKit(Base):
@@ -13,16 +15,16 @@ class InterviewKit(Base):
     
     __tablename__ = "interview_kits"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=uuid7)
     user_id = Column(String(36), nullable=False, index=True)
     job_id = Column(String(36), nullable=False, index=True)
     
-    # Kit content (JSON as TEXT for SQLite)
-    questions = Column(Text, nullable=False)  # JSON array of interview questions
-    talking_points = Column(Text, nullable=False)  # JSON array of personalized talking points
-    company_insights = Column(Text, nullable=True)  # JSON with company research
-    star_examples = Column(Text, nullable=True)  # JSON array of STAR method examples
-    preparation_checklist = Column(Text, nullable=True)  # JSON array of preparation items
+    # Kit content
+    questions = Column(JSONDocument, nullable=False)  # Array of interview questions
+    talking_points = Column(JSONDocument, nullable=False)  # Array of personalized talking points
+    company_insights = Column(JSONDocument, nullable=True)  # Company research
+    star_examples = Column(JSONDocument, nullable=True)  # Array of STAR method examples
+    preparation_checklist = Column(JSONDocument, nullable=True)  # Array of preparation items
     
     # Metadata
     difficulty_level = Column(String(20), default="intermediate")  # beginner, intermediate, advanced
@@ -31,6 +33,18 @@ class InterviewKit(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Kit lookups only ever want the newest active kit for a user and job
+    __table_args__ = (
+        Index(
+            "ix_interview_kits_active",
+            "user_id",
+            "job_id",
+            "created_at",
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<InterviewKit {self.id} for job {self.job_id}>"
 
@@ -40,7 +54,7 @@ class InterviewQuestion(Base):
     
     __tablename__ = "interview_questions"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=uuid7)
     kit_id = Column(String(36), nullable=False, index=True)
     user_id = Column(String(36), nullable=False, index=True)
     
@@ -50,9 +64,9 @@ class InterviewQuestion(Base):
     difficulty = Column(String(20), default="medium")  # easy, medium, hard
     
     # AI-generated content
-    suggested_answer = Column(Text, nullable=True)  # AI-suggested answer approach
-    key_points = Column(Text, nullable=True)  # JSON array of key points to cover
-    follow_up_questions = Column(Text, nullable=True)  # JSON array of potential follow-ups
+    suggested_answer = Column(JSONDocument, nullable=True)  # AI-suggested answer approach
+    key_points = Column(JSONDocument, nullable=True)  # Array of key points to cover
+    follow_up_questions = Column(JSONDocument, nullable=True)  # Array of potential follow-ups
     
     # User interaction
     user_answer = Column(Text, nullable=True)  # User's practice answer
@@ -74,7 +88,7 @@ class STARExample(Base):
     
     __tablename__ = "star_examples"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=uuid7)
     kit_id = Column(String(36), nullable=False, index=True)
     user_id = Column(String(36), nullable=False, index=True)
     
@@ -86,7 +100,7 @@ class STARExample(Base):
     
     # Metadata
     competency = Column(String(100), nullable=False)  # Leadership, Problem Solving, etc.
-    source_experience = Column(Text, nullable=True)  # JSON with source experience data
+    source_experience = Column(JSONDocument, nullable=True)  # Source experience data
     relevance_score = Column(Float, nullable=False)  # Relevance to job (0-100)
     
     # Usage tracking
@@ -136,8 +150,8 @@ class CompanyInsight(Base):
     
     __tablename__ = "company_insights"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    company_name = Column(String(200), nullable=False, index=True)
+    id = Column(String(36), primary_key=True, default=uuid7)
+    company_name = Column(String(200), nullable=False, unique=True, index=True)
     
     # Company information (JSON as TEXT for SQLite)
     culture_info = Column(Text, nullable=True)  # JSON with culture insights
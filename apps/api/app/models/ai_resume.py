@@ -2,10 +2,11 @@
 AI Resume Versioning models.
 Handles job-specific resume versions and optimization.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Float
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Float, Index
+import sqlalchemy as sa
 from sqlalchemy.sql import func
 import uuid
-from app.core.database import Base
+from app.core.database import Base, JSONDocument
 
 
 class AIResumeVersion(Base):
@@ -18,17 +19,18 @@ class AIResumeVersion(Base):
     job_id = Column(String(36), nullable=False, index=True)
     base_resume_id = Column(String(36), nullable=False, index=True)
     
-    # Optimized content (JSON as TEXT for SQLite)
-    optimized_content = Column(Text, nullable=False)  # JSON with optimized resume sections
+    # Optimized content
+    optimized_content = Column(JSONDocument, nullable=False)  # Optimized resume sections
     changes_explanation = Column(Text, nullable=False)  # Explanation of changes made
     
     # Scoring and metrics
     ats_score = Column(Float, nullable=False)  # ATS compatibility score (0-100)
-    keyword_density = Column(Text, nullable=True)  # JSON with keyword analysis
+    keyword_density = Column(JSONDocument, nullable=True)  # Keyword analysis
     match_score = Column(Float, nullable=False)  # Job match score (0-100)
+    content_fingerprints = Column(JSONDocument, nullable=True)  # Per-field content digests
     
-    # Generated formats (JSON as TEXT for SQLite)
-    formats = Column(Text, nullable=True)  # JSON with URLs to different formats (PDF, DOCX, TXT)
+    # Generated formats
+    formats = Column(JSONDocument, nullable=True)  # URLs to different formats (PDF, DOCX, TXT)
     
     # Metadata
     version_number = Column(Integer, default=1)  # Version number for this job
@@ -36,6 +38,25 @@ class AIResumeVersion(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Version lookups only ever want the newest active version for a user and job
+    __table_args__ = (
+        Index(
+            "ix_ai_resume_versions_active",
+            "user_id",
+            "job_id",
+            sa.text("created_at DESC"),
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active"),
+        ),
+        # Containment search over optimized content (e.g. versions with a skill)
+        Index(
+            "ix_ai_resume_versions_content_gin",
+            "optimized_content",
+            postgresql_using="gin",
+            postgresql_ops={"optimized_content": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+    
     def __repr__(self):
         return f"<AIResumeVersion {self.id} for job {self.job_id}>"
 
@@ -53,9 +74,9 @@ class ResumeOptimizationLog(Base):
     operation_type = Column(String(50), nullable=False)  # generate, regenerate, update
     processing_time_ms = Column(Integer, nullable=True)  # Processing time in milliseconds
     
-    # AI processing details (JSON as TEXT for SQLite)
-    ai_parameters = Column(Text, nullable=True)  # JSON with AI processing parameters
-    optimization_focus = Column(Text, nullable=True)  # JSON array of optimization areas
+    # AI processing details
+    ai_parameters = Column(JSONDocument, nullable=True)  # AI processing parameters
+    optimization_focus = Column(JSONDocument, nullable=True)  # Array of optimization areas
     
     # Results
     success = Column(Boolean, nullable=False)
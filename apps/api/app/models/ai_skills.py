@@ -2,10 +2,130 @@
 AI Skill Gap Analysis models.
 Handles skill analysis, gap identification, and learning recommendations.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Float
+from sqlalchemy import (
+    Column, String, DateTime, Integer, SmallInteger, Text, Boolean, Float, ForeignKey, Index, event
+)
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
-from app.core.database import Base
+from app.core.database import Base, JSONDocument
+
+
+class Lookup:
+    """Fixed id <-> name mapping for a small lookup table."""
+    
+    def __init__(self, label: str, *names: str):
+        self.label = label
+        self.names = dict(enumerate(names, start=1))
+        self.ids = {name: lookup_id for lookup_id, name in self.names.items()}
+    
+    def id_for(self, name: str) -> int:
+        """Id of a name, or ValueError naming the allowed values."""
+        try:
+            return self.ids[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown {self.label} {name!r}; expected one of {', '.join(self.ids)}"
+            ) from None
+    
+    def name_property(self, id_attr: str) -> hybrid_property:
+        """
+        Expose an id column by name, so rows are read and written without a join.
+        
+        In queries the name compares against the id column, e.g.
+        SkillGap.importance == "critical" filters on importance_id = 1.
+        """
+        def fget(obj):
+            lookup_id = getattr(obj, id_attr)
+            return self.names[lookup_id] if lookup_id is not None else None
+        
+        def fset(obj, name):
+            setattr(obj, id_attr, self.id_for(name) if name is not None else None)
+        
+        def comparator(cls):
+            return _LookupComparator(self, getattr(cls, id_attr))
+        
+        return hybrid_property(fget, fset).comparator(comparator)
+
+
+class _LookupComparator(Comparator):
+    """Translates lookup names to ids on the SQL side of a name property."""
+    
+    def __init__(self, lookup: Lookup, id_column):
+        super().__init__(id_column)
+        self.lookup = lookup
+    
+    def _to_id(self, value):
+        if isinstance(value, str):
+            return self.lookup.id_for(value)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return [self._to_id(item) for item in value]
+        return value
+    
+    def operate(self, op, *other, **kwargs):
+        return op(self.expression, *(self._to_id(value) for value in other), **kwargs)
+
+
+# Ids are fixed here and seeded into the lookup tables, so the maps never need a query
+SKILL_CATEGORIES = Lookup("skill category", "technical", "soft", "certification", "domain")
+IMPORTANCE_LEVELS = Lookup("importance", "critical", "important", "nice-to-have")
+DIFFICULTY_LEVELS = Lookup("difficulty", "beginner", "intermediate", "advanced")
+RESOURCE_TYPES = Lookup("resource type", "course", "certification", "book", "tutorial", "practice")
+
+
+class SkillCategory(Base):
+    """Skill category lookup (technical, soft, certification, domain)."""
+    
+    __tablename__ = "skill_categories"
+    
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String(50), nullable=False, unique=True)
+
+
+class SkillImportance(Base):
+    """Skill importance lookup (critical, important, nice-to-have)."""
+    
+    __tablename__ = "skill_importance_levels"
+    
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String(20), nullable=False, unique=True)
+
+
+class DifficultyLevel(Base):
+    """Difficulty lookup (beginner, intermediate, advanced)."""
+    
+    __tablename__ = "difficulty_levels"
+    
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String(20), nullable=False, unique=True)
+
+
+class ResourceType(Base):
+    """Learning resource type lookup (course, certification, book, tutorial, practice)."""
+    
+    __tablename__ = "resource_types"
+    
+    id = Column(SmallInteger, primary_key=True, autoincrement=False)
+    name = Column(String(50), nullable=False, unique=True)
+
+
+def _seed_lookup(lookup: Lookup):
+    def seed(target, connection, **kw):
+        connection.execute(
+            target.insert(),
+            [{"id": lookup_id, "name": name} for lookup_id, name in lookup.names.items()]
+        )
+    return seed
+
+
+for _model, _lookup in (
+    (SkillCategory, SKILL_CATEGORIES),
+    (SkillImportance, IMPORTANCE_LEVELS),
+    (DifficultyLevel, DIFFICULTY_LEVELS),
+    (ResourceType, RESOURCE_TYPES),
+):
+    event.listen(_model.__table__, "after_create", _seed_lookup(_lookup))
 
 
 class SkillGapAnalysis(Base):
@@ -17,12 +137,13 @@ class SkillGapAnalysis(Base):
     user_id = Column(String(36), nullable=False, index=True)
     job_id = Column(String(36), nullable=False, index=True)
     
-    # Analysis results (JSON as TEXT for SQLite)
-    missing_skills = Column(Text, nullable=False)  # JSON array of SkillGap objects
-    learning_recommendations = Column(Text, nullable=False)  # JSON array of LearningResource objects
-    estimated_timeline = Column(Text, nullable=False)  # JSON dict of skill -> hours
-    priority_score = Column(Text, nullable=False)  # JSON dict of skill -> priority score
-    market_demand = Column(Text, nullable=True)  # JSON dict of skill -> market demand score
+    # Analysis results
+    missing_skills = Column(JSONDocument, nullable=False)  # Array of SkillGap objects
+    learning_recommendations = Column(JSONDocument, nullable=False)  # Array of LearningResource objects
+    estimated_timeline = Column(JSONDocument, nullable=False)  # Dict of skill -> hours
+    priority_score = Column(JSONDocument, nullable=False)  # Dict of skill -> priority score
+    market_demand = Column(JSONDocument, nullable=True)  # Dict of skill -> market demand score
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the resume and job text
     
     # Overall metrics
     total_missing_skills = Column(Integer, nullable=False)
@@ -51,8 +172,8 @@ class SkillGap(Base):
     
     # Skill details
     skill_name = Column(String(100), nullable=False, index=True)
-    skill_category = Column(String(50), nullable=False)  # technical, soft, certification, etc.
-    importance = Column(String(20), nullable=False)  # critical, important, nice-to-have
+    skill_category_id = Column(SmallInteger, ForeignKey("skill_categories.id"), nullable=False)
+    importance_id = Column(SmallInteger, ForeignKey("skill_importance_levels.id"), nullable=False)
     
     # Gap analysis
     current_level = Column(Integer, default=0)  # 0-5 scale
@@ -67,7 +188,10 @@ class SkillGap(Base):
     # Learning recommendations
     recommended_resources = Column(Text, nullable=True)  # JSON array of learning resources
     estimated_learning_hours = Column(Integer, nullable=False)
-    difficulty_level = Column(String(20), default="intermediate")  # beginner, intermediate, advanced
+    difficulty_level_id = Column(
+        SmallInteger, ForeignKey("difficulty_levels.id"),
+        default=DIFFICULTY_LEVELS.ids["intermediate"]
+    )
     
     # Progress tracking
     learning_progress = Column(Float, default=0.0)  # 0-100 completion percentage
@@ -76,6 +200,10 @@ class SkillGap(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    skill_category = SKILL_CATEGORIES.name_property("skill_category_id")
+    importance = IMPORTANCE_LEVELS.name_property("importance_id")
+    difficulty_level = DIFFICULTY_LEVELS.name_property("difficulty_level_id")
+    
     def __repr__(self):
         return f"<SkillGap {self.skill_name} ({self.importance}) for analysis {self.analysis_id}>"
 
@@ -92,12 +220,12 @@ class LearningResource(Base):
     # Resource details
     title = Column(String(200), nullable=False)
     provider = Column(String(100), nullable=False)
-    resource_type = Column(String(50), nullable=False)  # course, certification, book, tutorial, practice
+    resource_type_id = Column(SmallInteger, ForeignKey("resource_types.id"), nullable=False)
     url = Column(String(500), nullable=True)
     
     # Resource metrics
     estimated_hours = Column(Integer, nullable=False)
-    difficulty = Column(String(20), nullable=False)  # beginner, intermediate, advanced
+    difficulty_id = Column(SmallInteger, ForeignKey("difficulty_levels.id"), nullable=False)
     cost = Column(Float, nullable=True)  # Cost in USD, null for free
     rating = Column(Float, nullable=True)  # 0-5 rating
     
@@ -116,6 +244,9 @@ class LearningResource(Base):
     last_updated = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    resource_type = RESOURCE_TYPES.name_property("resource_type_id")
+    difficulty = DIFFICULTY_LEVELS.name_property("difficulty_id")
+    
     def __repr__(self):
         return f"<LearningResource {self.title} for skill gap {self.skill_gap_id}>"
 
@@ -124,6 +255,10 @@ class SkillProgressTracking(Base):
     """Track user's skill development progress over time."""
     
     __tablename__ = "skill_progress_tracking"
+    # One record per user and skill, so progress updates can upsert on it
+    __table_args__ = (
+        Index("ix_skill_progress_tracking_user_skill", "user_id", "skill_name", unique=True),
+    )
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), nullable=False, index=True)
@@ -151,24 +286,48 @@ class SkillProgressTracking(Base):
     
     # Progress notes and feedback
     progress_notes = Column(Text, nullable=True)  # User's notes on learning journey
-    ai_feedback = Column(Text, nullable=True)  # AI-generated feedback and suggestions
     
     # Metadata
     last_updated = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # AI feedback lives in a sidecar table to keep progress rows compact
+    feedback = relationship(
+        "SkillProgressFeedback",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    
     def __repr__(self):
         return f"<SkillProgressTracking {self.skill_name} for user {self.user_id}>"
 
 
+class SkillProgressFeedback(Base):
+    """AI-generated feedback for a progress record (rarely read)."""
+    
+    __tablename__ = "skill_progress_feedback"
+    
+    progress_id = Column(
+        String(36), ForeignKey("skill_progress_tracking.id", ondelete="CASCADE"), primary_key=True
+    )
+    ai_feedback = Column(Text, nullable=True)  # AI-generated feedback and suggestions
+    
+    def __repr__(self):
+        return f"<SkillProgressFeedback progress={self.progress_id}>"
+
+
 class SkillMarketData(Base):
     """Market data and trends for skills."""
     
     __tablename__ = "skill_market_data"
+    # Refreshed nightly, read on every analysis: pack pages full
+    __table_args__ = {"postgresql_with": {"fillfactor": "100"}}
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     skill_name = Column(String(100), nullable=False, unique=True, index=True)
-    skill_category = Column(String(50), nullable=False)
+    skill_category_id = Column(SmallInteger, ForeignKey("skill_categories.id"), nullable=False)
     
     # Market demand metrics
     demand_score = Column(Float, nullable=False)  # Overall market demand (0-100)
@@ -199,6 +358,8 @@ class SkillMarketData(Base):
     last_updated = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    skill_category = SKILL_CATEGORIES.name_property("skill_category_id")
+    
     def __repr__(self):
         return f"<SkillMarketData {self.skill_name} (demand: {self.demand_score})>"
 
@@ -217,15 +378,15 @@ class LearningPath(Base):
     description = Column(Text, nullable=True)
     target_role = Column(String(100), nullable=True)  # Target job role
     
-    # Path structure (JSON as TEXT for SQLite)
-    learning_steps = Column(Text, nullable=False)  # JSON array of ordered learning steps
-    milestones = Column(Text, nullable=False)  # JSON array of milestone checkpoints
-    skill_progression = Column(Text, nullable=False)  # JSON dict of skill -> target levels
+    # Path structure
+    learning_steps = Column(JSONDocument, nullable=False)  # Array of ordered learning steps
+    milestones = Column(JSONDocument, nullable=False)  # Array of milestone checkpoints
+    skill_progression = Column(JSONDocument, nullable=False)  # Dict of skill -> target levels
     
     # Timeline and effort
     estimated_total_hours = Column(Integer, nullable=False)
     estimated_weeks = Column(Integer, nullable=False)
-    difficulty_level = Column(String(20), nullable=False)  # beginner, intermediate, advanced
+    difficulty_level_id = Column(SmallInteger, ForeignKey("difficulty_levels.id"), nullable=False)
     
     # Progress tracking
     current_step = Column(Integer, default=0)  # Current step index
@@ -233,7 +394,7 @@ class LearningPath(Base):
     hours_completed = Column(Float, default=0.0)  # Hours completed so far
     
     # Path optimization
-    priority_order = Column(Text, nullable=False)  # JSON array of skill priority order
+    priority_order = Column(JSONDocument, nullable=False)  # Array of skill priority order
     market_alignment_score = Column(Float, nullable=False)  # How well aligned with market demand
     personalization_score = Column(Float, nullable=False)  # How personalized to user's background
     
@@ -244,5 +405,7 @@ class LearningPath(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    difficulty_level = DIFFICULTY_LEVELS.name_property("difficulty_level_id")
+    
     def __repr__(self):
         return f"<LearningPath {self.path_name} for user {self.user_id}>"
\ No newline at end of file
@@ -2,7 +2,7 @@
 Application and tracking database models.
 Includes ApplyKit and JobActivity for application management.
 """
-from sqlalchemy import Column, String, DateTime, Text, Enum as SQLEnum, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Text, Enum as SQLEnum, Integer, Boolean, SmallInteger, BigInteger, Identity, Index
 import sqlalchemy as sa
 from sqlalchemy.sql import func
 import uuid
@@ -36,14 +36,25 @@ class ApplyKit(Base):
     qa_json = Column(Text, nullable=True)  # JSON: {question: answer} for common interview questions
     
     # Version tracking (Task 2.1)
-    version = Column(sa.Integer, nullable=False, default=1, index=True)
-    is_active = Column(sa.Boolean, nullable=False, default=True, index=True)
+    version = Column(sa.Integer, nullable=False, default=1)
+    is_active = Column(sa.Boolean, nullable=False, default=True)
     parent_version_id = Column(String(36), nullable=True)  # Reference to previous version
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Lookups only ever want the active version, so index just those rows
+    __table_args__ = (
+        Index(
+            "ix_apply_kits_active",
+            "user_id",
+            "job_id",
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<ApplyKit user={self.user_id} job={self.job_id} v{self.version}>"
 
@@ -53,7 +64,14 @@ class JobActivity(Base):
     
     __tablename__ = "job_activities"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Append-only: a monotonic internal key keeps inserts on the rightmost
+    # btree leaf; the UUID stays the identifier exposed through the API
+    internal_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
+    )
+    id = Column(String(36), unique=True, index=True, nullable=False, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), nullable=False, index=True)
     job_id = Column(String(36), nullable=False, index=True)
     
@@ -62,15 +80,28 @@ class JobActivity(Base):
         SQLEnum(ActivityStatus),
         nullable=False,
         default=ActivityStatus.INTERESTED,
-        index=True
     )
     
     # Notes
     notes = Column(Text, nullable=True)
     
+    # Latest JobMatch score for this job, kept in sync on match writes so
+    # tracker/dashboard queries don't need to join job_matches
+    match_score_cached = Column(SmallInteger, nullable=True)
+    match_updated_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        Index(
+            "ix_job_activities_user_status_score",
+            "user_id",
+            "status",
+            match_score_cached.desc(),
+        ),
+    )
+    
     def __repr__(self):
         return f"<JobActivity user={self.user_id} job={self.job_id} status={self.status}>"
@@ -1,8 +1,9 @@
 """
 Job-related database models.
-Includes JobSource and JobPosting.
+Includes JobSource, JobPosting and the JobPostingRaw sidecar.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, ForeignKey
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 from app.core.database import Base
@@ -12,6 +13,8 @@ class JobSource(Base):
     """Job source configuration (RSS feeds, APIs, company pages)."""
     
     __tablename__ = "job_sources"
+    # Rarely written: pack pages full
+    __table_args__ = {"postgresql_with": {"fillfactor": "100"}}
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
@@ -66,9 +69,29 @@ class JobPosting(Base):
     expires_at = Column(DateTime(timezone=True), nullable=True)
     
     # Metadata
-    raw_data = Column(Text, nullable=True)  # JSON string of original data
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    # Original payload lives in a sidecar table to keep job rows compact
+    raw = relationship(
+        "JobPostingRaw",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    
     def __repr__(self):
         return f"<JobPosting {self.title} at {self.company}>"
+
+
+class JobPostingRaw(Base):
+    """Original source payload for a job posting (rarely read)."""
+    
+    __tablename__ = "job_postings_raw"
+    
+    job_id = Column(String(36), ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True)
+    raw_data = Column(Text, nullable=True)  # JSON string of original data
+    
+    def __repr__(self):
+        return f"<JobPostingRaw job={self.job_id}>"
@@ -2,18 +2,33 @@
 Job matching database models.
 Includes JobMatch for storing match scores and explanations.
 """
-from sqlalchemy import Column, String, DateTime, Float, Text
+from sqlalchemy import Column, String, DateTime, Float, Text, BigInteger, Integer, Identity
 from sqlalchemy.sql import func
 import uuid
 from app.core.database import Base
 
+# Namespace for deterministic match ids
+MATCH_NAMESPACE = uuid.UUID("6f2b7c1e-3d4a-5b8c-9e0f-a1b2c3d4e5f6")
+
+
+def match_id(user_id: str, job_id: str, resume_id: str) -> str:
+    """Deterministic JobMatch id: one logical match per (user, job, resume)."""
+    return str(uuid.uuid5(MATCH_NAMESPACE, f"{user_id}:{job_id}:{resume_id}"))
+
 
 class JobMatch(Base):
     """Job match score and explanation for a user."""
     
     __tablename__ = "job_matches"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # A monotonic internal key keeps inserts on the rightmost btree leaf;
+    # the UUID stays the identifier exposed through the API
+    internal_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
+    )
+    id = Column(String(36), unique=True, index=True, nullable=False)  # See match_id(); upsert target
     user_id = Column(String(36), nullable=False, index=True)
     job_id = Column(String(36), nullable=False, index=True)
     resume_id = Column(String(36), nullable=False, index=True)
@@ -31,7 +46,8 @@ class JobMatch(Base):
     missing_skills_json = Column(Text, nullable=True)  # JSON: ["skill1", "skill2", ...]
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # When the match first appeared; re-scoring only moves updated_at
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
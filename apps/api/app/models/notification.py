@@ -2,9 +2,10 @@
 Notification database models.
 Includes NotificationSettings and NotificationLog for email management.
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum as SQLEnum, BigInteger, Integer, Identity, SmallInteger, Time
 from sqlalchemy.sql import func
 import uuid
+from datetime import time
 from enum import Enum
 from app.core.database import Base
 
@@ -22,6 +23,8 @@ class NotificationSettings(Base):
     """User notification preferences."""
     
     __tablename__ = "notification_settings"
+    # Read-mostly: pack pages full
+    __table_args__ = {"postgresql_with": {"fillfactor": "100"}}
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), nullable=False, unique=True, index=True)
@@ -35,8 +38,8 @@ class NotificationSettings(Base):
     offer_notification_enabled = Column(Boolean, default=True, nullable=False)
     
     # Digest settings
-    daily_digest_time = Column(String(5), default="09:00", nullable=False)  # HH:MM format
-    high_match_threshold = Column(String(3), default="85", nullable=False)  # Percentage
+    daily_digest_time = Column(Time, default=time(9, 0), nullable=False)
+    high_match_threshold = Column(SmallInteger, default=85, nullable=False)  # Percentage
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -51,7 +54,14 @@ class NotificationLog(Base):
     
     __tablename__ = "notification_logs"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Append-only: a monotonic internal key keeps inserts on the rightmost
+    # btree leaf; the UUID stays the identifier exposed through the API
+    internal_id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
+    )
+    id = Column(String(36), unique=True, index=True, nullable=False, default=lambda: str(uuid.uuid4()))
     user_id = Column(String(36), nullable=False, index=True)
     
     # Notification details
@@ -76,7 +86,8 @@ class NotificationLog(Base):
     related_match_id = Column(String(36), nullable=True)
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    # Partition key on Postgres (range-partitioned by month, see app/services/partitions.py)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
     
     def __repr__(self):
         return f"<NotificationLog user={self.user_id} type={self.notification_type}>"
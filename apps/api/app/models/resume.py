@@ -2,7 +2,8 @@
 Resume-related database models.
 Includes Resume, ResumeScorecard, and ResumeShareLink.
 """
-from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Text, Boolean, Index
+import sqlalchemy as sa
 from sqlalchemy.sql import func
 import uuid
 import json
@@ -26,6 +27,17 @@ class Resume(Base):
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     parsed_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Latest parsed resume per user is a single index probe
+    __table_args__ = (
+        Index(
+            "ix_resumes_user_parsed_uploaded",
+            "user_id",
+            "uploaded_at",
+            postgresql_where=sa.text("is_parsed"),
+            sqlite_where=sa.text("is_parsed"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<Resume {self.filename} for user {self.user_id}>"
 
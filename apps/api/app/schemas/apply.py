@@ -1,10 +1,12 @@
 """
 Application and tracking Pydantic schemas.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from enum import Enum
+import json
+from app.schemas.base import FastFromORM
 
 
 class ActivityStatusEnum(str, Enum):
@@ -18,6 +20,13 @@ class ActivityStatusEnum(str, Enum):
     DECLINED = "declined"
 
 
+# Request/response fields validate against a Literal (plain string match in
+# pydantic-core); convert with ActivityStatusEnum(status) where needed
+ActivityStatusLiteral = Literal[
+    "interested", "applied", "rejected", "interview", "offer", "accepted", "declined"
+]
+
+
 # Apply Kit Schemas
 class ApplyKitBase(BaseModel):
     """Base schema for apply kit."""
@@ -26,9 +35,8 @@ class ApplyKitBase(BaseModel):
     qa_json: Optional[Dict[str, str]] = Field(None, description="Q&A for interview prep")
 
 
-class ApplyKitCreate(ApplyKitBase):
-    """Schema for creating apply kit."""
-    pass
+# Create schemas add no fields; alias them so only one validator is built
+ApplyKitCreate = ApplyKitBase
 
 
 class ApplyKitUpdate(BaseModel):
@@ -38,16 +46,25 @@ class ApplyKitUpdate(BaseModel):
     qa_json: Optional[Dict[str, str]] = None
 
 
-class ApplyKitResponse(ApplyKitBase):
+class ApplyKitResponse(FastFromORM, ApplyKitBase):
     """Schema for apply kit response."""
+    # Nullable columns are trusted DB values; skip re-validating them
+    cover_letter: SkipValidation[Optional[str]] = None
+    tailored_bullets_json: SkipValidation[Optional[List[str]]] = None
+    qa_json: SkipValidation[Optional[Dict[str, str]]] = None
     id: str
     user_id: str
     job_id: str
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build from an ApplyKit row, decoding its JSON text columns."""
+        kit = super().from_orm_fast(obj)
+        kit.tailored_bullets_json = json.loads(obj.tailored_bullets_json) if obj.tailored_bullets_json else None
+        kit.qa_json = json.loads(obj.qa_json) if obj.qa_json else None
+        return kit
 
 
 class GenerateApplyKitRequest(BaseModel):
@@ -68,31 +85,35 @@ class GenerateApplyKitResponse(BaseModel):
 # Job Activity Schemas
 class JobActivityBase(BaseModel):
     """Base schema for job activity."""
-    status: ActivityStatusEnum = Field(..., description="Activity status")
+    status: ActivityStatusLiteral = Field(..., description="Activity status")
     notes: Optional[str] = Field(None, description="Additional notes")
 
 
-class JobActivityCreate(JobActivityBase):
-    """Schema for creating job activity."""
-    pass
+JobActivityCreate = JobActivityBase
 
 
 class JobActivityUpdate(BaseModel):
     """Schema for updating job activity."""
-    status: Optional[ActivityStatusEnum] = None
+    status: Optional[ActivityStatusLiteral] = None
     notes: Optional[str] = None
 
 
-class JobActivityResponse(JobActivityBase):
+class JobActivityResponse(FastFromORM, JobActivityBase):
     """Schema for job activity response."""
     id: str
     user_id: str
     job_id: str
+    match_score_cached: Optional[int] = None
+    match_updated_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build from a JobActivity row, mapping the model enum to its value."""
+        activity = super().from_orm_fast(obj)
+        activity.status = obj.status.value
+        return activity
 
 
 class JobActivityListResponse(BaseModel):
@@ -104,9 +125,12 @@ class JobActivityListResponse(BaseModel):
     total_pages: int
 
 
+ACTIVITY_LIST_ADAPTER = TypeAdapter(List[JobActivityResponse])
+
+
 class SetActivityStatusRequest(BaseModel):
     """Request to set activity status."""
-    status: ActivityStatusEnum = Field(..., description="New status")
+    status: ActivityStatusLiteral = Field(..., description="New status")
     notes: Optional[str] = Field(None, description="Optional notes")
 
 
@@ -114,7 +138,7 @@ class SetActivityStatusResponse(BaseModel):
     """Response after setting activity status."""
     activity_id: str
     job_id: str
-    status: ActivityStatusEnum
+    status: ActivityStatusLiteral
     message: str
 
 
@@ -138,5 +162,4 @@ class JobDetailWithApplyKit(BaseModel):
     # Activity
     activity: Optional[JobActivityResponse] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(defer_build=True, from_attributes=True, extra='ignore')
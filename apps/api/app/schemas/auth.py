@@ -2,9 +2,27 @@
 Pydantic schemas for authentication endpoints.
 Handles request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import Optional
 from datetime import datetime
+import re
+
+# Digit, uppercase and lowercase in one scan (ASCII fast path)
+_PW_RE = re.compile(r'(?=.*\d)(?=.*[A-Z])(?=.*[a-z])', re.DOTALL)
+
+
+def _validate_password_strength(v: str) -> str:
+    """Require at least one digit, uppercase and lowercase letter."""
+    if _PW_RE.match(v):
+        return v
+    # Slow path: pinpoint the missing class (and accept non-ASCII letters)
+    if not any(char.isdigit() for char in v):
+        raise ValueError('Password must contain at least one digit')
+    if not any(char.isupper() for char in v):
+        raise ValueError('Password must contain at least one uppercase letter')
+    if not any(char.islower() for char in v):
+        raise ValueError('Password must contain at least one lowercase letter')
+    return v
 
 
 class UserCreate(BaseModel):
@@ -12,16 +30,11 @@ class UserCreate(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=100)
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strength(cls, v):
         """Validate password strength."""
-        if not any(char.isdigit() for char in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(char.isupper() for char in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.islower() for char in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        return v
+        return _validate_password_strength(v)
 
 
 class UserLogin(BaseModel):
@@ -56,8 +69,7 @@ class UserResponse(BaseModel):
     is_active: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PasswordChange(BaseModel):
@@ -65,16 +77,11 @@ class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8, max_length=100)
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def password_strength(cls, v):
         """Validate password strength."""
-        if not any(char.isdigit() for char in v):
-            raise ValueError('Password must contain at least one digit')
-        if not any(char.isupper() for char in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.islower() for char in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        return v
+        return _validate_password_strength(v)
 
 
 class LogoutResponse(BaseModel):
@@ -0,0 +1,18 @@
+"""
+Shared schema helpers.
+"""
+from typing import Any
+
+
+class FastFromORM:
+    """
+    Build response schemas from trusted ORM rows without validation.
+
+    ORM-loaded values already have the column types the schema declares,
+    so from_orm_fast copies them with model_construct instead of running
+    the from_attributes validation pass.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
@@ -1,10 +1,18 @@
 """
 Job-related Pydantic schemas.
 """
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter, field_validator
 from typing import Optional, List
 from datetime import datetime
 import html
+import re
+from app.schemas.base import FastFromORM
+
+# Characters html.escape would rewrite; most names contain none of them
+_UNSAFE_HTML = re.compile(r'[<>&"\']')
+
+_SOURCE_TYPES = ('rss', 'api', 'html')
+_ALLOWED_SOURCE_TYPES = frozenset(_SOURCE_TYPES)
 
 
 # Job Source Schemas
@@ -20,7 +28,7 @@ class JobSourceBase(BaseModel):
     @classmethod
     def validate_name(cls, v):
         """Validate and sanitize name field to prevent XSS."""
-        if v:
+        if v and _UNSAFE_HTML.search(v):
             # HTML escape to prevent XSS attacks
             return html.escape(v)
         return v
@@ -29,15 +37,13 @@ class JobSourceBase(BaseModel):
     @classmethod
     def validate_source_type(cls, v):
         """Validate source type."""
-        allowed = ['rss', 'api', 'html']
-        if v not in allowed:
-            raise ValueError(f"source_type must be one of: {', '.join(allowed)}")
+        if v not in _ALLOWED_SOURCE_TYPES:
+            raise ValueError(f"source_type must be one of: {', '.join(_SOURCE_TYPES)}")
         return v
 
 
-class JobSourceCreate(JobSourceBase):
-    """Schema for creating job source."""
-    pass
+# Adds no fields; alias it so only one validator is built
+JobSourceCreate = JobSourceBase
 
 
 class JobSourceUpdate(BaseModel):
@@ -57,8 +63,7 @@ class JobSourceResponse(JobSourceBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Job Posting Schemas
@@ -77,16 +82,22 @@ class JobPostingBase(BaseModel):
     posted_date: Optional[datetime] = None
 
 
-class JobPostingResponse(JobPostingBase):
+class JobPostingResponse(FastFromORM, JobPostingBase):
     """Schema for job posting response."""
+    # Nullable columns are trusted DB values; skip re-validating them
+    location: SkipValidation[Optional[str]] = None
+    description: SkipValidation[Optional[str]] = None
+    requirements: SkipValidation[Optional[str]] = None
+    salary_min: SkipValidation[Optional[int]] = None
+    salary_max: SkipValidation[Optional[int]] = None
+    salary_currency: SkipValidation[Optional[str]] = None
+    work_type: SkipValidation[Optional[str]] = None
+    posted_date: SkipValidation[Optional[datetime]] = None
     id: str
     source_id: str
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class JobPostingListResponse(BaseModel):
@@ -98,17 +109,20 @@ class JobPostingListResponse(BaseModel):
     total_pages: int
 
 
+JOB_LIST_ADAPTER = TypeAdapter(List[JobPostingResponse])
+
+
 class JobFilters(BaseModel):
-    """Schema for job filtering."""
-    title: Optional[str] = None
-    company: Optional[str] = None
-    location: Optional[str] = None
-    work_type: Optional[str] = None
-    min_salary: Optional[int] = None
-    source_id: Optional[str] = None
-    is_active: Optional[bool] = True
-    page: int = Field(1, ge=1)
-    page_size: int = Field(20, ge=1, le=100)
+    """Schema for job filtering (parsed directly from GET /jobs query params)."""
+    title: Optional[str] = Field(None, description="Filter by title")
+    company: Optional[str] = Field(None, description="Filter by company")
+    location: Optional[str] = Field(None, description="Filter by location")
+    work_type: Optional[str] = Field(None, description="Filter by work type")
+    min_salary: Optional[int] = Field(None, description="Minimum salary")
+    source_id: Optional[str] = Field(None, description="Filter by source ID")
+    is_active: Optional[bool] = Field(True, description="Filter active jobs")
+    page: int = Field(1, ge=1, description="Page number")
+    page_size: int = Field(20, ge=1, le=100, description="Items per page")
 
 
 class FetchJobsResponse(BaseModel):
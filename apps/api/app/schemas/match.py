@@ -1,10 +1,10 @@
 """
 Job match Pydantic schemas.
 """
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-import json
+import orjson
 
 
 class MatchScoreBreakdown(BaseModel):
@@ -27,51 +27,41 @@ class JobMatchResponse(BaseModel):
     job_id: str
     resume_id: str
     match_score: float = Field(..., ge=0, le=100, description="Overall match score (0-100)")
-    score_breakdown: Optional[Dict[str, float]] = None
-    why: Optional[Dict[str, Any]] = None
-    missing_skills: Optional[List[str]] = None
+    # Decoded from trusted JSON columns; FastAPI's response_model pass
+    # would otherwise walk every key again
+    score_breakdown: SkipValidation[Optional[Dict[str, float]]] = None
+    why: SkipValidation[Optional[Dict[str, Any]]] = None
+    missing_skills: SkipValidation[Optional[List[str]]] = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
-    
-    @model_validator(mode='before')
-    @classmethod
-    def map_json_fields(cls, data):
-        """Map model JSON fields to schema fields and parse JSON strings."""
-        if hasattr(data, '__dict__'):
-            # SQLAlchemy model object
-            result = {
-                'id': data.id,
-                'user_id': data.user_id,
-                'job_id': data.job_id,
-                'resume_id': data.resume_id,
-                'match_score': data.match_score,
-                'created_at': data.created_at,
-                'updated_at': data.updated_at,
-            }
-            # Parse JSON fields
-            if hasattr(data, 'score_breakdown') and data.score_breakdown:
-                try:
-                    result['score_breakdown'] = json.loads(data.score_breakdown) if isinstance(data.score_breakdown, str) else data.score_breakdown
-                except (json.JSONDecodeError, TypeError):
-                    result['score_breakdown'] = None
-            
-            if hasattr(data, 'why_json') and data.why_json:
-                try:
-                    result['why'] = json.loads(data.why_json) if isinstance(data.why_json, str) else data.why_json
-                except (json.JSONDecodeError, TypeError):
-                    result['why'] = None
-            
-            if hasattr(data, 'missing_skills_json') and data.missing_skills_json:
-                try:
-                    result['missing_skills'] = json.loads(data.missing_skills_json) if isinstance(data.missing_skills_json, str) else data.missing_skills_json
-                except (json.JSONDecodeError, TypeError):
-                    result['missing_skills'] = None
-            
-            return result
-        return data
+
+
+def parse_json(value):
+    """Decode a JSON text column; empty or malformed values map to None."""
+    if not value:
+        return None
+    if not isinstance(value, (str, bytes, bytearray)):
+        return value
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def match_from_orm(m) -> JobMatchResponse:
+    """Build a JobMatchResponse from a JobMatch row, decoding its JSON columns."""
+    return JobMatchResponse.model_construct(
+        id=m.id,
+        user_id=m.user_id,
+        job_id=m.job_id,
+        resume_id=m.resume_id,
+        match_score=m.match_score,
+        score_breakdown=parse_json(m.score_breakdown),
+        why=parse_json(m.why_json),
+        missing_skills=parse_json(m.missing_skills_json),
+        created_at=m.created_at,
+        updated_at=m.updated_at,
+    )
 
 
 class JobMatchListResponse(BaseModel):
@@ -83,6 +73,9 @@ class JobMatchListResponse(BaseModel):
     total_pages: int
 
 
+MATCH_LIST_ADAPTER = TypeAdapter(List[JobMatchResponse])
+
+
 class RecomputeMatchesRequest(BaseModel):
     """Request to recompute matches."""
     resume_id: Optional[str] = Field(None, description="Specific resume to match against all jobs")
@@ -91,6 +84,7 @@ class RecomputeMatchesRequest(BaseModel):
 
 class RecomputeMatchesResponse(BaseModel):
     """Response after recomputing matches."""
+    model_config = ConfigDict(defer_build=True, extra='ignore')
     matches_computed: int
     matches_stored: int
     min_score: float
@@ -99,6 +93,7 @@ class RecomputeMatchesResponse(BaseModel):
 
 class NoMatchesSuggestion(BaseModel):
     """Suggestion when no matches are found."""
+    model_config = ConfigDict(defer_build=True, extra='ignore')
     type: str = Field(..., description="Type of suggestion: 'profile', 'preferences', 'resume'")
     title: str = Field(..., description="Short title for the suggestion")
     description: str = Field(..., description="Detailed description of what to do")
@@ -107,6 +102,7 @@ class NoMatchesSuggestion(BaseModel):
 
 class MatchSuggestionsResponse(BaseModel):
     """Response with suggestions when no/few matches found."""
+    model_config = ConfigDict(defer_build=True, extra='ignore')
     has_matches: bool
     match_count: int
     suggestions: List[NoMatchesSuggestion] = Field(default_factory=list)
@@ -1,10 +1,11 @@
 """
 Notification Pydantic schemas.
 """
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, SkipValidation, TypeAdapter, field_serializer
+from typing import Optional, List, Literal
+from datetime import datetime, time
 from enum import Enum
+from app.schemas.base import FastFromORM
 
 
 class NotificationTypeEnum(str, Enum):
@@ -16,6 +17,15 @@ class NotificationTypeEnum(str, Enum):
     OFFER_NOTIFICATION = "offer_notification"
 
 
+NotificationTypeLiteral = Literal[
+    "daily_digest",
+    "high_match_alert",
+    "application_update",
+    "interview_reminder",
+    "offer_notification",
+]
+
+
 # Notification Settings Schemas
 class NotificationSettingsBase(BaseModel):
     """Base schema for notification settings."""
@@ -25,8 +35,13 @@ class NotificationSettingsBase(BaseModel):
     application_update_enabled: bool = Field(True, description="Enable application updates")
     interview_reminder_enabled: bool = Field(True, description="Enable interview reminders")
     offer_notification_enabled: bool = Field(True, description="Enable offer notifications")
-    daily_digest_time: str = Field("09:00", description="Daily digest time (HH:MM)")
-    high_match_threshold: str = Field("85", description="High match threshold (0-100)")
+    daily_digest_time: time = Field(time(9, 0), description="Daily digest time (HH:MM)")
+    high_match_threshold: int = Field(85, ge=0, le=100, description="High match threshold (0-100)")
+    
+    @field_serializer('daily_digest_time')
+    def serialize_digest_time(self, value: time) -> str:
+        """Keep the HH:MM wire format."""
+        return value.strftime("%H:%M")
 
 
 class NotificationSettingsUpdate(BaseModel):
@@ -37,8 +52,8 @@ class NotificationSettingsUpdate(BaseModel):
     application_update_enabled: Optional[bool] = None
     interview_reminder_enabled: Optional[bool] = None
     offer_notification_enabled: Optional[bool] = None
-    daily_digest_time: Optional[str] = None
-    high_match_threshold: Optional[str] = None
+    daily_digest_time: Optional[time] = None
+    high_match_threshold: Optional[int] = Field(None, ge=0, le=100)
 
 
 class NotificationSettingsResponse(NotificationSettingsBase):
@@ -48,28 +63,32 @@ class NotificationSettingsResponse(NotificationSettingsBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Notification Log Schemas
-class NotificationLogResponse(BaseModel):
+class NotificationLogResponse(FastFromORM, BaseModel):
     """Schema for notification log response."""
     id: str
     user_id: str
-    notification_type: NotificationTypeEnum
+    notification_type: NotificationTypeLiteral
     recipient_email: str
     subject: str
-    body: Optional[str] = None
-    sent_at: Optional[datetime] = None
+    # Nullable columns are trusted DB values; skip re-validating them
+    body: SkipValidation[Optional[str]] = None
+    sent_at: SkipValidation[Optional[datetime]] = None
     status: str
-    error_message: Optional[str] = None
-    related_job_id: Optional[str] = None
-    related_match_id: Optional[str] = None
+    error_message: SkipValidation[Optional[str]] = None
+    related_job_id: SkipValidation[Optional[str]] = None
+    related_match_id: SkipValidation[Optional[str]] = None
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build from a NotificationLog row, mapping the model enum to its value."""
+        log = super().from_orm_fast(obj)
+        log.notification_type = obj.notification_type.value
+        return log
 
 
 class NotificationHistoryResponse(BaseModel):
@@ -78,6 +97,9 @@ class NotificationHistoryResponse(BaseModel):
     total: int
 
 
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationLogResponse])
+
+
 # Test Email Schema
 class SendTestEmailRequest(BaseModel):
     """Request to send test email."""
@@ -86,6 +108,7 @@ class SendTestEmailRequest(BaseModel):
 
 class SendTestEmailResponse(BaseModel):
     """Response after sending test email."""
+    model_config = ConfigDict(defer_build=True, extra='ignore')
     success: bool
     message: str
     email: str
@@ -1,13 +1,16 @@
 """
 Pydantic schemas for user preferences.
 """
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import Optional, List, Union
 from datetime import datetime
 
+_WORK_TYPES = ('remote', 'full-time', 'part-time', 'hybrid', 'contract')
+_ALLOWED_WORK_TYPES = frozenset(_WORK_TYPES)
 
-class PreferencesBase(BaseModel):
-    """Base schema for preferences."""
+
+class _PreferencesFields(BaseModel):
+    """Preference fields shared by request and response schemas."""
     # COMPATIBILITY: Accept both singular and plural forms
     desired_role: Optional[str] = Field(None, max_length=255, description="Desired job role/title")
     desired_roles: Optional[List[str]] = Field(None, description="List of desired job roles/titles")
@@ -30,6 +33,30 @@ class PreferencesBase(BaseModel):
     benefits_important: Optional[List[str]] = Field(None, description="List of important benefits")
     skills_to_develop: Optional[List[str]] = Field(None, description="List of skills to develop")
     
+    @field_validator('work_type')
+    @classmethod
+    def validate_work_type(cls, v):
+        """Validate work type is one of allowed values."""
+        if v is not None:
+            if v not in _ALLOWED_WORK_TYPES:
+                raise ValueError(f"work_type must be one of: {', '.join(_WORK_TYPES)}")
+        return v
+    
+    @model_validator(mode='after')
+    def validate_salary_range(self):
+        """Validate max_salary is greater than min_salary if both provided."""
+        if (
+            self.min_salary is not None
+            and self.max_salary is not None
+            and self.max_salary < self.min_salary
+        ):
+            raise ValueError("max_salary must be greater than or equal to min_salary")
+        return self
+
+
+class PreferencesBase(_PreferencesFields):
+    """Base schema for preference input."""
+    
     @model_validator(mode='before')
     @classmethod
     def normalize_desired_roles(cls, values):
@@ -45,46 +72,31 @@ class PreferencesBase(BaseModel):
             elif values.get('desired_roles') and not values.get('desired_role'):
                 values['desired_role'] = ', '.join(values['desired_roles'])
         return values
-    
-    @field_validator('work_type')
-    @classmethod
-    def validate_work_type(cls, v):
-        """Validate work type is one of allowed values."""
-        if v is not None:
-            allowed = ['remote', 'full-time', 'part-time', 'hybrid', 'contract']
-            if v not in allowed:
-                raise ValueError(f"work_type must be one of: {', '.join(allowed)}")
-        return v
-    
-    @field_validator('max_salary')
-    @classmethod
-    def validate_salary_range(cls, v, info):
-        """Validate max_salary is greater than min_salary if both provided."""
-        min_salary = info.data.get('min_salary')
-        if v is not None and min_salary is not None and v < min_salary:
-            raise ValueError("max_salary must be greater than or equal to min_salary")
-        return v
 
 
-class PreferencesCreate(PreferencesBase):
-    """Schema for creating preferences."""
-    pass
+# Create and update take the same (all optional) fields; alias them so
+# only one validator is built
+PreferencesCreate = PreferencesBase
+PreferencesUpdate = PreferencesBase
 
 
-class PreferencesUpdate(PreferencesBase):
-    """Schema for updating preferences (all fields optional)."""
-    pass
-
-
-class PreferencesResponse(PreferencesBase):
+class PreferencesResponse(_PreferencesFields):
     """Schema for preferences response."""
     id: str
     user_id: str
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    @model_validator(mode='after')
+    def fill_desired_roles(self):
+        """Derive a missing role field; stored rows are already normalized."""
+        if self.desired_roles and not self.desired_role:
+            self.desired_role = ', '.join(self.desired_roles)
+        elif self.desired_role and not self.desired_roles:
+            self.desired_roles = [self.desired_role]
+        return self
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PreferencesUpdateConfirmation(BaseModel):
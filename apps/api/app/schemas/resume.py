@@ -1,8 +1,8 @@
 """
 Resume-related Pydantic schemas for request/response validation.
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, model_serializer
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 from uuid import UUID
 
@@ -25,6 +25,34 @@ class ParsedResumeUpload(BaseModel):
     experience_years: Optional[int] = None
 
 
+class _ParsedItem(BaseModel):
+    """Parser-produced entry; values are kept as given and only given keys are dumped."""
+    model_config = ConfigDict(extra='allow')
+    
+    @model_serializer(mode='wrap')
+    def _dump_given_keys(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        data = handler(self)
+        given = self.model_fields_set | set(self.model_extra or ())
+        return {key: value for key, value in data.items() if key in given}
+
+
+class ExperienceItem(_ParsedItem):
+    """Experience entry from a parsed resume."""
+    company: Any = None
+    title: Any = None
+    position: Any = None
+    period: Any = None
+    duration: Any = None
+    description: Any = None
+
+
+class EducationItem(_ParsedItem):
+    """Education entry from a parsed resume."""
+    degree: Any = None
+    institution: Any = None
+    year: Any = None
+
+
 class ParsedProfile(BaseModel):
     """Structured profile data extracted from resume."""
     name: Optional[str] = None
@@ -32,8 +60,8 @@ class ParsedProfile(BaseModel):
     phone: Optional[str] = None
     location: Optional[str] = None
     summary: Optional[str] = None
-    experience: List[Dict[str, Any]] = Field(default_factory=list)
-    education: List[Dict[str, Any]] = Field(default_factory=list)
+    experience: List[ExperienceItem] = Field(default_factory=list)
+    education: List[EducationItem] = Field(default_factory=list)
     skills: List[str] = Field(default_factory=list)
     certifications: List[str] = Field(default_factory=list)
     languages: List[str] = Field(default_factory=list)
@@ -89,6 +117,7 @@ class ShareLinkResponse(BaseModel):
 
 class PublicScorecardView(BaseModel):
     """Public view of scorecard (privacy-safe, no personal info)."""
+    model_config = ConfigDict(defer_build=True, extra='ignore')
     ats_score: int
     breakdown: ATSScoreBreakdown
     missing_keywords: List[str]
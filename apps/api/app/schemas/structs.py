@@ -0,0 +1,157 @@
+"""
+msgspec shadow structs for the hottest list responses.
+JobPostingMsg, JobMatchMsg and NotificationLogMsg mirror the Pydantic
+response schemas field for field and are only used to encode list
+endpoints; the Pydantic schemas stay the source of truth for OpenAPI and
+request validation, and remain the fallback encoder.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import datetime
+import logging
+
+from app.core.config import settings
+from app.schemas.job import JobPostingResponse, JOB_LIST_ADAPTER
+from app.schemas.match import MATCH_LIST_ADAPTER, match_from_orm, parse_json
+from app.schemas.notification import NotificationLogResponse, NOTIFICATION_LIST_ADAPTER
+
+logger = logging.getLogger(__name__)
+
+# Try to import msgspec, fall back to Pydantic serialization if not available
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    logger.info("msgspec not installed - list responses will be encoded with Pydantic")
+
+
+if MSGSPEC_AVAILABLE:
+
+    class JobPostingMsg(msgspec.Struct, frozen=True):
+        """Wire shape of JobPostingResponse."""
+        title: str
+        company: str
+        location: Optional[str]
+        description: Optional[str]
+        requirements: Optional[str]
+        salary_min: Optional[int]
+        salary_max: Optional[int]
+        salary_currency: Optional[str]
+        work_type: Optional[str]
+        application_url: str
+        posted_date: Optional[datetime]
+        id: str
+        source_id: str
+        is_active: bool
+        created_at: datetime
+        updated_at: datetime
+
+    class JobMatchMsg(msgspec.Struct, frozen=True):
+        """Wire shape of JobMatchResponse."""
+        id: str
+        user_id: str
+        job_id: str
+        resume_id: str
+        match_score: float
+        score_breakdown: Optional[Dict[str, float]]
+        why: Optional[Dict[str, Any]]
+        missing_skills: Optional[List[str]]
+        created_at: datetime
+        updated_at: datetime
+
+    class NotificationLogMsg(msgspec.Struct, frozen=True):
+        """Wire shape of NotificationLogResponse."""
+        id: str
+        user_id: str
+        notification_type: str
+        recipient_email: str
+        subject: str
+        body: Optional[str]
+        sent_at: Optional[datetime]
+        status: str
+        error_message: Optional[str]
+        related_job_id: Optional[str]
+        related_match_id: Optional[str]
+        created_at: datetime
+
+    _ENC = msgspec.json.Encoder()
+
+
+def enabled() -> bool:
+    """Whether list responses are encoded with msgspec."""
+    return MSGSPEC_AVAILABLE and settings.MSGSPEC_RESPONSES
+
+
+def dump_job_postings(jobs: Sequence[Any]) -> bytes:
+    """JSON array of JobPostingResponse items for JobPosting rows."""
+    if not enabled():
+        return JOB_LIST_ADAPTER.dump_json(
+            [JobPostingResponse.from_orm_fast(job) for job in jobs], by_alias=True
+        )
+    return _ENC.encode([
+        JobPostingMsg(
+            title=job.title,
+            company=job.company,
+            location=job.location,
+            description=job.description,
+            requirements=job.requirements,
+            salary_min=job.salary_min,
+            salary_max=job.salary_max,
+            salary_currency=job.salary_currency,
+            work_type=job.work_type,
+            application_url=job.application_url,
+            posted_date=job.posted_date,
+            id=job.id,
+            source_id=job.source_id,
+            is_active=job.is_active,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
+        for job in jobs
+    ])
+
+
+def dump_matches(matches: Sequence[Any]) -> bytes:
+    """JSON array of JobMatchResponse items for JobMatch rows."""
+    if not enabled():
+        return MATCH_LIST_ADAPTER.dump_json([match_from_orm(m) for m in matches], by_alias=True)
+    return _ENC.encode([
+        JobMatchMsg(
+            id=m.id,
+            user_id=m.user_id,
+            job_id=m.job_id,
+            resume_id=m.resume_id,
+            match_score=m.match_score,
+            score_breakdown=parse_json(m.score_breakdown),
+            why=parse_json(m.why_json),
+            missing_skills=parse_json(m.missing_skills_json),
+            created_at=m.created_at,
+            updated_at=m.updated_at,
+        )
+        for m in matches
+    ])
+
+
+def dump_notification_logs(logs: Sequence[Any]) -> bytes:
+    """JSON array of NotificationLogResponse items for NotificationLog rows."""
+    if not enabled():
+        return NOTIFICATION_LIST_ADAPTER.dump_json(
+            [NotificationLogResponse.from_orm_fast(log) for log in logs], by_alias=True
+        )
+    return _ENC.encode([
+        NotificationLogMsg(
+            id=log.id,
+            user_id=log.user_id,
+            notification_type=log.notification_type.value,
+            recipient_email=log.recipient_email,
+            subject=log.subject,
+            body=log.body,
+            sent_at=log.sent_at,
+            status=log.status,
+            error_message=log.error_message,
+            related_job_id=log.related_job_id,
+            related_match_id=log.related_match_id,
+            created_at=log.created_at,
+        )
+        for log in logs
+    ])
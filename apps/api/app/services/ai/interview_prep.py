@@ -2,67 +2,217 @@
 AI Interview Preparation Service.
 Handles interview question generation, coaching, and preparation kits.
 """
-import json
+import asyncio
+import copy
+import functools
+import orjson
 import time
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
+from types import MappingProxyType
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.resume import Resume
 from app.models.job import JobPosting
 from app.models.ai_interview import InterviewKit, InterviewQuestion, STARExample, CompanyInsight
-import uuid
+from app.core.database import gather_reads
+from app.core.ids import uuid7, uuid7_batch
+from app.core.json import dumps_text
+from app.services.ai.skill_kernels import keyword_presence
+
+
+# Question templates per category, shared by every engine
+_TECHNICAL_TEMPLATES = (
+    "Explain your experience with {skill}",
+    "How would you approach {technical_challenge}?",
+    "What's the difference between {concept_a} and {concept_b}?",
+    "Describe a time when you had to debug {technical_issue}",
+    "How do you ensure code quality in {technology}?",
+    "What are the best practices for {technical_area}?",
+    "How would you optimize {performance_area}?",
+    "Explain how you would implement {feature_type}",
+    "What testing strategies do you use for {technology}?",
+    "How do you handle {technical_problem} in production?",
+)
+
+# How each technical placeholder derives from the skill ({0})
+_SKILL_PLACEHOLDERS = {
+    "skill": "{0}",
+    "technical_challenge": "{0} implementation",
+    "concept_a": "{0}",
+    "concept_b": "alternative approach",
+    "technical_issue": "{0} performance issue",
+    "technology": "{0}",
+    "technical_area": "{0}",
+    "performance_area": "{0} performance",
+    "feature_type": "{0}-based feature",
+    "technical_problem": "{0} scaling issue",
+}
+
+# Technical templates pre-rendered down to the single skill argument
+_SKILL_TEMPLATES = tuple(t.format_map(_SKILL_PLACEHOLDERS) for t in _TECHNICAL_TEMPLATES)
+
+# Asked once the job's skills run out
+_GENERAL_TECHNICAL_QUESTIONS = (
+    "How do you approach system design for scalable applications?",
+    "Describe your experience with code reviews and quality assurance.",
+    "How do you handle technical debt in your projects?",
+    "What's your approach to debugging complex issues?",
+    "How do you stay updated with new technologies?",
+)
+
+_BEHAVIORAL_TEMPLATES = (
+    "Tell me about a time when you had to {behavioral_situation}",
+    "Describe a situation where you {leadership_scenario}",
+    "How do you handle {conflict_situation}?",
+    "Give me an example of when you {achievement_scenario}",
+    "Tell me about a time you failed and what you learned",
+    "Describe your approach to {work_style_question}",
+    "How do you prioritize tasks when {pressure_situation}?",
+    "Tell me about a time you had to {collaboration_scenario}",
+    "Describe a situation where you {problem_solving_scenario}",
+    "How do you handle feedback and criticism?",
+)
+
+_COMPANY_TEMPLATES = (
+    "Why do you want to work at {company}?",
+    "How do you align with {company}'s values?",
+    "What do you know about {company}'s recent {news_topic}?",
+    "How would you contribute to {company}'s mission?",
+    "What interests you about {company}'s {product_service}?",
+    "How do you see yourself fitting into {company}'s culture?",
+    "What questions do you have about working at {company}?",
+    "How would you handle {company_specific_challenge}?",
+    "What do you think about {company}'s approach to {business_area}?",
+    "How would you improve {company}'s {improvement_area}?",
+)
+
+_STAR_COMPETENCIES = (
+    "Leadership", "Problem Solving", "Communication", "Teamwork",
+    "Adaptability", "Initiative", "Time Management", "Conflict Resolution",
+    "Innovation", "Customer Focus", "Decision Making", "Mentoring",
+)
+
+# Per-category answer guidance; anything else gets the company-specific set
+_ANSWER_APPROACHES = {
+    "technical": "Start with a brief overview, then dive into specifics. Use concrete examples from your experience.",
+    "behavioral": "Use the STAR method: describe the Situation, Task, Action you took, and Result achieved.",
+    "company_specific": "Be specific and authentic. Connect your answer to the company's values and mission.",
+}
+
+_KEY_POINTS = {
+    "technical": (
+        "Demonstrate deep understanding of the technology",
+        "Provide specific examples from your experience",
+        "Discuss best practices and trade-offs",
+        "Show problem-solving approach",
+    ),
+    "behavioral": (
+        "Set clear context (Situation)",
+        "Define your responsibility (Task)",
+        "Explain your actions (Action)",
+        "Quantify the outcome (Result)",
+        "Reflect on lessons learned",
+    ),
+    "company_specific": (
+        "Show genuine interest and research",
+        "Connect your values with company values",
+        "Demonstrate understanding of company's mission",
+        "Ask thoughtful questions",
+    ),
+}
+
+_FOLLOW_UPS = {
+    "technical": (
+        "How would you scale this solution?",
+        "What alternatives did you consider?",
+        "How would you test this implementation?",
+    ),
+    "behavioral": (
+        "What would you do differently next time?",
+        "How did this experience change your approach?",
+        "What did you learn from this situation?",
+    ),
+    "company_specific": (
+        "What specific aspects interest you most?",
+        "How do you see yourself contributing?",
+        "What questions do you have for us?",
+    ),
+}
+
+# Seniority is decided on whole title words
+_WORD_RE = re.compile(r"[a-z+]+")
+_SENIOR_WORDS = frozenset({"senior", "sr", "lead", "principal", "staff"})
+_JUNIOR_WORDS = frozenset({"junior", "jr", "entry", "associate"})
+
+# Company names often glue words together ("TechCorp"), so industry keywords
+# stay substring matches; checked in order, first hit wins
+_INDUSTRY_PATTERNS = (
+    ("technology", re.compile("tech|software|ai|data", re.IGNORECASE)),
+    ("finance", re.compile("bank|finance|capital", re.IGNORECASE)),
+    ("healthcare", re.compile("health|medical|pharma", re.IGNORECASE)),
+)
+
+# Answer feedback cues; substrings on purpose so "projects" and "teammates" count
+_SPECIFIC_ANSWER_RE = re.compile("project|experience", re.IGNORECASE)
+_STRENGTH_ANSWER_RE = re.compile("project|team|developed|implemented", re.IGNORECASE)
+
+# Generic suggestions included with every answer's feedback
+_ANSWER_SUGGESTIONS = (
+    "Use the STAR method for behavioral questions",
+    "Include quantifiable results when possible",
+    "Connect your answer to the job requirements"
+)
+
+# Company insights are generic per company, so they are cached in-process
+COMPANY_INSIGHT_TTL_SECONDS = 600
+COMPANY_INSIGHT_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_resume(parsed_data: str) -> Dict[str, Any]:
+    """Decode a stored resume; the same resume backs many kits."""
+    return orjson.loads(parsed_data)
+
+
+# Skills looked for in job text, in reporting order
+COMMON_SKILLS = (
+    "python", "javascript", "react", "node.js", "sql", "aws", "docker",
+    "kubernetes", "machine learning", "ai", "data science", "fastapi",
+    "postgresql", "mongodb", "redis", "git", "ci/cd", "devops",
+    "java", "c++", "go", "rust", "typescript", "angular", "vue.js",
+    "django", "flask", "spring", "microservices", "api", "rest",
+    "graphql", "terraform", "jenkins", "linux", "agile", "scrum"
+)
+
+# Reporting position of each skill, for batch classification
+_SKILL_INDEX = {skill: i for i, skill in enumerate(COMMON_SKILLS)}
+
+# One pass over the text for all skills; whole words only, so "java" no
+# longer matches inside "javascript" nor "ai" inside "maintain"
+_SKILL_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(map(re.escape, COMMON_SKILLS)) + r")(?!\w)",
+    re.IGNORECASE,
+)
 
 
 class InterviewPreparationEngine:
     """Core engine for AI-powered interview preparation."""
     
+    question_templates = MappingProxyType({
+        "technical": _TECHNICAL_TEMPLATES,
+        "behavioral": _BEHAVIORAL_TEMPLATES,
+        "company_specific": _COMPANY_TEMPLATES,
+    })
+    star_competencies = _STAR_COMPETENCIES
+    
     def __init__(self):
-        self.question_templates = {
-            "technical": [
-                "Explain your experience with {skill}",
-                "How would you approach {technical_challenge}?",
-                "What's the difference between {concept_a} and {concept_b}?",
-                "Describe a time when you had to debug {technical_issue}",
-                "How do you ensure code quality in {technology}?",
-                "What are the best practices for {technical_area}?",
-                "How would you optimize {performance_area}?",
-                "Explain how you would implement {feature_type}",
-                "What testing strategies do you use for {technology}?",
-                "How do you handle {technical_problem} in production?"
-            ],
-            "behavioral": [
-                "Tell me about a time when you had to {behavioral_situation}",
-                "Describe a situation where you {leadership_scenario}",
-                "How do you handle {conflict_situation}?",
-                "Give me an example of when you {achievement_scenario}",
-                "Tell me about a time you failed and what you learned",
-                "Describe your approach to {work_style_question}",
-                "How do you prioritize tasks when {pressure_situation}?",
-                "Tell me about a time you had to {collaboration_scenario}",
-                "Describe a situation where you {problem_solving_scenario}",
-                "How do you handle feedback and criticism?"
-            ],
-            "company_specific": [
-                "Why do you want to work at {company}?",
-                "How do you align with {company}'s values?",
-                "What do you know about {company}'s recent {news_topic}?",
-                "How would you contribute to {company}'s mission?",
-                "What interests you about {company}'s {product_service}?",
-                "How do you see yourself fitting into {company}'s culture?",
-                "What questions do you have about working at {company}?",
-                "How would you handle {company_specific_challenge}?",
-                "What do you think about {company}'s approach to {business_area}?",
-                "How would you improve {company}'s {improvement_area}?"
-            ]
-        }
-        
-        self.star_competencies = [
-            "Leadership", "Problem Solving", "Communication", "Teamwork", 
-            "Adaptability", "Initiative", "Time Management", "Conflict Resolution",
-            "Innovation", "Customer Focus", "Decision Making", "Mentoring"
-        ]
+        # company_name -> (monotonic time cached, insights)
+        self._company_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     async def generate_interview_kit(
         self,
@@ -76,15 +226,16 @@ class InterviewPreparationEngine:
         start_time = time.time()
         
         try:
-            # Check if kit already exists
-            existing_kit = await self._get_existing_kit(db, user_id, job_id)
+            # Existing kit, resume and job posting are independent reads
+            existing_kit, user_resume, job_posting = await gather_reads(
+                db,
+                lambda session: self._get_existing_kit(session, user_id, job_id),
+                lambda session: self._get_user_resume(session, user_id),
+                lambda session: self._get_job_posting(session, job_id),
+            )
             if existing_kit:
                 return await self._format_kit_response(existing_kit)
             
-            # Get user resume and job posting
-            user_resume = await self._get_user_resume(db, user_id)
-            job_posting = await self._get_job_posting(db, job_id)
-            
             if not user_resume or not job_posting:
                 raise ValueError("Resume or job posting not found")
             
@@ -92,27 +243,19 @@ class InterviewPreparationEngine:
             resume_data = self._parse_resume_content(user_resume.parsed_data)
             job_requirements = self._parse_job_requirements(job_posting)
             
-            # Generate interview questions
-            questions = await self._generate_questions(
-                resume_data, job_requirements, difficulty_level
-            )
-            
-            # Generate personalized talking points
-            talking_points = await self._generate_talking_points(
-                resume_data, job_requirements
-            )
-            
-            # Generate STAR examples
-            star_examples = await self._generate_star_examples(
-                resume_data, job_requirements
+            # The generators never touch the session, so at most one branch
+            # (company insights) uses db and the four can run concurrently
+            questions, talking_points, star_examples, company_insights = await asyncio.gather(
+                self._generate_questions(resume_data, job_requirements, difficulty_level),
+                self._generate_talking_points(resume_data, job_requirements),
+                self._generate_star_examples(resume_data, job_requirements),
+                self._get_company_insights(db, job_posting.company)
+                if include_company_research else self._no_company_insights(),
             )
             
-            # Get company insights
-            company_insights = {}
-            if include_company_research:
-                company_insights = await self._get_company_insights(
-                    db, job_posting.company
-                )
+            # Company insights are shared by every kit for the company; commit
+            # them now so a failed kit write below can't take them with it
+            await db.commit()
             
             # Generate preparation checklist
             prep_checklist = self._generate_preparation_checklist(
@@ -126,14 +269,14 @@ class InterviewPreparationEngine:
             
             # Create interview kit
             kit = InterviewKit(
-                id=str(uuid.uuid4()),
+                id=uuid7(),
                 user_id=user_id,
                 job_id=job_id,
-                questions=json.dumps(questions),
-                talking_points=json.dumps(talking_points),
-                company_insights=json.dumps(company_insights),
-                star_examples=json.dumps(star_examples),
-                preparation_checklist=json.dumps(prep_checklist),
+                questions=questions,
+                talking_points=talking_points,
+                company_insights=company_insights,
+                star_examples=star_examples,
+                preparation_checklist=prep_checklist,
                 difficulty_level=difficulty_level,
                 estimated_prep_time=estimated_prep_time
             )
@@ -152,7 +295,10 @@ class InterviewPreparationEngine:
             processing_time = time.time() - start_time
             print(f"Interview kit generated in {processing_time:.2f}s")
             
-            return await self._format_kit_response(kit)
+            # Respond from the payloads in hand rather than decoding the columns
+            return self._kit_response(
+                kit, questions, talking_points, company_insights, star_examples, prep_checklist
+            )
             
         except Exception as e:
             await db.rollback()
@@ -196,12 +342,12 @@ class InterviewPreparationEngine:
                 question.question_text,
                 question.category,
                 user_answer,
-                json.loads(question.suggested_answer) if question.suggested_answer else {}
+                question.suggested_answer or {}
             )
             
             # Update question with user answer and feedback
             question.user_answer = user_answer
-            question.ai_feedback = json.dumps(feedback["feedback"])
+            question.ai_feedback = dumps_text(feedback["feedback"])
             question.feedback_score = feedback["score"]
             question.is_practiced = True
             question.updated_at = datetime.utcnow()
@@ -239,7 +385,7 @@ class InterviewPreparationEngine:
                 InterviewKit.user_id == user_id,
                 InterviewKit.job_id == job_id,
                 InterviewKit.is_active == True
-            ).order_by(InterviewKit.created_at.desc())
+            ).order_by(InterviewKit.created_at.desc()).limit(1)
         )
         return result.scalar_one_or_none()
     
@@ -251,7 +397,7 @@ class InterviewPreparationEngine:
             select(Resume).where(
                 Resume.user_id == user_id,
                 Resume.is_parsed == True
-            ).order_by(Resume.uploaded_at.desc())
+            ).order_by(Resume.uploaded_at.desc()).limit(1)
         )
         return result.scalar_one_or_none()
     
@@ -265,12 +411,12 @@ class InterviewPreparationEngine:
         return result.scalar_one_or_none()
     
     def _parse_resume_content(self, parsed_data: str) -> Dict[str, Any]:
-        """Parse resume content from stored JSON."""
+        """Parse resume content from stored JSON (shared, treat as read-only)."""
         if not parsed_data:
             return {}
         try:
-            return json.loads(parsed_data)
-        except (json.JSONDecodeError, TypeError):
+            return _decode_resume(parsed_data)
+        except (orjson.JSONDecodeError, TypeError):
             return {}
     
     def _parse_job_requirements(self, job_posting: JobPosting) -> Dict[str, Any]:
@@ -287,40 +433,56 @@ class InterviewPreparationEngine:
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract technical skills from job text."""
-        text_lower = text.lower()
-        common_skills = [
-            "python", "javascript", "react", "node.js", "sql", "aws", "docker",
-            "kubernetes", "machine learning", "ai", "data science", "fastapi",
-            "postgresql", "mongodb", "redis", "git", "ci/cd", "devops",
-            "java", "c++", "go", "rust", "typescript", "angular", "vue.js",
-            "django", "flask", "spring", "microservices", "api", "rest",
-            "graphql", "terraform", "jenkins", "linux", "agile", "scrum"
-        ]
+        found = {m.lower() for m in _SKILL_RE.findall(text)}
+        return [skill for skill in COMMON_SKILLS if skill in found][:10]  # Top 10 skills
+    
+    def classify_jobs(self, job_postings: Sequence[JobPosting]) -> List[Dict[str, Any]]:
+        """
+        Skills, seniority and industry for many job postings at once.
+        
+        Same results as _extract_skills/_extract_seniority/_extract_industry
+        per posting; skill matches from every posting are gathered into one
+        presence matrix so ordering and the top-10 cut are array operations.
+        """
+        doc_index: List[int] = []
+        skill_ids: List[int] = []
+        for i, job in enumerate(job_postings):
+            for match in _SKILL_RE.findall(f"{job.description} {job.requirements}"):
+                doc_index.append(i)
+                skill_ids.append(_SKILL_INDEX[match.lower()])
+        
+        presence = keyword_presence(
+            np.array(doc_index, dtype=np.intp),
+            np.array(skill_ids, dtype=np.intp),
+            len(job_postings),
+            len(COMMON_SKILLS),
+        )
         
-        found_skills = [skill for skill in common_skills if skill in text_lower]
-        return found_skills[:10]  # Top 10 skills
+        return [
+            {
+                "skills": [COMMON_SKILLS[k] for k in np.flatnonzero(row)[:10]],
+                "seniority": self._extract_seniority(job.title),
+                "industry": self._extract_industry(job.company),
+            }
+            for job, row in zip(job_postings, presence)
+        ]
     
     def _extract_seniority(self, title: str) -> str:
         """Extract seniority level from job title."""
-        title_lower = title.lower()
-        if any(word in title_lower for word in ["senior", "sr", "lead", "principal", "staff"]):
+        tokens = set(_WORD_RE.findall(title.lower()))
+        if tokens & _SENIOR_WORDS:
             return "senior"
-        elif any(word in title_lower for word in ["junior", "jr", "entry", "associate"]):
+        elif tokens & _JUNIOR_WORDS:
             return "junior"
         else:
             return "mid"
     
     def _extract_industry(self, company: str) -> str:
         """Extract industry from company name (simplified)."""
-        company_lower = company.lower()
-        if any(word in company_lower for word in ["tech", "software", "ai", "data"]):
-            return "technology"
-        elif any(word in company_lower for word in ["bank", "finance", "capital"]):
-            return "finance"
-        elif any(word in company_lower for word in ["health", "medical", "pharma"]):
-            return "healthcare"
-        else:
-            return "general"
+        for industry, pattern in _INDUSTRY_PATTERNS:
+            if pattern.search(company):
+                return industry
+        return "general"
     
     async def _generate_questions(
         self, 
@@ -329,25 +491,16 @@ class InterviewPreparationEngine:
         difficulty_level: str
     ) -> List[Dict[str, Any]]:
         """Generate interview questions based on job and resume."""
-        questions = []
-        
-        # Technical questions (40% of total)
-        tech_questions = await self._generate_technical_questions(
-            resume_data, job_requirements, difficulty_level
-        )
-        questions.extend(tech_questions)
-        
-        # Behavioral questions (40% of total)
-        behavioral_questions = await self._generate_behavioral_questions(
-            resume_data, job_requirements, difficulty_level
+        # Technical (40%), behavioral (40%) and company-specific (20%) are independent
+        tech_questions, behavioral_questions, company_questions = await asyncio.gather(
+            self._generate_technical_questions(resume_data, job_requirements, difficulty_level),
+            self._generate_behavioral_questions(resume_data, job_requirements, difficulty_level),
+            self._generate_company_questions(job_requirements, difficulty_level),
         )
-        questions.extend(behavioral_questions)
+        questions = tech_questions + behavioral_questions + company_questions
         
-        # Company-specific questions (20% of total)
-        company_questions = await self._generate_company_questions(
-            job_requirements, difficulty_level
-        )
-        questions.extend(company_questions)
+        for question, question_id in zip(questions, uuid7_batch(len(questions))):
+            question["id"] = question_id
         
         return questions
     
@@ -367,32 +520,12 @@ class InterviewPreparationEngine:
         for i in range(min(question_count, len(skills) + 2)):
             if i < len(skills):
                 skill = skills[i]
-                template = self.question_templates["technical"][i % len(self.question_templates["technical"])]
-                question_text = template.format(
-                    skill=skill,
-                    technical_challenge=f"{skill} implementation",
-                    concept_a=skill,
-                    concept_b="alternative approach",
-                    technical_issue=f"{skill} performance issue",
-                    technology=skill,
-                    technical_area=skill,
-                    performance_area=f"{skill} performance",
-                    feature_type=f"{skill}-based feature",
-                    technical_problem=f"{skill} scaling issue"
-                )
+                question_text = _SKILL_TEMPLATES[i % len(_SKILL_TEMPLATES)].format(skill)
             else:
                 # General technical questions
-                general_questions = [
-                    "How do you approach system design for scalable applications?",
-                    "Describe your experience with code reviews and quality assurance.",
-                    "How do you handle technical debt in your projects?",
-                    "What's your approach to debugging complex issues?",
-                    "How do you stay updated with new technologies?"
-                ]
-                question_text = general_questions[i - len(skills)]
+                question_text = _GENERAL_TECHNICAL_QUESTIONS[i - len(skills)]
             
             questions.append({
-                "id": str(uuid.uuid4()),
                 "text": question_text,
                 "category": "technical",
                 "difficulty": difficulty_level,
@@ -431,7 +564,6 @@ class InterviewPreparationEngine:
             question_text = f"Tell me about a time when you had to {scenario}."
             
             questions.append({
-                "id": str(uuid.uuid4()),
                 "text": question_text,
                 "category": "behavioral",
                 "difficulty": difficulty_level,
@@ -465,7 +597,6 @@ class InterviewPreparationEngine:
             question_text = company_questions[i]
             
             questions.append({
-                "id": str(uuid.uuid4()),
                 "text": question_text,
                 "category": "company_specific",
                 "difficulty": difficulty_level,
@@ -478,58 +609,15 @@ class InterviewPreparationEngine:
     
     def _generate_answer_approach(self, category: str, question: str) -> str:
         """Generate suggested approach for answering a question."""
-        if category == "technical":
-            return "Start with a brief overview, then dive into specifics. Use concrete examples from your experience."
-        elif category == "behavioral":
-            return "Use the STAR method: describe the Situation, Task, Action you took, and Result achieved."
-        else:
-            return "Be specific and authentic. Connect your answer to the company's values and mission."
+        return _ANSWER_APPROACHES.get(category, _ANSWER_APPROACHES["company_specific"])
     
     def _generate_key_points(self, category: str, context: str, skills: List[str]) -> List[str]:
         """Generate key points to cover in the answer."""
-        if category == "technical":
-            return [
-                "Demonstrate deep understanding of the technology",
-                "Provide specific examples from your experience",
-                "Discuss best practices and trade-offs",
-                "Show problem-solving approach"
-            ]
-        elif category == "behavioral":
-            return [
-                "Set clear context (Situation)",
-                "Define your responsibility (Task)",
-                "Explain your actions (Action)",
-                "Quantify the outcome (Result)",
-                "Reflect on lessons learned"
-            ]
-        else:
-            return [
-                "Show genuine interest and research",
-                "Connect your values with company values",
-                "Demonstrate understanding of company's mission",
-                "Ask thoughtful questions"
-            ]
+        return list(_KEY_POINTS.get(category, _KEY_POINTS["company_specific"]))
     
     def _generate_follow_ups(self, category: str, question: str) -> List[str]:
         """Generate potential follow-up questions."""
-        if category == "technical":
-            return [
-                "How would you scale this solution?",
-                "What alternatives did you consider?",
-                "How would you test this implementation?"
-            ]
-        elif category == "behavioral":
-            return [
-                "What would you do differently next time?",
-                "How did this experience change your approach?",
-                "What did you learn from this situation?"
-            ]
-        else:
-            return [
-                "What specific aspects interest you most?",
-                "How do you see yourself contributing?",
-                "What questions do you have for us?"
-            ]
+        return list(_FOLLOW_UPS.get(category, _FOLLOW_UPS["company_specific"]))
     
     async def _generate_talking_points(
         self,
@@ -549,7 +637,8 @@ class InterviewPreparationEngine:
         # Skills alignment
         user_skills = resume_data.get("skills", [])
         job_skills = job_requirements.get("skills", [])
-        matching_skills = [skill for skill in job_skills if skill.lower() in [s.lower() for s in user_skills]]
+        user_skill_set = {s.lower() for s in user_skills}
+        matching_skills = [skill for skill in job_skills if skill.lower() in user_skill_set]
         
         if matching_skills:
             talking_points.append(
@@ -595,29 +684,42 @@ class InterviewPreparationEngine:
         
         return star_examples
     
+    async def _no_company_insights(self) -> Dict[str, Any]:
+        """Placeholder branch when company research is skipped."""
+        return {}
+    
     async def _get_company_insights(
         self,
         db: AsyncSession,
         company_name: str
     ) -> Dict[str, Any]:
         """Get or generate company insights."""
-        # Check if we have existing insights
-        result = await db.execute(
-            select(CompanyInsight).where(
-                CompanyInsight.company_name == company_name
-            ).order_by(CompanyInsight.last_updated.desc())
-        )
-        existing_insight = result.scalar_one_or_none()
+        cached = self._company_cache.get(company_name)
+        if cached and time.monotonic() - cached[0] < COMPANY_INSIGHT_TTL_SECONDS:
+            return copy.deepcopy(cached[1])
         
-        if existing_insight:
-            return {
-                "culture": json.loads(existing_insight.culture_info) if existing_insight.culture_info else {},
-                "values": json.loads(existing_insight.values) if existing_insight.values else [],
-                "interview_process": json.loads(existing_insight.interview_process) if existing_insight.interview_process else {},
-                "talking_points": json.loads(existing_insight.key_talking_points) if existing_insight.key_talking_points else [],
-                "questions_to_ask": json.loads(existing_insight.questions_to_ask) if existing_insight.questions_to_ask else []
-            }
+        insights = await self._load_company_insights(db, company_name)
+        
+        self._company_cache.pop(company_name, None)
+        if len(self._company_cache) >= COMPANY_INSIGHT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._company_cache.pop(next(iter(self._company_cache)))
+        self._company_cache[company_name] = (time.monotonic(), copy.deepcopy(insights))
+        
+        return insights
+    
+    async def _load_company_insights(
+        self,
+        db: AsyncSession,
+        company_name: str
+    ) -> Dict[str, Any]:
+        """
+        Read stored company insights, generating and storing them if missing.
         
+        One INSERT ... ON CONFLICT (company_name) DO UPDATE ... RETURNING
+        either stores the generated insights or hands back the existing row,
+        so concurrent kit requests cannot insert duplicates.
+        """
         # Generate new insights (simplified for demo)
         insights = {
             "culture": {
@@ -644,22 +746,35 @@ class InterviewPreparationEngine:
             ]
         }
         
-        # Store insights for future use
-        company_insight = CompanyInsight(
-            id=str(uuid.uuid4()),
+        insight_id = uuid7()
+        dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(CompanyInsight).values(
+            id=insight_id,
             company_name=company_name,
-            culture_info=json.dumps(insights["culture"]),
-            values=json.dumps(insights["values"]),
-            interview_process=json.dumps(insights["interview_process"]),
-            key_talking_points=json.dumps(insights["talking_points"]),
-            questions_to_ask=json.dumps(insights["questions_to_ask"]),
+            culture_info=dumps_text(insights["culture"]),
+            values=dumps_text(insights["values"]),
+            interview_process=dumps_text(insights["interview_process"]),
+            key_talking_points=dumps_text(insights["talking_points"]),
+            questions_to_ask=dumps_text(insights["questions_to_ask"]),
             confidence_score=75.0
         )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CompanyInsight.company_name],
+            set_={"last_updated": func.now()},
+        ).returning(CompanyInsight)
         
-        db.add(company_insight)
-        await db.flush()
+        result = await db.execute(stmt, execution_options={"populate_existing": True})
+        stored = result.scalar_one()
+        if stored.id == insight_id:
+            return insights
         
-        return insights
+        return {
+            "culture": orjson.loads(stored.culture_info) if stored.culture_info else {},
+            "values": orjson.loads(stored.values) if stored.values else [],
+            "interview_process": orjson.loads(stored.interview_process) if stored.interview_process else {},
+            "talking_points": orjson.loads(stored.key_talking_points) if stored.key_talking_points else [],
+            "questions_to_ask": orjson.loads(stored.questions_to_ask) if stored.questions_to_ask else []
+        }
     
     def _generate_preparation_checklist(
         self,
@@ -708,24 +823,27 @@ class InterviewPreparationEngine:
         user_id: str,
         questions: List[Dict[str, Any]]
     ):
-        """Create individual question records."""
-        for i, q in enumerate(questions):
-            question = InterviewQuestion(
-                id=q["id"],
-                kit_id=kit_id,
-                user_id=user_id,
-                question_text=q["text"],
-                category=q["category"],
-                difficulty=q["difficulty"],
-                suggested_answer=json.dumps({
+        """Create individual question records in one bulk INSERT."""
+        if not questions:
+            return
+        await db.execute(insert(InterviewQuestion), [
+            {
+                "id": q["id"],
+                "kit_id": kit_id,
+                "user_id": user_id,
+                "question_text": q["text"],
+                "category": q["category"],
+                "difficulty": q["difficulty"],
+                "suggested_answer": {
                     "approach": q["suggested_approach"],
                     "key_points": q["key_points"]
-                }),
-                key_points=json.dumps(q["key_points"]),
-                follow_up_questions=json.dumps(q["follow_ups"]),
-                order_index=i
-            )
-            db.add(question)
+                },
+                "key_points": q["key_points"],
+                "follow_up_questions": q["follow_ups"],
+                "order_index": i,
+            }
+            for i, q in enumerate(questions)
+        ])
     
     async def _create_star_records(
         self,
@@ -735,21 +853,26 @@ class InterviewPreparationEngine:
         star_examples: List[Dict[str, Any]],
         resume_data: Dict[str, Any]
     ):
-        """Create STAR example records."""
-        for star in star_examples:
-            star_record = STARExample(
-                id=str(uuid.uuid4()),
-                kit_id=kit_id,
-                user_id=user_id,
-                situation=star["situation"],
-                task=star["task"],
-                action=star["action"],
-                result=star["result"],
-                competency=star["competency"],
-                source_experience=json.dumps(resume_data.get("experience", [])),
-                relevance_score=star["relevance_score"]
-            )
-            db.add(star_record)
+        """Create STAR example records in one bulk INSERT."""
+        if not star_examples:
+            return
+        # Same source experience for every example in the kit
+        source_experience = resume_data.get("experience", [])
+        await db.execute(insert(STARExample), [
+            {
+                "id": star_id,
+                "kit_id": kit_id,
+                "user_id": user_id,
+                "situation": star["situation"],
+                "task": star["task"],
+                "action": star["action"],
+                "result": star["result"],
+                "competency": star["competency"],
+                "source_experience": source_experience,
+                "relevance_score": star["relevance_score"],
+            }
+            for star, star_id in zip(star_examples, uuid7_batch(len(star_examples)))
+        ])
     
     async def _analyze_user_answer(
         self,
@@ -764,22 +887,20 @@ class InterviewPreparationEngine:
         
         # Score based on length and content
         score = min(100, max(20, answer_length * 2))  # Basic scoring
+        is_specific = "I" in user_answer and _SPECIFIC_ANSWER_RE.search(user_answer) is not None
+        shows_strength = _STRENGTH_ANSWER_RE.search(user_answer) is not None
         
         feedback = {
             "score": score,
             "feedback": {
                 "overall": "Good structure and content" if score > 70 else "Consider adding more specific details",
                 "length": "Appropriate length" if 50 <= answer_length <= 200 else "Consider adjusting the length",
-                "specificity": "Good use of specific examples" if "I" in user_answer and ("project" in user_answer.lower() or "experience" in user_answer.lower()) else "Add more specific examples"
+                "specificity": "Good use of specific examples" if is_specific else "Add more specific examples"
             },
-            "suggestions": [
-                "Use the STAR method for behavioral questions",
-                "Include quantifiable results when possible",
-                "Connect your answer to the job requirements"
-            ],
+            "suggestions": list(_ANSWER_SUGGESTIONS),
             "strengths": [
                 "Clear communication" if answer_length > 30 else "Concise response",
-                "Relevant experience mentioned" if any(word in user_answer.lower() for word in ["project", "team", "developed", "implemented"]) else "Good foundation"
+                "Relevant experience mentioned" if shows_strength else "Good foundation"
             ]
         }
         
@@ -787,16 +908,35 @@ class InterviewPreparationEngine:
     
     async def _format_kit_response(self, kit: InterviewKit) -> Dict[str, Any]:
         """Format interview kit for API response."""
+        return self._kit_response(
+            kit,
+            kit.questions,
+            kit.talking_points,
+            kit.company_insights or {},
+            kit.star_examples or [],
+            kit.preparation_checklist or [],
+        )
+    
+    def _kit_response(
+        self,
+        kit: InterviewKit,
+        questions: List[Dict[str, Any]],
+        talking_points: List[str],
+        company_insights: Dict[str, Any],
+        star_examples: List[Dict[str, Any]],
+        preparation_checklist: List[str]
+    ) -> Dict[str, Any]:
+        """Build the kit response from already-decoded payloads."""
         return {
             "id": kit.id,
             "job_id": kit.job_id,
-            "questions": json.loads(kit.questions),
-            "talking_points": json.loads(kit.talking_points),
-            "company_insights": json.loads(kit.company_insights) if kit.company_insights else {},
-            "star_examples": json.loads(kit.star_examples) if kit.star_examples else [],
-            "preparation_checklist": json.loads(kit.preparation_checklist) if kit.preparation_checklist else [],
+            "questions": questions,
+            "talking_points": talking_points,
+            "company_insights": company_insights,
+            "star_examples": star_examples,
+            "preparation_checklist": preparation_checklist,
             "difficulty_level": kit.difficulty_level,
             "estimated_prep_time": kit.estimated_prep_time,
             "created_at": kit.created_at.isoformat(),
             "updated_at": kit.updated_at.isoformat() if kit.updated_at else None
-        }
\ No newline at end of file
+        }
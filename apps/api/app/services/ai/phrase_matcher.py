@@ -0,0 +1,63 @@
+"""
+Whole-word phrase matching for skill extraction.
+All phrases are found in one pass over the text: with a pyahocorasick
+automaton when it is installed, otherwise with a single alternation regex.
+"""
+from typing import Iterable, Iterator, Set, Tuple
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Try to import pyahocorasick, fall back to an alternation regex if not available
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.info("pyahocorasick not installed - skill phrases will be matched with a regex")
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as \\w for phrase word boundaries."""
+    return char.isalnum() or char == "_"
+
+
+class PhraseMatcher:
+    """Finds whole-word occurrences of a fixed set of lowercase phrases."""
+    
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = tuple(dict.fromkeys(phrases))
+        
+        # Longest first, so the regex prefers "machine learning" to "machine"
+        alternation = "|".join(
+            re.escape(phrase) for phrase in sorted(self.phrases, key=len, reverse=True)
+        )
+        self._regex = re.compile(r"(?<!\w)(?:" + alternation + r")(?!\w)")
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.phrases:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Yield (start offset, phrase) for each whole-word phrase in lowercased text."""
+        if not self.phrases:
+            return
+        if self._automaton is None:
+            for match in self._regex.finditer(text):
+                yield match.start(), match.group(0)
+            return
+        
+        for end, phrase in self._automaton.iter(text):
+            start = end - len(phrase) + 1
+            if (start == 0 or not _is_word_char(text[start - 1])) and (
+                end + 1 == len(text) or not _is_word_char(text[end + 1])
+            ):
+                yield start, phrase
+    
+    def find(self, text: str) -> Set[str]:
+        """Phrases occurring as whole words in lowercased text."""
+        return {phrase for _, phrase in self.finditer(text)}
@@ -2,9 +2,12 @@
 AI Resume Versioning Service.
 Handles job-specific resume optimization and version generation.
 """
-import json
+import functools
+import hashlib
+import orjson
 import time
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,9 +15,122 @@ from sqlalchemy import select
 from app.models.resume import Resume
 from app.models.job import JobPosting
 from app.models.ai_resume import AIResumeVersion, ResumeOptimizationLog
+from app.core.database import gather_reads
+from app.services.ai.phrase_matcher import PhraseMatcher
 import uuid
 
 
+def content_fingerprints(content: Dict[str, Any]) -> Dict[str, str]:
+    """
+    64-bit digest of each top-level resume field's canonical JSON.
+    
+    Two versions' fields are equal exactly when their digests match, so
+    comparisons don't need to walk nested sections. None-valued fields are
+    left out, matching how a missing field compares.
+    """
+    return {
+        key: hashlib.blake2b(
+            orjson.dumps(value, option=orjson.OPT_SORT_KEYS), digest_size=8
+        ).hexdigest()
+        for key, value in content.items()
+        if value is not None
+    }
+
+
+# Common technical skills, in reporting order
+TECH_SKILLS = (
+    "python", "javascript", "react", "node.js", "sql", "aws", "docker",
+    "kubernetes", "machine learning", "ai", "data science", "fastapi",
+    "postgresql", "mongodb", "redis", "git", "ci/cd", "devops"
+)
+
+# One pass over the (lowercased) job text for all skills, whole words only
+_TECH_SKILL_MATCHER = PhraseMatcher(TECH_SKILLS)
+_KEYWORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+
+# Keywords kept per job, in first-occurrence order
+MAX_JOB_KEYWORDS = 20
+
+# Job title words that get "Senior" added to the resume title
+_SENIOR_TITLE_WORDS = ("senior", "lead", "principal")
+
+# Sections an ATS expects, and the fields of a well-formed experience entry
+_REQUIRED_SECTIONS = ("name", "email", "experience", "skills")
+_EXPERIENCE_FORMAT_KEYS = ("company", "position", "duration")
+
+# Achievements filled in for experience entries that have none
+_DEFAULT_ACHIEVEMENTS = (
+    "Delivered high-quality solutions",
+    "Collaborated with cross-functional teams",
+    "Improved system performance"
+)
+
+# Sections reported as changed when comparing versions
+_COMPARED_SECTIONS = ("summary", "experience", "education")
+
+
+@functools.lru_cache(maxsize=1024)
+def _job_text_features(
+    description: Optional[str], requirements: Optional[str]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Skills and keywords found in a job's text, memoized on that text.
+    
+    The same posting is optimized for many users; results are tuples so
+    the cached value can't be mutated through a caller's requirements dict.
+    """
+    # Extract skills and keywords from job description and requirements
+    text = f"{description} {requirements}".lower()
+    
+    found = _TECH_SKILL_MATCHER.find(text)
+    skills = tuple(skill for skill in TECH_SKILLS if skill in found)
+    
+    # Extract keywords (simple approach), first occurrence order; stop
+    # scanning once the top 20 unique keywords are found
+    seen: Dict[str, None] = {}
+    for match in _KEYWORD_RE.finditer(text):
+        seen.setdefault(match.group(0), None)
+        if len(seen) >= MAX_JOB_KEYWORDS:
+            break
+    keywords = tuple(seen)
+    
+    return skills, keywords
+
+
+def _collect_tokens(obj: Any, out: set) -> set:
+    """Add the lowercased keyword tokens of every string leaf in obj to out."""
+    if isinstance(obj, str):
+        out.update(_KEYWORD_RE.findall(obj.lower()))
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _collect_tokens(value, out)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _collect_tokens(value, out)
+    return out
+
+
+@dataclass(frozen=True)
+class ScoringCtx:
+    """Lowercased skill sets and resume tokens shared by the scoring passes."""
+    job_skills_lc: frozenset
+    resume_skills_lc: frozenset
+    resume_tokens_lc: frozenset
+    job_title_tokens: frozenset
+    resume_title_tokens: frozenset
+    
+    @classmethod
+    def build(cls, content: Dict[str, Any], job_requirements: Dict[str, Any]) -> "ScoringCtx":
+        """Build the context once for an optimized resume and its job."""
+        return cls(
+            job_skills_lc=frozenset(s.lower() for s in job_requirements.get("skills", [])),
+            resume_skills_lc=frozenset(s.lower() for s in content.get("skills", [])),
+            resume_tokens_lc=frozenset(_collect_tokens(content, set())),
+            job_title_tokens=frozenset(_KEYWORD_RE.findall(job_requirements.get("title", "").lower())),
+            resume_title_tokens=frozenset(_KEYWORD_RE.findall(content.get("title", "").lower()))
+        )
+
+
 class ResumeVersioningEngine:
     """Core engine for AI-powered resume versioning."""
     
@@ -46,43 +162,16 @@ class ResumeVersioningEngine:
                     return await self._format_version_response(existing_version)
             
             # Get base resume and job posting
-            base_resume = await self._get_resume(db, base_resume_id, user_id)
-            job_posting = await self._get_job_posting(db, job_id)
+            base_resume, job_posting = await gather_reads(
+                db,
+                lambda session: self._get_resume(session, base_resume_id, user_id),
+                lambda session: self._get_job_posting(session, job_id),
+            )
             
             if not base_resume:
-                # PATCH 15: Log failure with null version_id
-                processing_time = int((time.time() - start_time) * 1000)
-                log_entry = ResumeOptimizationLog(
-                    id=str(uuid.uuid4()),
-                    version_id=None,
-                    user_id=user_id,
-                    operation_type="generate",
-                    processing_time_ms=processing_time,
-                    ai_parameters=json.dumps({"optimization_focus": optimization_focus}),
-                    optimization_focus=json.dumps(optimization_focus or []),
-                    success=False,
-                    error_message="Resume not found"
-                )
-                db.add(log_entry)
-                await db.commit()
                 raise ValueError("Resume not found")
             
             if not job_posting:
-                # PATCH 15: Log failure with null version_id
-                processing_time = int((time.time() - start_time) * 1000)
-                log_entry = ResumeOptimizationLog(
-                    id=str(uuid.uuid4()),
-                    version_id=None,
-                    user_id=user_id,
-                    operation_type="generate",
-                    processing_time_ms=processing_time,
-                    ai_parameters=json.dumps({"optimization_focus": optimization_focus}),
-                    optimization_focus=json.dumps(optimization_focus or []),
-                    success=False,
-                    error_message="Job posting not found"
-                )
-                db.add(log_entry)
-                await db.commit()
                 raise ValueError("Job posting not found")
             
             # Parse resume content
@@ -96,10 +185,11 @@ class ResumeVersioningEngine:
                 optimization_focus or ["keywords", "ats_score", "relevance"]
             )
             
-            # Calculate scores
-            ats_score = self._calculate_ats_score(optimized_content, job_requirements)
-            match_score = self._calculate_match_score(optimized_content, job_requirements)
-            keyword_analysis = self._analyze_keywords(optimized_content, job_requirements)
+            # Calculate scores (skill sets are lowercased once for all passes)
+            ctx = ScoringCtx.build(optimized_content, job_requirements)
+            ats_score = self._calculate_ats_score(optimized_content, job_requirements, ctx)
+            match_score = self._calculate_match_score(optimized_content, job_requirements, ctx)
+            keyword_analysis = self._analyze_keywords(optimized_content, job_requirements, ctx)
             
             # Generate explanation
             changes_explanation = self._generate_explanation(
@@ -112,60 +202,60 @@ class ResumeVersioningEngine:
                 user_id=user_id,
                 job_id=job_id,
                 base_resume_id=base_resume_id,
-                optimized_content=json.dumps(optimized_content),
+                optimized_content=optimized_content,
                 changes_explanation=changes_explanation,
                 ats_score=ats_score,
-                keyword_density=json.dumps(keyword_analysis),
+                keyword_density=keyword_analysis,
                 match_score=match_score,
-                formats=json.dumps({}),  # Will be populated by format converter
+                content_fingerprints=content_fingerprints(optimized_content),
+                formats={},  # Will be populated by format converter
                 version_number=1
             )
             
+            # Version and its log row commit together; the flush RETURNs
+            # server defaults (created_at), so no refresh is needed
             db.add(version)
-            await db.commit()
-            await db.refresh(version)
-            
-            # Log the successful operation in separate transaction
-            processing_time = int((time.time() - start_time) * 1000)
-            log_entry = ResumeOptimizationLog(
-                id=str(uuid.uuid4()),
-                version_id=version.id,
-                user_id=user_id,
-                operation_type="generate",
-                processing_time_ms=processing_time,
-                ai_parameters=json.dumps({"optimization_focus": optimization_focus}),
-                optimization_focus=json.dumps(optimization_focus or []),
-                success=True,
-                error_message=None
-            )
-            db.add(log_entry)
+            self._log_generation(db, user_id, start_time, optimization_focus, version_id=version.id)
             await db.commit()
             
             return await self._format_version_response(version)
             
         except ValueError as e:
-            # ValueError already logged above, just re-raise as HTTP exception
+            # PATCH 15: Log failure with null version_id
+            self._log_generation(db, user_id, start_time, optimization_focus, error=str(e))
+            await db.commit()
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             # PATCH 15: Log unexpected failures with null version_id
-            processing_time = int((time.time() - start_time) * 1000)
-            log_entry = ResumeOptimizationLog(
-                id=str(uuid.uuid4()),
-                version_id=None,
-                user_id=user_id,
-                operation_type="generate",
-                processing_time_ms=processing_time,
-                ai_parameters=json.dumps({"optimization_focus": optimization_focus}),
-                optimization_focus=json.dumps(optimization_focus or []),
-                success=False,
-                error_message=str(e)[:500]  # Truncate long error messages
-            )
-            db.add(log_entry)
+            await db.rollback()
+            self._log_generation(db, user_id, start_time, optimization_focus, error=str(e)[:500])  # Truncate long error messages
             await db.commit()
             from fastapi import HTTPException
             raise HTTPException(status_code=400, detail="Resume optimization failed")
     
+    def _log_generation(
+        self,
+        db: AsyncSession,
+        user_id: str,
+        start_time: float,
+        optimization_focus: Optional[List[str]],
+        version_id: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Add a generate log entry to the session; the caller commits."""
+        db.add(ResumeOptimizationLog(
+            id=str(uuid.uuid4()),
+            version_id=version_id,
+            user_id=user_id,
+            operation_type="generate",
+            processing_time_ms=int((time.time() - start_time) * 1000),
+            ai_parameters={"optimization_focus": optimization_focus},
+            optimization_focus=optimization_focus or [],
+            success=error is None,
+            error_message=error
+        ))
+    
     async def get_version(
         self, 
         db: AsyncSession, 
@@ -193,13 +283,15 @@ class ResumeVersioningEngine:
         if not version_a or not version_b:
             raise ValueError("One or both versions not found")
         
-        # Parse content
-        content_a = json.loads(version_a.optimized_content)
-        content_b = json.loads(version_b.optimized_content)
+        content_a = version_a.optimized_content
+        content_b = version_b.optimized_content
         
-        # Calculate differences
-        differences = self._calculate_differences(content_a, content_b)
-        similarity_score = self._calculate_similarity(content_a, content_b)
+        # Calculate differences (each top-level field is compared once for both)
+        changed = self._changed_fields(
+            content_a, content_b, version_a.content_fingerprints, version_b.content_fingerprints
+        )
+        differences = self._calculate_differences(content_a, content_b, changed)
+        similarity_score = self._calculate_similarity(content_a, content_b, changed)
         
         return {
             "version_a": {
@@ -238,8 +330,9 @@ class ResumeVersioningEngine:
                 AIResumeVersion.is_active == True
             )
             .order_by(AIResumeVersion.created_at.desc())
+            .limit(1)
         )
-        return result.scalar_one_or_none()
+        return result.scalars().first()
     
     async def _get_resume(
         self, db: AsyncSession, resume_id: str, user_id: str
@@ -279,39 +372,21 @@ class ResumeVersioningEngine:
         if not parsed_data:
             return {}
         try:
-            return json.loads(parsed_data)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(parsed_data)
+        except (orjson.JSONDecodeError, TypeError):
             return {}
     
     def _parse_job_requirements(self, job_posting: JobPosting) -> Dict[str, Any]:
         """Parse job requirements and extract key information."""
-        requirements = {
+        skills, keywords = _job_text_features(job_posting.description, job_posting.requirements)
+        return {
             "title": job_posting.title,
             "company": job_posting.company,
             "description": job_posting.description,
             "requirements": job_posting.requirements,
-            "skills": [],
-            "keywords": []
+            "skills": list(skills),
+            "keywords": list(keywords)
         }
-        
-        # Extract skills and keywords from job description and requirements
-        text = f"{job_posting.description} {job_posting.requirements}".lower()
-        
-        # Common technical skills
-        tech_skills = [
-            "python", "javascript", "react", "node.js", "sql", "aws", "docker", 
-            "kubernetes", "machine learning", "ai", "data science", "fastapi",
-            "postgresql", "mongodb", "redis", "git", "ci/cd", "devops"
-        ]
-        
-        found_skills = [skill for skill in tech_skills if skill in text]
-        requirements["skills"] = found_skills
-        
-        # Extract keywords (simple approach)
-        keywords = re.findall(r'\b[a-zA-Z]{3,}\b', text)
-        requirements["keywords"] = list(set(keywords))[:20]  # Top 20 keywords
-        
-        return requirements
     
     async def _optimize_resume(
         self, 
@@ -319,7 +394,13 @@ class ResumeVersioningEngine:
         job_requirements: Dict[str, Any],
         optimization_focus: List[str]
     ) -> Dict[str, Any]:
-        """Optimize resume content for the specific job."""
+        """
+        Optimize resume content for the specific job.
+        
+        Strategies update the shallow copy in place and replace (never
+        mutate) nested lists and dicts they change, so resume_content stays
+        intact and a strategy with nothing to do allocates nothing.
+        """
         optimized = resume_content.copy()
         
         for strategy in optimization_focus:
@@ -335,23 +416,29 @@ class ResumeVersioningEngine:
     ) -> Dict[str, Any]:
         """Optimize keyword density and relevance."""
         job_skills = job_requirements.get("skills", [])
-        job_keywords = job_requirements.get("keywords", [])
         
         # Enhance summary with relevant keywords
         if "summary" in content:
             summary = content["summary"]
+            summary_lc = summary.lower()
             for skill in job_skills[:3]:  # Add top 3 relevant skills
-                if skill.lower() not in summary.lower():
-                    summary += f" Experienced with {skill}."
+                if skill.lower() not in summary_lc:
+                    addition = f" Experienced with {skill}."
+                    summary += addition
+                    summary_lc += addition.lower()
             content["summary"] = summary
         
         # Enhance skills section
         if "skills" in content:
-            current_skills = content["skills"]
+            present = {s.lower() for s in content["skills"]}
+            to_add = []
             for skill in job_skills:
-                if skill not in [s.lower() for s in current_skills]:
-                    current_skills.append(skill.title())
-            content["skills"] = current_skills
+                skill_lc = skill.lower()
+                if skill_lc not in present:
+                    to_add.append(skill.title())
+                    present.add(skill_lc)
+            if to_add:
+                content["skills"] = content["skills"] + to_add
         
         return content
     
@@ -360,14 +447,12 @@ class ResumeVersioningEngine:
     ) -> Dict[str, Any]:
         """Optimize for ATS compatibility."""
         # Ensure proper section headers
-        if "experience" in content:
-            for exp in content["experience"]:
-                if "achievements" not in exp:
-                    exp["achievements"] = [
-                        "Delivered high-quality solutions",
-                        "Collaborated with cross-functional teams",
-                        "Improved system performance"
-                    ]
+        experience = content.get("experience")
+        if experience and any("achievements" not in exp for exp in experience):
+            content["experience"] = [
+                exp if "achievements" in exp else {**exp, "achievements": list(_DEFAULT_ACHIEVEMENTS)}
+                for exp in experience
+            ]
         
         # Add relevant certifications section if missing
         if "certifications" not in content:
@@ -382,10 +467,9 @@ class ResumeVersioningEngine:
         job_title = job_requirements.get("title", "").lower()
         
         # Adjust professional title to match job
-        if "title" in content:
-            if any(word in job_title for word in ["senior", "lead", "principal"]):
-                if "senior" not in content["title"].lower():
-                    content["title"] = f"Senior {content['title']}"
+        if "title" in content and any(word in job_title for word in _SENIOR_TITLE_WORDS):
+            if "senior" not in content["title"].lower():
+                content["title"] = f"Senior {content['title']}"
         
         return content
     
@@ -394,39 +478,44 @@ class ResumeVersioningEngine:
     ) -> Dict[str, Any]:
         """Optimize formatting and structure."""
         # Ensure consistent formatting
-        if "experience" in content:
-            for exp in content["experience"]:
-                if "description" in exp and not exp["description"].endswith("."):
-                    exp["description"] += "."
+        experience = content.get("experience")
+        if experience and any(
+            "description" in exp and not exp["description"].endswith(".") for exp in experience
+        ):
+            content["experience"] = [
+                {**exp, "description": exp["description"] + "."}
+                if "description" in exp and not exp["description"].endswith(".") else exp
+                for exp in experience
+            ]
         
         return content
     
     def _calculate_ats_score(
-        self, content: Dict[str, Any], job_requirements: Dict[str, Any]
+        self,
+        content: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        ctx: Optional[ScoringCtx] = None
     ) -> float:
         """Calculate ATS compatibility score."""
+        ctx = ctx or ScoringCtx.build(content, job_requirements)
         score = 0.0
         
         # Check for required sections (40 points)
-        required_sections = ["name", "email", "experience", "skills"]
-        for section in required_sections:
+        for section in _REQUIRED_SECTIONS:
             if section in content and content[section]:
                 score += 10
         
         # Check keyword match (30 points)
-        job_skills = [s.lower() for s in job_requirements.get("skills", [])]
-        resume_skills = [s.lower() for s in content.get("skills", [])]
-        
-        if job_skills:
-            skill_match_ratio = len(set(job_skills) & set(resume_skills)) / len(job_skills)
+        if ctx.job_skills_lc:
+            skill_match_ratio = len(ctx.job_skills_lc & ctx.resume_skills_lc) / len(ctx.job_skills_lc)
             score += skill_match_ratio * 30
         
         # Check formatting (20 points)
-        if "experience" in content:
-            for exp in content["experience"]:
-                if all(key in exp for key in ["company", "position", "duration"]):
-                    score += 5
-                    break
+        if any(
+            all(key in exp for key in _EXPERIENCE_FORMAT_KEYS)
+            for exp in content.get("experience", [])
+        ):
+            score += 5
         
         # Check contact info (10 points)
         if "phone" in content and "email" in content:
@@ -435,24 +524,22 @@ class ResumeVersioningEngine:
         return min(score, 100.0)
     
     def _calculate_match_score(
-        self, content: Dict[str, Any], job_requirements: Dict[str, Any]
+        self,
+        content: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        ctx: Optional[ScoringCtx] = None
     ) -> float:
         """Calculate job match score."""
+        ctx = ctx or ScoringCtx.build(content, job_requirements)
         score = 0.0
         
         # Skills match (60 points)
-        job_skills = [s.lower() for s in job_requirements.get("skills", [])]
-        resume_skills = [s.lower() for s in content.get("skills", [])]
-        
-        if job_skills:
-            skill_match_ratio = len(set(job_skills) & set(resume_skills)) / len(job_skills)
+        if ctx.job_skills_lc:
+            skill_match_ratio = len(ctx.job_skills_lc & ctx.resume_skills_lc) / len(ctx.job_skills_lc)
             score += skill_match_ratio * 60
         
-        # Experience relevance (25 points)
-        job_title = job_requirements.get("title", "").lower()
-        resume_title = content.get("title", "").lower()
-        
-        if any(word in resume_title for word in job_title.split()):
+        # Experience relevance (25 points), on whole title words
+        if ctx.job_title_tokens & ctx.resume_title_tokens:
             score += 25
         
         # Education match (15 points)
@@ -462,11 +549,15 @@ class ResumeVersioningEngine:
         return min(score, 100.0)
     
     def _analyze_keywords(
-        self, content: Dict[str, Any], job_requirements: Dict[str, Any]
+        self,
+        content: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        ctx: Optional[ScoringCtx] = None
     ) -> Dict[str, Any]:
         """Analyze keyword density and coverage."""
+        ctx = ctx or ScoringCtx.build(content, job_requirements)
         job_keywords = job_requirements.get("keywords", [])
-        resume_text = json.dumps(content).lower()
+        resume_tokens = ctx.resume_tokens_lc
         
         keyword_analysis = {
             "total_keywords": len(job_keywords),
@@ -476,7 +567,7 @@ class ResumeVersioningEngine:
         }
         
         for keyword in job_keywords:
-            if keyword.lower() in resume_text:
+            if keyword.lower() in resume_tokens:
                 keyword_analysis["matched_keywords"].append(keyword)
             else:
                 keyword_analysis["missing_keywords"].append(keyword)
@@ -497,10 +588,12 @@ class ResumeVersioningEngine:
         """Generate explanation of changes made."""
         changes = []
         
-        # Check for skill additions
+        # Check for skill additions, in the order they appear in the resume
         original_skills = set(s.lower() for s in original.get("skills", []))
-        optimized_skills = set(s.lower() for s in optimized.get("skills", []))
-        new_skills = optimized_skills - original_skills
+        new_skills = [
+            skill for skill in dict.fromkeys(s.lower() for s in optimized.get("skills", []))
+            if skill not in original_skills
+        ]
         
         if new_skills:
             changes.append(f"Added relevant skills: {', '.join(new_skills)}")
@@ -509,23 +602,45 @@ class ResumeVersioningEngine:
         if original.get("summary") != optimized.get("summary"):
             changes.append("Enhanced professional summary with job-relevant keywords")
         
-        # Check for experience enhancements
-        if "experience" in optimized:
-            for i, exp in enumerate(optimized["experience"]):
-                if i < len(original.get("experience", [])):
-                    if exp.get("achievements") != original["experience"][i].get("achievements"):
-                        changes.append("Enhanced experience descriptions with quantifiable achievements")
-                        break
+        # Check for experience enhancements (stops at the first changed entry)
+        if any(
+            exp.get("achievements") != original_exp.get("achievements")
+            for exp, original_exp in zip(optimized.get("experience", []), original.get("experience", []))
+        ):
+            changes.append("Enhanced experience descriptions with quantifiable achievements")
         
         if not changes:
             changes.append("Optimized content structure and keyword density for better ATS compatibility")
         
         return ". ".join(changes) + "."
     
+    def _changed_fields(
+        self,
+        content_a: Dict[str, Any],
+        content_b: Dict[str, Any],
+        fingerprints_a: Optional[Dict[str, str]] = None,
+        fingerprints_b: Optional[Dict[str, str]] = None
+    ) -> frozenset:
+        """Top-level fields whose values differ between two resume versions."""
+        # Versions saved before fingerprints were stored get them computed here
+        if fingerprints_a is None:
+            fingerprints_a = content_fingerprints(content_a)
+        if fingerprints_b is None:
+            fingerprints_b = content_fingerprints(content_b)
+        return frozenset(
+            key for key in fingerprints_a.keys() | fingerprints_b.keys()
+            if fingerprints_a.get(key) != fingerprints_b.get(key)
+        )
+    
     def _calculate_differences(
-        self, content_a: Dict[str, Any], content_b: Dict[str, Any]
+        self,
+        content_a: Dict[str, Any],
+        content_b: Dict[str, Any],
+        changed: Optional[frozenset] = None
     ) -> Dict[str, Any]:
         """Calculate differences between two resume versions."""
+        if changed is None:
+            changed = self._changed_fields(content_a, content_b)
         differences = {
             "sections_changed": [],
             "skills_added": [],
@@ -533,34 +648,33 @@ class ResumeVersioningEngine:
             "content_changes": []
         }
         
-        # Compare skills
-        skills_a = set(s.lower() for s in content_a.get("skills", []))
-        skills_b = set(s.lower() for s in content_b.get("skills", []))
+        # Compare skills (dicts keep each version's skill order)
+        skills_a = dict.fromkeys(s.lower() for s in content_a.get("skills", []))
+        skills_b = dict.fromkeys(s.lower() for s in content_b.get("skills", []))
         
-        differences["skills_added"] = list(skills_b - skills_a)
-        differences["skills_removed"] = list(skills_a - skills_b)
+        differences["skills_added"] = [s for s in skills_b if s not in skills_a]
+        differences["skills_removed"] = [s for s in skills_a if s not in skills_b]
         
         # Compare sections
-        for section in ["summary", "experience", "education"]:
-            if content_a.get(section) != content_b.get(section):
-                differences["sections_changed"].append(section)
+        differences["sections_changed"] = [
+            section for section in _COMPARED_SECTIONS if section in changed
+        ]
         
         return differences
     
     def _calculate_similarity(
-        self, content_a: Dict[str, Any], content_b: Dict[str, Any]
+        self,
+        content_a: Dict[str, Any],
+        content_b: Dict[str, Any],
+        changed: Optional[frozenset] = None
     ) -> float:
         """Calculate similarity score between two resume versions."""
-        # Simple similarity based on common fields
-        total_fields = 0
-        matching_fields = 0
+        if changed is None:
+            changed = self._changed_fields(content_a, content_b)
         
-        all_keys = set(content_a.keys()) | set(content_b.keys())
-        
-        for key in all_keys:
-            total_fields += 1
-            if content_a.get(key) == content_b.get(key):
-                matching_fields += 1
+        # Simple similarity based on common fields
+        total_fields = len(content_a.keys() | content_b.keys())
+        matching_fields = total_fields - len(changed)
         
         return (matching_fields / total_fields * 100) if total_fields > 0 else 0.0
     
@@ -582,8 +696,8 @@ class ResumeVersioningEngine:
             user_id=user_id,
             operation_type=operation_type,
             processing_time_ms=processing_time,
-            ai_parameters=json.dumps({"optimization_focus": optimization_focus}),
-            optimization_focus=json.dumps(optimization_focus or []),
+            ai_parameters={"optimization_focus": optimization_focus},
+            optimization_focus=optimization_focus or [],
             success=success,
             error_message=error_message
         )
@@ -597,12 +711,12 @@ class ResumeVersioningEngine:
             "id": version.id,
             "job_id": version.job_id,
             "base_resume_id": version.base_resume_id,
-            "optimized_content": json.loads(version.optimized_content),
+            "optimized_content": version.optimized_content,
             "changes_explanation": version.changes_explanation,
             "ats_score": version.ats_score,
             "match_score": version.match_score,
-            "keyword_density": json.loads(version.keyword_density) if version.keyword_density else {},
-            "formats": json.loads(version.formats) if version.formats else {},
+            "keyword_density": version.keyword_density or {},
+            "formats": version.formats or {},
             "version_number": version.version_number,
             "created_at": version.created_at.isoformat(),
             "updated_at": version.updated_at.isoformat() if version.updated_at else None
@@ -2,75 +2,218 @@
 AI Skill Gap Analysis Service.
 Handles skill gap identification, learning recommendations, and progress tracking.
 """
-import json
+import bisect
+import functools
+import hashlib
+import orjson
 import time
 import re
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import numpy as np
 from app.models.resume import Resume
 from app.models.job import JobPosting
 from app.models.ai_skills import (
     SkillGapAnalysis, SkillGap, LearningResource, 
-    SkillProgressTracking, SkillMarketData, LearningPath
+    SkillProgressTracking, SkillProgressFeedback, SkillMarketData, LearningPath,
+    SKILL_CATEGORIES, IMPORTANCE_LEVELS, DIFFICULTY_LEVELS, RESOURCE_TYPES
+)
+from app.core.ids import uuid7, uuid7_batch
+from app.core.json import dumps_text
+from app.services.ai.phrase_matcher import PhraseMatcher
+from app.services.ai.skill_kernels import (
+    encode_importance, gap_scores, learning_hours, priority_scores, readiness_score
 )
 import uuid
 
 
+# Words in a job text that mark a nearby skill as critical or nice-to-have
+_CUE_RE = re.compile(r"\b(required|must|essential|nice|plus|preferred)\b")
+_NICE_TO_HAVE_CUES = frozenset(("nice", "plus", "preferred"))
+
+# How far (in characters) a cue may be from a skill mention to apply to it
+CUE_WINDOW = 60
+
+# Topics within each skill category
+_SKILL_CATEGORY_TOPICS = MappingProxyType({
+    "technical": ["programming", "frameworks", "databases", "cloud", "devops"],
+    "soft": ["leadership", "communication", "problem-solving", "teamwork"],
+    "certification": ["aws", "azure", "google cloud", "kubernetes", "security"],
+    "domain": ["machine learning", "data science", "web development", "mobile"]
+})
+
+# Known skills with category, difficulty and market data, in reporting order
+_SKILL_DB = MappingProxyType({
+    # Programming Languages
+    "python": {"category": "technical", "difficulty": "intermediate", "market_demand": 95, "avg_salary_impact": 15000},
+    "javascript": {"category": "technical", "difficulty": "intermediate", "market_demand": 92, "avg_salary_impact": 12000},
+    "typescript": {"category": "technical", "difficulty": "intermediate", "market_demand": 88, "avg_salary_impact": 14000},
+    "java": {"category": "technical", "difficulty": "intermediate", "market_demand": 85, "avg_salary_impact": 13000},
+    "go": {"category": "technical", "difficulty": "advanced", "market_demand": 78, "avg_salary_impact": 18000},
+    "rust": {"category": "technical", "difficulty": "advanced", "market_demand": 72, "avg_salary_impact": 20000},
+    
+    # Frameworks & Libraries
+    "react": {"category": "technical", "difficulty": "intermediate", "market_demand": 90, "avg_salary_impact": 10000},
+    "node.js": {"category": "technical", "difficulty": "intermediate", "market_demand": 87, "avg_salary_impact": 11000},
+    "fastapi": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 12000},
+    "django": {"category": "technical", "difficulty": "intermediate", "market_demand": 80, "avg_salary_impact": 11000},
+    "angular": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 10000},
+    "vue.js": {"category": "technical", "difficulty": "intermediate", "market_demand": 70, "avg_salary_impact": 9000},
+    
+    # Cloud & DevOps
+    "aws": {"category": "technical", "difficulty": "intermediate", "market_demand": 93, "avg_salary_impact": 16000},
+    "docker": {"category": "technical", "difficulty": "intermediate", "market_demand": 89, "avg_salary_impact": 12000},
+    "kubernetes": {"category": "technical", "difficulty": "advanced", "market_demand": 85, "avg_salary_impact": 18000},
+    "terraform": {"category": "technical", "difficulty": "intermediate", "market_demand": 82, "avg_salary_impact": 15000},
+    "jenkins": {"category": "technical", "difficulty": "intermediate", "market_demand": 78, "avg_salary_impact": 10000},
+    
+    # Databases
+    "postgresql": {"category": "technical", "difficulty": "intermediate", "market_demand": 85, "avg_salary_impact": 8000},
+    "mongodb": {"category": "technical", "difficulty": "intermediate", "market_demand": 80, "avg_salary_impact": 7000},
+    "redis": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 6000},
+    
+    # Soft Skills
+    "leadership": {"category": "soft", "difficulty": "advanced", "market_demand": 95, "avg_salary_impact": 25000},
+    "communication": {"category": "soft", "difficulty": "intermediate", "market_demand": 98, "avg_salary_impact": 15000},
+    "problem-solving": {"category": "soft", "difficulty": "intermediate", "market_demand": 97, "avg_salary_impact": 12000},
+    "teamwork": {"category": "soft", "difficulty": "beginner", "market_demand": 95, "avg_salary_impact": 8000},
+    "project management": {"category": "soft", "difficulty": "intermediate", "market_demand": 90, "avg_salary_impact": 18000},
+    
+    # Emerging Technologies
+    "machine learning": {"category": "domain", "difficulty": "advanced", "market_demand": 88, "avg_salary_impact": 22000},
+    "ai": {"category": "domain", "difficulty": "advanced", "market_demand": 92, "avg_salary_impact": 25000},
+    "data science": {"category": "domain", "difficulty": "advanced", "market_demand": 85, "avg_salary_impact": 20000},
+    "blockchain": {"category": "domain", "difficulty": "advanced", "market_demand": 65, "avg_salary_impact": 15000}
+})
+
+# Every known skill is found in one pass over a job or resume text
+_SKILL_MATCHER = PhraseMatcher(_SKILL_DB)
+
+# Hours to learn a skill from scratch, by difficulty
+_BASE_LEARNING_HOURS = {"beginner": 20, "intermediate": 40, "advanced": 80}
+
+# Skill info for skills missing from the skill database
+_DEFAULT_SKILL_INFO = MappingProxyType({
+    "category": "technical",
+    "difficulty": "intermediate",
+    "market_demand": 70,
+    "avg_salary_impact": 10000
+})
+
+
+def _frozen_resources(resources: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Resources as read-only mappings, safe to share between callers."""
+    return tuple(MappingProxyType(resource) for resource in resources)
+
+
+# Sample learning resources by skill (would typically come from a resource database)
+_LEARNING_RESOURCES = MappingProxyType({
+    "python": _frozen_resources([
+        {"title": "Python Crash Course", "provider": "No Starch Press", "type": "book", "hours": 40, "relevance": 95, "priority": 1, "rating": 4.8},
+        {"title": "Python for Everybody", "provider": "Coursera", "type": "course", "hours": 30, "relevance": 90, "priority": 2, "rating": 4.7},
+        {"title": "Real Python Tutorials", "provider": "Real Python", "type": "tutorial", "hours": 20, "relevance": 85, "priority": 3, "rating": 4.6}
+    ]),
+    "javascript": _frozen_resources([
+        {"title": "JavaScript: The Definitive Guide", "provider": "O'Reilly", "type": "book", "hours": 50, "relevance": 95, "priority": 1, "rating": 4.7},
+        {"title": "JavaScript Algorithms and Data Structures", "provider": "freeCodeCamp", "type": "course", "hours": 35, "relevance": 90, "priority": 2, "rating": 4.8},
+        {"title": "MDN JavaScript Guide", "provider": "Mozilla", "type": "tutorial", "hours": 25, "relevance": 85, "priority": 3, "rating": 4.5}
+    ]),
+    "react": _frozen_resources([
+        {"title": "React - The Complete Guide", "provider": "Udemy", "type": "course", "hours": 45, "relevance": 95, "priority": 1, "rating": 4.8},
+        {"title": "Official React Tutorial", "provider": "React.dev", "type": "tutorial", "hours": 15, "relevance": 90, "priority": 2, "rating": 4.6},
+        {"title": "React Hooks in Action", "provider": "Manning", "type": "book", "hours": 30, "relevance": 85, "priority": 3, "rating": 4.5}
+    ]),
+    "aws": _frozen_resources([
+        {"title": "AWS Certified Solutions Architect", "provider": "AWS", "type": "certification", "hours": 60, "relevance": 95, "priority": 1, "rating": 4.7},
+        {"title": "AWS Cloud Practitioner Essentials", "provider": "AWS", "type": "course", "hours": 25, "relevance": 90, "priority": 2, "rating": 4.6},
+        {"title": "AWS Hands-On Labs", "provider": "AWS", "type": "practice", "hours": 40, "relevance": 85, "priority": 3, "rating": 4.5}
+    ])
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _learning_resources(skill_name: str) -> Tuple[Mapping[str, Any], ...]:
+    """Resources for a skill, or generic ones named after it; shared, so read-only."""
+    return _LEARNING_RESOURCES.get(skill_name) or _frozen_resources([
+        {"title": f"Complete {skill_name.title()} Guide", "provider": "Online Learning", "type": "course", "hours": 30, "relevance": 80, "priority": 1, "rating": 4.0},
+        {"title": f"{skill_name.title()} Documentation", "provider": "Official Docs", "type": "tutorial", "hours": 15, "relevance": 75, "priority": 2, "rating": 4.2},
+        {"title": f"Hands-on {skill_name.title()} Projects", "provider": "Practice Platform", "type": "practice", "hours": 25, "relevance": 85, "priority": 3, "rating": 4.1}
+    ])
+
+
+def _nearest_cue(
+    cue_offsets: List[int], cue_importance: List[str], offset: int
+) -> Tuple[int, Optional[str]]:
+    """Distance to and importance of the closest cue within CUE_WINDOW of offset."""
+    i = bisect.bisect_left(cue_offsets, offset)
+    best = (CUE_WINDOW + 1, None)
+    for j in (i - 1, i):
+        if 0 <= j < len(cue_offsets):
+            distance = abs(cue_offsets[j] - offset)
+            if distance < best[0]:
+                best = (distance, cue_importance[j])
+    return best
+
+
+@functools.lru_cache(maxsize=1024)
+def _required_skill_mentions(
+    description: Optional[str], requirements: Optional[str]
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    (skill name, importance) for each known skill a job's text mentions.
+    
+    Many users analyze the same posting, so the scan is memoized on its
+    text; results are tuples so the cached value can't be mutated.
+    """
+    # Combine description and requirements text
+    text = f"{description} {requirements}".lower()
+    
+    # Cue words in one pass, in text order for bisecting
+    cue_offsets, cue_importance = [], []
+    for match in _CUE_RE.finditer(text):
+        cue_offsets.append(match.start())
+        cue_importance.append("nice-to-have" if match.group(1) in _NICE_TO_HAVE_CUES else "critical")
+    
+    # Each skill takes the importance of the cue nearest any of its mentions
+    nearest: Dict[str, Tuple[int, Optional[str]]] = {}
+    for offset, skill_name in _SKILL_MATCHER.finditer(text):
+        cue = _nearest_cue(cue_offsets, cue_importance, offset)
+        if skill_name not in nearest or cue[0] < nearest[skill_name][0]:
+            nearest[skill_name] = cue
+    
+    # In database order; skills without a nearby cue are "important"
+    return tuple(
+        (skill_name, nearest[skill_name][1] or "important")
+        for skill_name in _SKILL_DB if skill_name in nearest
+    )
+
+
+def analysis_content_hash(resume: Resume, job_posting: JobPosting) -> str:
+    """
+    SHA-256 of the resume and job text an analysis is computed from.
+    
+    An analysis whose stored hash matches is still current, so it can be
+    returned without re-extracting and diffing skills.
+    """
+    digest = hashlib.sha256()
+    for part in (
+        resume.parsed_data, job_posting.title, job_posting.description, job_posting.requirements
+    ):
+        digest.update((part or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 class SkillAnalyzerEngine:
     """Core engine for AI-powered skill gap analysis."""
     
-    def __init__(self):
-        self.skill_categories = {
-            "technical": ["programming", "frameworks", "databases", "cloud", "devops"],
-            "soft": ["leadership", "communication", "problem-solving", "teamwork"],
-            "certification": ["aws", "azure", "google cloud", "kubernetes", "security"],
-            "domain": ["machine learning", "data science", "web development", "mobile"]
-        }
-        
-        self.skill_database = {
-            # Programming Languages
-            "python": {"category": "technical", "difficulty": "intermediate", "market_demand": 95, "avg_salary_impact": 15000},
-            "javascript": {"category": "technical", "difficulty": "intermediate", "market_demand": 92, "avg_salary_impact": 12000},
-            "typescript": {"category": "technical", "difficulty": "intermediate", "market_demand": 88, "avg_salary_impact": 14000},
-            "java": {"category": "technical", "difficulty": "intermediate", "market_demand": 85, "avg_salary_impact": 13000},
-            "go": {"category": "technical", "difficulty": "advanced", "market_demand": 78, "avg_salary_impact": 18000},
-            "rust": {"category": "technical", "difficulty": "advanced", "market_demand": 72, "avg_salary_impact": 20000},
-            
-            # Frameworks & Libraries
-            "react": {"category": "technical", "difficulty": "intermediate", "market_demand": 90, "avg_salary_impact": 10000},
-            "node.js": {"category": "technical", "difficulty": "intermediate", "market_demand": 87, "avg_salary_impact": 11000},
-            "fastapi": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 12000},
-            "django": {"category": "technical", "difficulty": "intermediate", "market_demand": 80, "avg_salary_impact": 11000},
-            "angular": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 10000},
-            "vue.js": {"category": "technical", "difficulty": "intermediate", "market_demand": 70, "avg_salary_impact": 9000},
-            
-            # Cloud & DevOps
-            "aws": {"category": "technical", "difficulty": "intermediate", "market_demand": 93, "avg_salary_impact": 16000},
-            "docker": {"category": "technical", "difficulty": "intermediate", "market_demand": 89, "avg_salary_impact": 12000},
-            "kubernetes": {"category": "technical", "difficulty": "advanced", "market_demand": 85, "avg_salary_impact": 18000},
-            "terraform": {"category": "technical", "difficulty": "intermediate", "market_demand": 82, "avg_salary_impact": 15000},
-            "jenkins": {"category": "technical", "difficulty": "intermediate", "market_demand": 78, "avg_salary_impact": 10000},
-            
-            # Databases
-            "postgresql": {"category": "technical", "difficulty": "intermediate", "market_demand": 85, "avg_salary_impact": 8000},
-            "mongodb": {"category": "technical", "difficulty": "intermediate", "market_demand": 80, "avg_salary_impact": 7000},
-            "redis": {"category": "technical", "difficulty": "intermediate", "market_demand": 75, "avg_salary_impact": 6000},
-            
-            # Soft Skills
-            "leadership": {"category": "soft", "difficulty": "advanced", "market_demand": 95, "avg_salary_impact": 25000},
-            "communication": {"category": "soft", "difficulty": "intermediate", "market_demand": 98, "avg_salary_impact": 15000},
-            "problem-solving": {"category": "soft", "difficulty": "intermediate", "market_demand": 97, "avg_salary_impact": 12000},
-            "teamwork": {"category": "soft", "difficulty": "beginner", "market_demand": 95, "avg_salary_impact": 8000},
-            "project management": {"category": "soft", "difficulty": "intermediate", "market_demand": 90, "avg_salary_impact": 18000},
-            
-            # Emerging Technologies
-            "machine learning": {"category": "domain", "difficulty": "advanced", "market_demand": 88, "avg_salary_impact": 22000},
-            "ai": {"category": "domain", "difficulty": "advanced", "market_demand": 92, "avg_salary_impact": 25000},
-            "data science": {"category": "domain", "difficulty": "advanced", "market_demand": 85, "avg_salary_impact": 20000},
-            "blockchain": {"category": "domain", "difficulty": "advanced", "market_demand": 65, "avg_salary_impact": 15000}
-        }
+    # Shared read-only reference data
+    skill_categories = _SKILL_CATEGORY_TOPICS
+    skill_database = _SKILL_DB
     
     async def analyze_skill_gaps(
         self,
@@ -84,12 +227,6 @@ class SkillAnalyzerEngine:
         start_time = time.time()
         
         try:
-            # Check if analysis already exists
-            if not regenerate:
-                existing_analysis = await self._get_existing_analysis(db, user_id, job_id)
-                if existing_analysis:
-                    return await self._format_analysis_response(existing_analysis)
-            
             # Get user resume and job posting
             user_resume = await self._get_user_resume(db, user_id)
             job_posting = await self._get_job_posting(db, job_id)
@@ -97,6 +234,15 @@ class SkillAnalyzerEngine:
             if not user_resume or not job_posting:
                 raise ValueError("Resume or job posting not found")
             
+            # Reuse an analysis of the same resume and job text
+            content_hash = analysis_content_hash(user_resume, job_posting)
+            if not regenerate:
+                existing_analysis = await self._get_existing_analysis(
+                    db, user_id, job_id, content_hash=content_hash
+                )
+                if existing_analysis:
+                    return await self._format_analysis_response(existing_analysis)
+            
             # Parse data
             resume_data = self._parse_resume_content(user_resume.parsed_data)
             job_requirements = self._parse_job_requirements(job_posting)
@@ -131,11 +277,12 @@ class SkillAnalyzerEngine:
                 id=str(uuid.uuid4()),
                 user_id=user_id,
                 job_id=job_id,
-                missing_skills=json.dumps(skill_gaps),
-                learning_recommendations=json.dumps(learning_recommendations),
-                estimated_timeline=json.dumps(timeline_data),
-                priority_score=json.dumps(priority_scores),
-                market_demand=json.dumps(market_data),
+                missing_skills=skill_gaps,
+                learning_recommendations=learning_recommendations,
+                estimated_timeline=timeline_data,
+                priority_score=priority_scores,
+                market_demand=market_data,
+                content_hash=content_hash,
                 total_missing_skills=total_missing_skills,
                 critical_skills_count=critical_skills_count,
                 estimated_total_hours=estimated_total_hours,
@@ -146,10 +293,10 @@ class SkillAnalyzerEngine:
             await db.flush()
             
             # Create individual skill gap records
-            await self._create_skill_gap_records(db, analysis.id, user_id, skill_gaps, market_data)
+            gap_ids = await self._create_skill_gap_records(db, analysis.id, user_id, skill_gaps, market_data)
             
             # Create learning resource records
-            await self._create_learning_resource_records(db, user_id, skill_gaps, learning_recommendations)
+            await self._create_learning_resource_records(db, user_id, gap_ids, learning_recommendations)
             
             # Generate learning path
             learning_path = await self._generate_learning_path(
@@ -188,46 +335,50 @@ class SkillAnalyzerEngine:
     ) -> Dict[str, Any]:
         """Update user's progress on a specific skill."""
         try:
-            # Get or create progress tracking record
-            result = await db.execute(
-                select(SkillProgressTracking).where(
-                    SkillProgressTracking.user_id == user_id,
-                    SkillProgressTracking.skill_name == skill_name
-                )
-            )
-            progress_record = result.scalar_one_or_none()
-            
-            if not progress_record:
-                progress_record = SkillProgressTracking(
-                    id=str(uuid.uuid4()),
-                    user_id=user_id,
-                    skill_name=skill_name,
-                    current_level=0.0,
-                    progress_percentage=0.0
-                )
-                db.add(progress_record)
-            
-            # Update progress data
-            progress_record.previous_level = progress_record.current_level
-            progress_record.current_level = progress_data.get("current_level", progress_record.current_level)
-            progress_record.progress_percentage = progress_data.get("progress_percentage", progress_record.progress_percentage)
-            progress_record.hours_invested = progress_data.get("hours_invested", progress_record.hours_invested)
-            progress_record.resources_completed = progress_data.get("resources_completed", progress_record.resources_completed)
-            
+            # One upsert on (user_id, skill_name): insert a fresh record or
+            # update the existing one in place, with no read beforehand
+            updates = {
+                key: progress_data[key]
+                for key in ("current_level", "progress_percentage", "hours_invested", "resources_completed")
+                if key in progress_data
+            }
             if progress_data.get("certifications_earned"):
-                progress_record.certifications_earned = json.dumps(progress_data["certifications_earned"])
-            
+                updates["certifications_earned"] = dumps_text(progress_data["certifications_earned"])
             if progress_data.get("self_assessment_score"):
-                progress_record.self_assessment_score = progress_data["self_assessment_score"]
-            
+                updates["self_assessment_score"] = progress_data["self_assessment_score"]
             if progress_data.get("progress_notes"):
-                progress_record.progress_notes = progress_data["progress_notes"]
+                updates["progress_notes"] = progress_data["progress_notes"]
+            updates["last_updated"] = func.now()
+            
+            dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+            stmt = dialect_insert(SkillProgressTracking).values(
+                id=uuid7(),
+                user_id=user_id,
+                skill_name=skill_name,
+                previous_level=0.0,
+                **{"current_level": 0.0, "progress_percentage": 0.0, **updates}
+            )
+            # Only the fields in this update overwrite the stored ones; SET
+            # expressions see the row as it was, so previous_level gets the old level
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[SkillProgressTracking.user_id, SkillProgressTracking.skill_name],
+                set_={
+                    "previous_level": SkillProgressTracking.__table__.c.current_level,
+                    **{key: stmt.excluded[key] for key in updates},
+                },
+            ).returning(SkillProgressTracking)
+            result = await db.execute(stmt, execution_options={"populate_existing": True})
+            progress_record = result.scalar_one()
             
             # Generate AI feedback
             ai_feedback = self._generate_progress_feedback(progress_record, progress_data)
-            progress_record.ai_feedback = json.dumps(ai_feedback)
-            
-            progress_record.last_updated = datetime.utcnow()
+            feedback_stmt = dialect_insert(SkillProgressFeedback).values(
+                progress_id=progress_record.id, ai_feedback=dumps_text(ai_feedback)
+            )
+            await db.execute(feedback_stmt.on_conflict_do_update(
+                index_elements=[SkillProgressFeedback.progress_id],
+                set_={"ai_feedback": feedback_stmt.excluded.ai_feedback},
+            ))
             
             await db.commit()
             
@@ -266,15 +417,15 @@ class SkillAnalyzerEngine:
                 "path_name": path.path_name,
                 "description": path.description,
                 "target_role": path.target_role,
-                "learning_steps": json.loads(path.learning_steps),
-                "milestones": json.loads(path.milestones),
-                "skill_progression": json.loads(path.skill_progression),
+                "learning_steps": path.learning_steps,
+                "milestones": path.milestones,
+                "skill_progression": path.skill_progression,
                 "estimated_total_hours": path.estimated_total_hours,
                 "estimated_weeks": path.estimated_weeks,
                 "difficulty_level": path.difficulty_level,
                 "current_step": path.current_step,
                 "completion_percentage": path.completion_percentage,
-                "priority_order": json.loads(path.priority_order),
+                "priority_order": path.priority_order,
                 "market_alignment_score": path.market_alignment_score,
                 "personalization_score": path.personalization_score,
                 "created_at": path.created_at.isoformat()
@@ -285,17 +436,18 @@ class SkillAnalyzerEngine:
     # Private helper methods
     
     async def _get_existing_analysis(
-        self, db: AsyncSession, user_id: str, job_id: str
+        self, db: AsyncSession, user_id: str, job_id: str, content_hash: Optional[str] = None
     ) -> Optional[SkillGapAnalysis]:
-        """Get existing skill gap analysis."""
-        result = await db.execute(
-            select(SkillGapAnalysis).where(
-                SkillGapAnalysis.user_id == user_id,
-                SkillGapAnalysis.job_id == job_id,
-                SkillGapAnalysis.is_active == True
-            ).order_by(SkillGapAnalysis.created_at.desc())
+        """Get the latest skill gap analysis, optionally only one of the given content."""
+        query = select(SkillGapAnalysis).where(
+            SkillGapAnalysis.user_id == user_id,
+            SkillGapAnalysis.job_id == job_id,
+            SkillGapAnalysis.is_active == True
         )
-        return result.scalar_one_or_none()
+        if content_hash is not None:
+            query = query.where(SkillGapAnalysis.content_hash == content_hash)
+        result = await db.execute(query.order_by(SkillGapAnalysis.created_at.desc()).limit(1))
+        return result.scalars().first()
     
     async def _get_user_resume(
         self, db: AsyncSession, user_id: str
@@ -323,8 +475,8 @@ class SkillAnalyzerEngine:
         if not parsed_data:
             return {}
         try:
-            return json.loads(parsed_data)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(parsed_data)
+        except (orjson.JSONDecodeError, TypeError):
             return {}
     
     def _parse_job_requirements(self, job_posting: JobPosting) -> Dict[str, Any]:
@@ -341,31 +493,37 @@ class SkillAnalyzerEngine:
     def _extract_user_skills(self, resume_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract user's skills from resume data."""
         user_skills = []
+        seen = set()
         
         # Extract from skills section
         if "skills" in resume_data:
             for skill in resume_data["skills"]:
-                skill_info = self._get_skill_info(skill.lower())
+                skill_name = skill.lower()
+                skill_info = self._get_skill_info(skill_name)
                 user_skills.append({
-                    "name": skill.lower(),
+                    "name": skill_name,
                     "level": 3,  # Default intermediate level
                     "category": skill_info.get("category", "technical"),
                     "years_experience": 2  # Default 2 years
                 })
+                seen.add(skill_name)
         
-        # Extract from experience descriptions
+        # Extract from experience descriptions, all scanned in one pass
         if "experience" in resume_data:
-            for exp in resume_data["experience"]:
-                description = exp.get("description", "").lower()
-                for skill_name in self.skill_database.keys():
-                    if skill_name in description and skill_name not in [s["name"] for s in user_skills]:
-                        skill_info = self._get_skill_info(skill_name)
-                        user_skills.append({
-                            "name": skill_name,
-                            "level": 2,  # Lower level from experience mention
-                            "category": skill_info.get("category", "technical"),
-                            "years_experience": 1
-                        })
+            descriptions = "\n".join(
+                exp.get("description", "") for exp in resume_data["experience"]
+            ).lower()
+            found = _SKILL_MATCHER.find(descriptions)
+            for skill_name in _SKILL_DB.keys():
+                if skill_name in found and skill_name not in seen:
+                    skill_info = self._get_skill_info(skill_name)
+                    user_skills.append({
+                        "name": skill_name,
+                        "level": 2,  # Lower level from experience mention
+                        "category": skill_info.get("category", "technical"),
+                        "years_experience": 1
+                    })
+                    seen.add(skill_name)
         
         return user_skills
     
@@ -373,29 +531,24 @@ class SkillAnalyzerEngine:
         """Extract required skills from job posting."""
         required_skills = []
         
-        # Combine description and requirements text
-        text = f"{job_requirements.get('description', '')} {job_requirements.get('requirements', '')}".lower()
-        
-        # Extract skills from our database
-        for skill_name, skill_data in self.skill_database.items():
-            if skill_name in text:
-                # Determine importance based on context
-                importance = "critical" if any(word in text for word in ["required", "must", "essential"]) else "important"
-                if any(word in text for word in ["nice", "plus", "preferred"]):
-                    importance = "nice-to-have"
-                
-                # Determine required level based on seniority
-                seniority = job_requirements.get("seniority", "mid")
-                required_level = {"junior": 2, "mid": 3, "senior": 4}.get(seniority, 3)
-                
-                required_skills.append({
-                    "name": skill_name,
-                    "required_level": required_level,
-                    "importance": importance,
-                    "category": skill_data["category"],
-                    "market_demand": skill_data["market_demand"],
-                    "salary_impact": skill_data["avg_salary_impact"]
-                })
+        mentions = _required_skill_mentions(
+            job_requirements.get("description", ""), job_requirements.get("requirements", "")
+        )
+        
+        # Determine required level based on seniority
+        seniority = job_requirements.get("seniority", "mid")
+        required_level = {"junior": 2, "mid": 3, "senior": 4}.get(seniority, 3)
+        
+        for skill_name, importance in mentions:
+            skill_data = _SKILL_DB[skill_name]
+            required_skills.append({
+                "name": skill_name,
+                "required_level": required_level,
+                "importance": importance,
+                "category": skill_data["category"],
+                "market_demand": skill_data["market_demand"],
+                "salary_impact": skill_data["avg_salary_impact"]
+            })
         
         return required_skills
     
@@ -406,44 +559,40 @@ class SkillAnalyzerEngine:
     ) -> List[Dict[str, Any]]:
         """Identify skill gaps between user and job requirements."""
         skill_gaps = []
-        user_skill_names = [skill["name"] for skill in user_skills]
+        if not required_skills:
+            return skill_gaps
         
-        for required_skill in required_skills:
-            skill_name = required_skill["name"]
-            
-            if skill_name not in user_skill_names:
-                # Complete skill gap
-                gap_score = 100.0  # Maximum gap
-                current_level = 0
-            else:
-                # Partial skill gap
-                user_skill = next(s for s in user_skills if s["name"] == skill_name)
-                current_level = user_skill["level"]
-                required_level = required_skill["required_level"]
-                
-                if current_level >= required_level:
-                    continue  # No gap
-                
-                gap_score = ((required_level - current_level) / required_level) * 100
-            
-            # Calculate learning time
-            skill_info = self._get_skill_info(skill_name)
-            base_hours = {"beginner": 20, "intermediate": 40, "advanced": 80}.get(
-                skill_info.get("difficulty", "intermediate"), 40
-            )
-            estimated_hours = int(base_hours * (gap_score / 100))
-            
+        user_levels = {skill["name"]: skill["level"] for skill in user_skills}
+        current_levels = np.array(
+            [user_levels.get(skill["name"], 0) for skill in required_skills], dtype=np.int8
+        )
+        required_levels = np.array(
+            [skill["required_level"] for skill in required_skills], dtype=np.int8
+        )
+        gaps = gap_scores(current_levels, required_levels)
+        
+        # Learning time scales with how far the user is from the required level
+        skill_infos = [self._get_skill_info(skill["name"]) for skill in required_skills]
+        difficulties = [info.get("difficulty", "intermediate") for info in skill_infos]
+        base_hours = np.array(
+            [_BASE_LEARNING_HOURS.get(difficulty, 40) for difficulty in difficulties], dtype=np.float64
+        )
+        hours = learning_hours(base_hours, gaps)
+        
+        # Only skills with a gap are turned back into dicts
+        for i in np.flatnonzero(gaps).tolist():
+            required_skill = required_skills[i]
             skill_gaps.append({
-                "skill_name": skill_name,
+                "skill_name": required_skill["name"],
                 "skill_category": required_skill["category"],
                 "importance": required_skill["importance"],
-                "current_level": current_level,
+                "current_level": int(current_levels[i]),
                 "required_level": required_skill["required_level"],
-                "gap_score": gap_score,
+                "gap_score": float(gaps[i]),
                 "market_demand_score": required_skill["market_demand"],
                 "salary_impact": required_skill["salary_impact"],
-                "estimated_learning_hours": estimated_hours,
-                "difficulty_level": skill_info.get("difficulty", "intermediate")
+                "estimated_learning_hours": int(hours[i]),
+                "difficulty_level": difficulties[i]
             })
         
         return skill_gaps
@@ -480,106 +629,67 @@ class SkillAnalyzerEngine:
     
     def _get_learning_resources_for_skill(
         self, skill_name: str, difficulty: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[Mapping[str, Any], ...]:
         """Get learning resources for a specific skill."""
-        # This would typically connect to a learning resource database
-        # For demo purposes, we'll generate sample resources
-        
-        base_resources = {
-            "python": [
-                {"title": "Python Crash Course", "provider": "No Starch Press", "type": "book", "hours": 40, "relevance": 95, "priority": 1, "rating": 4.8},
-                {"title": "Python for Everybody", "provider": "Coursera", "type": "course", "hours": 30, "relevance": 90, "priority": 2, "rating": 4.7},
-                {"title": "Real Python Tutorials", "provider": "Real Python", "type": "tutorial", "hours": 20, "relevance": 85, "priority": 3, "rating": 4.6}
-            ],
-            "javascript": [
-                {"title": "JavaScript: The Definitive Guide", "provider": "O'Reilly", "type": "book", "hours": 50, "relevance": 95, "priority": 1, "rating": 4.7},
-                {"title": "JavaScript Algorithms and Data Structures", "provider": "freeCodeCamp", "type": "course", "hours": 35, "relevance": 90, "priority": 2, "rating": 4.8},
-                {"title": "MDN JavaScript Guide", "provider": "Mozilla", "type": "tutorial", "hours": 25, "relevance": 85, "priority": 3, "rating": 4.5}
-            ],
-            "react": [
-                {"title": "React - The Complete Guide", "provider": "Udemy", "type": "course", "hours": 45, "relevance": 95, "priority": 1, "rating": 4.8},
-                {"title": "Official React Tutorial", "provider": "React.dev", "type": "tutorial", "hours": 15, "relevance": 90, "priority": 2, "rating": 4.6},
-                {"title": "React Hooks in Action", "provider": "Manning", "type": "book", "hours": 30, "relevance": 85, "priority": 3, "rating": 4.5}
-            ],
-            "aws": [
-                {"title": "AWS Certified Solutions Architect", "provider": "AWS", "type": "certification", "hours": 60, "relevance": 95, "priority": 1, "rating": 4.7},
-                {"title": "AWS Cloud Practitioner Essentials", "provider": "AWS", "type": "course", "hours": 25, "relevance": 90, "priority": 2, "rating": 4.6},
-                {"title": "AWS Hands-On Labs", "provider": "AWS", "type": "practice", "hours": 40, "relevance": 85, "priority": 3, "rating": 4.5}
-            ]
-        }
-        
-        # Return resources for the skill, or generic resources if not found
-        return base_resources.get(skill_name, [
-            {"title": f"Complete {skill_name.title()} Guide", "provider": "Online Learning", "type": "course", "hours": 30, "relevance": 80, "priority": 1, "rating": 4.0},
-            {"title": f"{skill_name.title()} Documentation", "provider": "Official Docs", "type": "tutorial", "hours": 15, "relevance": 75, "priority": 2, "rating": 4.2},
-            {"title": f"Hands-on {skill_name.title()} Projects", "provider": "Practice Platform", "type": "practice", "hours": 25, "relevance": 85, "priority": 3, "rating": 4.1}
-        ])
+        return _learning_resources(skill_name)
     
     def _calculate_learning_timeline(self, skill_gaps: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate learning timeline for skill gaps."""
-        timeline = {}
+        if not skill_gaps:
+            return {}
         
-        # Sort by priority (critical first)
-        priority_order = {"critical": 1, "important": 2, "nice-to-have": 3}
-        sorted_gaps = sorted(skill_gaps, key=lambda x: priority_order.get(x["importance"], 3))
+        # Critical first; the stable sort keeps gap order within an importance
+        order = np.argsort(
+            -encode_importance(gap["importance"] for gap in skill_gaps), kind="stable"
+        ).tolist()
+        hours = [skill_gaps[i]["estimated_learning_hours"] for i in order]
         
-        cumulative_hours = 0
-        for gap in sorted_gaps:
-            skill_name = gap["skill_name"]
-            hours = gap["estimated_learning_hours"]
-            
-            timeline[skill_name] = {
-                "hours": hours,
-                "start_week": cumulative_hours // 40,  # Assuming 40 hours per week
-                "end_week": (cumulative_hours + hours) // 40,
-                "priority": gap["importance"]
-            }
-            
-            cumulative_hours += hours
+        # Week boundaries from cumulative hours (assuming 40 hours per week)
+        cumulative_weeks = (np.cumsum([0] + hours) // 40).tolist()
         
-        return timeline
+        return {
+            skill_gaps[i]["skill_name"]: {
+                "hours": skill_hours,
+                "start_week": cumulative_weeks[n],
+                "end_week": cumulative_weeks[n + 1],
+                "priority": skill_gaps[i]["importance"]
+            }
+            for n, (i, skill_hours) in enumerate(zip(order, hours))
+        }
     
     def _calculate_priority_scores(
         self, skill_gaps: List[Dict[str, Any]], job_requirements: Dict[str, Any]
     ) -> Dict[str, float]:
         """Calculate priority scores for each skill gap."""
-        priority_scores = {}
-        
-        for gap in skill_gaps:
-            skill_name = gap["skill_name"]
-            
-            # Base score from importance
-            importance_score = {"critical": 100, "important": 75, "nice-to-have": 50}.get(
-                gap["importance"], 50
-            )
-            
-            # Market demand factor
-            market_factor = gap["market_demand_score"] / 100
-            
-            # Gap severity factor
-            gap_factor = gap["gap_score"] / 100
-            
-            # Calculate final priority score
-            priority_score = importance_score * market_factor * gap_factor
-            priority_scores[skill_name] = round(priority_score, 2)
+        if not skill_gaps:
+            return {}
         
-        return priority_scores
+        scores = priority_scores(
+            encode_importance(gap["importance"] for gap in skill_gaps),
+            np.array([gap["market_demand_score"] for gap in skill_gaps], dtype=np.float64),
+            np.array([gap["gap_score"] for gap in skill_gaps], dtype=np.float64)
+        )
+        return {
+            gap["skill_name"]: round(float(score), 2)
+            for gap, score in zip(skill_gaps, scores)
+        }
     
     async def _get_market_data(
         self, db: AsyncSession, skill_names: List[str]
     ) -> Dict[str, Any]:
         """Get market data for skills."""
         market_data = {}
+        if not skill_names:
+            return market_data
+        
+        # Existing market data for all skills in one query
+        result = await db.execute(
+            select(SkillMarketData).where(SkillMarketData.skill_name.in_(skill_names))
+        )
+        existing = {row.skill_name: row for row in result.scalars()}
         
         for skill_name in skill_names:
-            # Check if we have existing market data
-            result = await db.execute(
-                select(SkillMarketData).where(
-                    SkillMarketData.skill_name == skill_name
-                )
-            )
-            existing_data = result.scalar_one_or_none()
-            
+            existing_data = existing.get(skill_name)
             if existing_data:
                 market_data[skill_name] = {
                     "demand_score": existing_data.demand_score,
@@ -608,23 +718,11 @@ class SkillAnalyzerEngine:
         skill_gaps: List[Dict[str, Any]]
     ) -> float:
         """Calculate overall job readiness score."""
-        if not required_skills:
-            return 100.0
-        
-        total_skills = len(required_skills)
-        missing_skills = len(skill_gaps)
-        
-        # Base readiness from skill coverage
-        skill_coverage = ((total_skills - missing_skills) / total_skills) * 100
-        
-        # Adjust for critical skills
-        critical_gaps = [gap for gap in skill_gaps if gap["importance"] == "critical"]
-        critical_penalty = len(critical_gaps) * 10  # 10 points per critical gap
-        
-        # Final readiness score
-        readiness_score = max(0, skill_coverage - critical_penalty)
-        
-        return round(readiness_score, 2)
+        readiness = readiness_score(
+            len(required_skills),
+            encode_importance(gap["importance"] for gap in skill_gaps)
+        )
+        return round(readiness, 2)
     
     async def _create_skill_gap_records(
         self,
@@ -633,67 +731,64 @@ class SkillAnalyzerEngine:
         user_id: str,
         skill_gaps: List[Dict[str, Any]],
         market_data: Dict[str, Any]
-    ):
-        """Create individual skill gap records."""
-        for gap in skill_gaps:
-            skill_name = gap["skill_name"]
-            market_info = market_data.get(skill_name, {})
-            
-            skill_gap_record = SkillGap(
-                id=str(uuid.uuid4()),
-                analysis_id=analysis_id,
-                user_id=user_id,
-                skill_name=skill_name,
-                skill_category=gap["skill_category"],
-                importance=gap["importance"],
-                current_level=gap["current_level"],
-                required_level=gap["required_level"],
-                gap_score=gap["gap_score"],
-                market_demand_score=market_info.get("demand_score"),
-                salary_impact=gap["salary_impact"],
-                job_postings_count=market_info.get("job_postings_count"),
-                estimated_learning_hours=gap["estimated_learning_hours"],
-                difficulty_level=gap["difficulty_level"]
-            )
-            
-            db.add(skill_gap_record)
+    ) -> Dict[str, str]:
+        """Create individual skill gap records in one bulk INSERT; returns skill name -> gap id."""
+        if not skill_gaps:
+            return {}
+        gap_ids = dict(zip(
+            (gap["skill_name"] for gap in skill_gaps), uuid7_batch(len(skill_gaps))
+        ))
+        await db.execute(insert(SkillGap), [
+            {
+                "id": gap_ids[gap["skill_name"]],
+                "analysis_id": analysis_id,
+                "user_id": user_id,
+                "skill_name": gap["skill_name"],
+                "skill_category_id": SKILL_CATEGORIES.id_for(gap["skill_category"]),
+                "importance_id": IMPORTANCE_LEVELS.id_for(gap["importance"]),
+                "current_level": gap["current_level"],
+                "required_level": gap["required_level"],
+                "gap_score": gap["gap_score"],
+                "market_demand_score": market_data.get(gap["skill_name"], {}).get("demand_score"),
+                "salary_impact": gap["salary_impact"],
+                "job_postings_count": market_data.get(gap["skill_name"], {}).get("job_postings_count"),
+                "estimated_learning_hours": gap["estimated_learning_hours"],
+                "difficulty_level_id": DIFFICULTY_LEVELS.id_for(gap["difficulty_level"]),
+            }
+            for gap in skill_gaps
+        ])
+        return gap_ids
     
     async def _create_learning_resource_records(
         self,
         db: AsyncSession,
         user_id: str,
-        skill_gaps: List[Dict[str, Any]],
+        gap_ids: Dict[str, str],
         learning_recommendations: List[Dict[str, Any]]
     ):
-        """Create learning resource records."""
-        # Create a mapping of skill gaps to their IDs (we'll need to flush first)
-        await db.flush()
-        
-        for recommendation in learning_recommendations:
-            # Find the corresponding skill gap
-            skill_name = recommendation["skill_name"]
-            
-            # For demo purposes, we'll create a placeholder skill_gap_id
-            # In production, you'd query the actual skill gap record
-            skill_gap_id = str(uuid.uuid4())  # This should be the actual skill gap ID
-            
-            resource = LearningResource(
-                id=str(uuid.uuid4()),
-                skill_gap_id=skill_gap_id,
-                user_id=user_id,
-                title=recommendation["title"],
-                provider=recommendation["provider"],
-                resource_type=recommendation["resource_type"],
-                url=recommendation.get("url"),
-                estimated_hours=recommendation["estimated_hours"],
-                difficulty=recommendation["difficulty"],
-                cost=recommendation.get("cost"),
-                rating=recommendation.get("rating"),
-                relevance_score=recommendation["relevance_score"],
-                priority_rank=recommendation["priority_rank"]
+        """Create learning resource records in one bulk INSERT, linked to their skill gaps."""
+        if not learning_recommendations:
+            return
+        await db.execute(insert(LearningResource), [
+            {
+                "id": resource_id,
+                "skill_gap_id": gap_ids[recommendation["skill_name"]],
+                "user_id": user_id,
+                "title": recommendation["title"],
+                "provider": recommendation["provider"],
+                "resource_type_id": RESOURCE_TYPES.id_for(recommendation["resource_type"]),
+                "url": recommendation.get("url"),
+                "estimated_hours": recommendation["estimated_hours"],
+                "difficulty_id": DIFFICULTY_LEVELS.id_for(recommendation["difficulty"]),
+                "cost": recommendation.get("cost"),
+                "rating": recommendation.get("rating"),
+                "relevance_score": recommendation["relevance_score"],
+                "priority_rank": recommendation["priority_rank"],
+            }
+            for recommendation, resource_id in zip(
+                learning_recommendations, uuid7_batch(len(learning_recommendations))
             )
-            
-            db.add(resource)
+        ])
     
     async def _generate_learning_path(
         self,
@@ -764,13 +859,13 @@ class SkillAnalyzerEngine:
             path_name=f"Path to {job_requirements.get('title', 'Target Role')}",
             description=f"Structured learning path to master {len(skill_gaps)} essential skills",
             target_role=job_requirements.get("title"),
-            learning_steps=json.dumps(learning_steps),
-            milestones=json.dumps(milestones),
-            skill_progression=json.dumps(skill_progression),
+            learning_steps=learning_steps,
+            milestones=milestones,
+            skill_progression=skill_progression,
             estimated_total_hours=total_hours,
             estimated_weeks=total_weeks,
             difficulty_level=difficulty_level,
-            priority_order=json.dumps([gap["skill_name"] for gap in sorted_gaps]),
+            priority_order=[gap["skill_name"] for gap in sorted_gaps],
             market_alignment_score=market_alignment,
             personalization_score=personalization_score
         )
@@ -780,12 +875,7 @@ class SkillAnalyzerEngine:
     
     def _get_skill_info(self, skill_name: str) -> Dict[str, Any]:
         """Get skill information from database."""
-        return self.skill_database.get(skill_name, {
-            "category": "technical",
-            "difficulty": "intermediate",
-            "market_demand": 70,
-            "avg_salary_impact": 10000
-        })
+        return _SKILL_DB.get(skill_name, _DEFAULT_SKILL_INFO)
     
     def _extract_seniority(self, title: str) -> str:
         """Extract seniority level from job title."""
@@ -858,11 +948,11 @@ class SkillAnalyzerEngine:
         return {
             "id": analysis.id,
             "job_id": analysis.job_id,
-            "missing_skills": json.loads(analysis.missing_skills),
-            "learning_recommendations": json.loads(analysis.learning_recommendations),
-            "estimated_timeline": json.loads(analysis.estimated_timeline),
-            "priority_scores": json.loads(analysis.priority_score),
-            "market_demand": json.loads(analysis.market_demand) if analysis.market_demand else {},
+            "missing_skills": analysis.missing_skills,
+            "learning_recommendations": analysis.learning_recommendations,
+            "estimated_timeline": analysis.estimated_timeline,
+            "priority_scores": analysis.priority_score,
+            "market_demand": analysis.market_demand or {},
             "metrics": {
                 "total_missing_skills": analysis.total_missing_skills,
                 "critical_skills_count": analysis.critical_skills_count,
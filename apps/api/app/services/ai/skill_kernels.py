@@ -0,0 +1,115 @@
+"""
+Numeric kernels for skill gap scoring.
+Scores are computed over parallel NumPy arrays (one slot per skill) and
+JIT-compiled with numba when it is installed.
+"""
+from typing import Iterable
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Try to import numba, fall back to plain NumPy if not available
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("numba not installed - skill gap scoring will use NumPy")
+
+
+def _jit(fn):
+    """Compile a kernel with numba, or return it unchanged when numba is missing."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True, parallel=True, fastmath=True)(fn)
+    return fn
+
+
+# Importance is pre-encoded to an int8 code before scoring
+IMPORTANCE_CODES = {"critical": 3, "important": 2, "nice-to-have": 1}
+CRITICAL_CODE = 3
+
+# Base priority per importance code (index 0 is unused)
+IMPORTANCE_WEIGHTS = np.array([50.0, 50.0, 75.0, 100.0], dtype=np.float64)
+
+
+def encode_importance(importance: Iterable[str]) -> np.ndarray:
+    """Encode importance labels as int8 codes; unknown labels score as nice-to-have."""
+    return np.array([IMPORTANCE_CODES.get(value, 1) for value in importance], dtype=np.int8)
+
+
+@_jit
+def _gap_scores(current_levels, required_levels):
+    current = current_levels.astype(np.float64)
+    required = required_levels.astype(np.float64)
+    partial = (required - current) / np.maximum(required, 1.0) * 100.0
+    gap = np.where(current >= required, 0.0, partial)
+    # Skills the user doesn't have at all are a complete gap
+    return np.where(current == 0.0, 100.0, gap)
+
+
+@_jit
+def _priority_scores(importance_codes, market_demand, gap):
+    weights = IMPORTANCE_WEIGHTS[importance_codes.astype(np.int64)]
+    return weights * (market_demand / 100.0) * (gap / 100.0)
+
+
+@_jit
+def _learning_hours(base_hours, gap):
+    return (base_hours * (gap / 100.0)).astype(np.int32)
+
+
+@_jit
+def _readiness_score(n_required, gap_importance_codes):
+    if n_required == 0:
+        return 100.0
+    n_gaps = gap_importance_codes.shape[0]
+    n_critical = np.sum(gap_importance_codes == CRITICAL_CODE)
+    skill_coverage = ((n_required - n_gaps) / n_required) * 100.0
+    return max(0.0, skill_coverage - n_critical * 10.0)
+
+
+def gap_scores(current_levels: np.ndarray, required_levels: np.ndarray) -> np.ndarray:
+    """Gap severity (0-100) per skill; 0 means the user already meets the level."""
+    return _gap_scores(current_levels, required_levels)
+
+
+def priority_scores(
+    importance_codes: np.ndarray, market_demand: np.ndarray, gap: np.ndarray
+) -> np.ndarray:
+    """Learning priority per skill gap from importance, market demand and gap severity."""
+    return _priority_scores(importance_codes, market_demand, gap)
+
+
+def learning_hours(base_hours: np.ndarray, gap: np.ndarray) -> np.ndarray:
+    """Whole learning hours per skill: the base hours scaled by gap severity."""
+    return _learning_hours(base_hours, gap)
+
+
+def readiness_score(n_required: int, gap_importance_codes: np.ndarray) -> float:
+    """Job readiness (0-100) from skill coverage, minus 10 points per critical gap."""
+    return float(_readiness_score(n_required, gap_importance_codes))
+
+
+def warm_up() -> None:
+    """
+    Compile the kernels for the argument types the analyzer passes.
+    
+    Called once at startup, so the first analysis doesn't pay for numba
+    compilation (or for loading its on-disk cache).
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    levels = np.zeros(1, dtype=np.int8)
+    values = np.zeros(1, dtype=np.float64)
+    gap_scores(levels, levels)
+    priority_scores(levels, values, values)
+    learning_hours(values, values)
+    readiness_score(1, levels)
+
+
+def keyword_presence(doc_index: np.ndarray, keyword_ids: np.ndarray, n_docs: int, n_keywords: int) -> np.ndarray:
+    """(n_docs, n_keywords) bool matrix from parallel (document, keyword) match arrays."""
+    presence = np.zeros((n_docs, n_keywords), dtype=np.bool_)
+    presence[doc_index, keyword_ids] = True
+    return presence
@@ -0,0 +1,277 @@
+"""
+Skill gap analysis task queue on Redis Streams.
+The API enqueues an analysis with SkillAnalyzeProducer and answers 202 with
+a task id; SkillAnalyzeConsumer processes run the analysis in a consumer
+group, so throughput scales with the number of consumers. Task status lives
+in a short-lived Redis hash that the API polls.
+
+Run a consumer with:
+    python -m app.services.ai.skill_queue [--name NAME]
+
+The consumer name defaults to $SKILL_QUEUE_CONSUMER, then the host name, so a
+restarted worker picks its own unacknowledged entries back up; entries left
+by a worker that never comes back are claimed by the others once idle.
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import socket
+import time
+
+import orjson
+import redis.asyncio as redis
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.ids import uuid7
+from app.services.ai.skill_analyzer import SkillAnalyzerEngine
+
+logger = logging.getLogger(__name__)
+
+STREAM = "skill:analyze:stream"
+GROUP = "skill-analyzers"
+
+# Failed tasks wait here, scored by retry time, until they are due again
+RETRY_KEY = "skill:analyze:retry"
+
+# Status hashes expire once a client has had time to poll them
+TASK_TTL_SECONDS = 3600
+
+# Failed analyses are retried with exponential backoff, then given up on
+MAX_ATTEMPTS = 3
+RETRY_BASE_SECONDS = 2.0
+
+# Stream entries kept before Redis trims the oldest (approximate)
+STREAM_MAXLEN = 10000
+
+# Unacknowledged entries idle this long belong to a dead consumer
+CLAIM_MIN_IDLE_MS = 10 * 60 * 1000
+
+# Pause before the next round after a Redis error
+REDIS_ERROR_BACKOFF_SECONDS = 1.0
+
+# Re-queue one due retry; the ZREM and XADD run atomically, and only the
+# consumer whose ZREM succeeds adds the task back onto the stream.
+# KEYS: retry set, stream; ARGV: member, maxlen, field, value, ...
+PROMOTE_RETRY_SCRIPT = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*', unpack(ARGV, 3))
+return 1
+"""
+
+
+def task_key(task_id: str) -> str:
+    """Redis key of a task's status hash."""
+    return f"skill:analyze:task:{task_id}"
+
+
+def _analysis_args(fields: Dict[str, str]) -> Tuple[int, Dict[str, object]]:
+    """Attempt number and analyze_skill_gaps arguments of a stream entry."""
+    return int(fields["attempt"]), {
+        "user_id": fields["user_id"],
+        "job_id": fields["job_id"],
+        "include_market_data": fields["include_market_data"] == "1",
+        "regenerate": fields["regenerate"] == "1",
+    }
+
+
+class SkillAnalyzeProducer:
+    """Enqueues skill gap analyses for the consumers."""
+    
+    def __init__(self, client: redis.Redis):
+        self.client = client
+    
+    async def enqueue(
+        self,
+        user_id: str,
+        job_id: str,
+        include_market_data: bool = True,
+        regenerate: bool = False
+    ) -> str:
+        """Add an analysis task to the stream and return its id."""
+        task_id = uuid7()
+        key = task_key(task_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"status": "queued", "user_id": user_id, "job_id": job_id})
+            pipe.expire(key, TASK_TTL_SECONDS)
+            pipe.xadd(STREAM, {
+                "task_id": task_id,
+                "user_id": user_id,
+                "job_id": job_id,
+                "include_market_data": int(include_market_data),
+                "regenerate": int(regenerate),
+                "attempt": 1,
+            }, maxlen=STREAM_MAXLEN, approximate=True)
+            await pipe.execute()
+        return task_id
+    
+    async def get_status(self, task_id: str) -> Optional[Dict[str, str]]:
+        """Status hash of a task, or None if unknown or expired."""
+        status = await self.client.hgetall(task_key(task_id))
+        return status or None
+
+
+class SkillAnalyzeConsumer:
+    """Runs queued skill gap analyses as one member of the consumer group."""
+    
+    def __init__(
+        self,
+        client: redis.Redis,
+        session_factory: async_sessionmaker[AsyncSession],
+        engine: Optional[SkillAnalyzerEngine] = None,
+        name: Optional[str] = None
+    ):
+        self.client = client
+        self.session_factory = session_factory
+        self.engine = engine or SkillAnalyzerEngine()
+        self.name = name or os.environ.get("SKILL_QUEUE_CONSUMER") or socket.gethostname()
+        self._promote_retry = client.register_script(PROMOTE_RETRY_SCRIPT)
+    
+    async def ensure_group(self):
+        """Create the stream and consumer group if they don't exist yet."""
+        try:
+            await self.client.xgroup_create(STREAM, GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+    
+    async def read(
+        self, pending: bool = False, block_ms: int = 5000, count: int = 10
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """
+        Next entries for this consumer.
+        
+        With pending=True, re-reads entries delivered to this consumer but
+        never acknowledged (e.g. the process died mid-analysis).
+        """
+        response = await self.client.xreadgroup(
+            GROUP, self.name, {STREAM: "0" if pending else ">"},
+            count=count, block=None if pending else block_ms
+        )
+        return [entry for _, entries in response or [] for entry in entries]
+    
+    async def claim_stale(
+        self, min_idle_ms: int = CLAIM_MIN_IDLE_MS, count: int = 10
+    ) -> List[Tuple[str, Optional[Dict[str, str]]]]:
+        """Take over entries other consumers left unacknowledged for min_idle_ms."""
+        response = await self.client.xautoclaim(
+            STREAM, GROUP, self.name, min_idle_ms, start_id="0-0", count=count
+        )
+        return response[1]
+    
+    async def promote_due_retries(self, count: int = 100) -> int:
+        """Move retries whose backoff has passed back onto the stream."""
+        due = await self.client.zrangebyscore(RETRY_KEY, "-inf", time.time(), start=0, num=count)
+        promoted = 0
+        for member in due:
+            fields = itertools.chain.from_iterable(orjson.loads(member).items())
+            promoted += await self._promote_retry(
+                keys=[RETRY_KEY, STREAM], args=[member, STREAM_MAXLEN, *fields]
+            )
+        return promoted
+    
+    async def handle(self, entry_id: str, fields: Optional[Dict[str, str]]):
+        """Run one analysis task, then acknowledge it (scheduling a retry on failure)."""
+        if fields is None:
+            # Trimmed from the stream while pending; nothing left to run
+            await self.client.xack(STREAM, GROUP, entry_id)
+            return
+        
+        task_id = fields.get("task_id")
+        key = task_key(task_id)
+        retry = None
+        
+        try:
+            if not task_id:
+                raise KeyError("task_id")
+            attempt, kwargs = _analysis_args(fields)
+        except (KeyError, ValueError) as e:
+            # Retrying can't fix a malformed entry, and leaving it
+            # unacknowledged would hand it back on every restart
+            logger.error(f"Malformed skill analysis entry {entry_id}: {e!r}")
+            async with self.client.pipeline(transaction=True) as pipe:
+                if task_id:
+                    pipe.hset(key, mapping={"status": "failed", "error": "Malformed task"})
+                    pipe.expire(key, TASK_TTL_SECONDS)
+                pipe.xack(STREAM, GROUP, entry_id)
+                await pipe.execute()
+            return
+        
+        await self.client.hset(key, mapping={"status": "running", "attempt": attempt})
+        try:
+            async with self.session_factory() as db:
+                result = await self.engine.analyze_skill_gaps(db, **kwargs)
+            status = {"status": "completed", "analysis_id": result["id"]}
+        except Exception as e:
+            if isinstance(e, ValueError) or attempt >= MAX_ATTEMPTS:
+                logger.error(f"Skill analysis task {task_id} failed: {e}")
+                status = {"status": "failed", "error": str(e)}
+            else:
+                logger.warning(f"Skill analysis task {task_id} attempt {attempt} failed, retrying: {e}")
+                status = {"status": "queued"}
+                retry = orjson.dumps({**fields, "attempt": str(attempt + 1)}).decode()
+        
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=status)
+            pipe.expire(key, TASK_TTL_SECONDS)
+            if retry is not None:
+                pipe.zadd(RETRY_KEY, {retry: time.time() + RETRY_BASE_SECONDS * 2 ** (attempt - 1)})
+            pipe.xack(STREAM, GROUP, entry_id)
+            await pipe.execute()
+    
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        """
+        Process tasks until stop is set.
+        
+        Starts with this consumer's own unacknowledged entries; afterwards
+        each round re-queues due retries and claims stale entries from dead
+        consumers before reading new ones.
+        """
+        group_ready = False
+        pending = True
+        while stop is None or not stop.is_set():
+            try:
+                if not group_ready:
+                    await self.ensure_group()
+                    group_ready = True
+                await self.promote_due_retries()
+                if pending:
+                    entries = await self.read(pending=True)
+                    if not entries:
+                        pending = False
+                        continue
+                else:
+                    entries = await self.claim_stale() or await self.read()
+                for entry_id, fields in entries:
+                    await self.handle(entry_id, fields)
+            except RedisError as e:
+                # Unacknowledged entries are picked up again as pending
+                logger.warning(f"Redis error in skill queue consumer, retrying: {e}")
+                pending = True
+                await asyncio.sleep(REDIS_ERROR_BACKOFF_SECONDS)
+
+
+async def main(argv: Optional[List[str]] = None):
+    """Run a consumer against the configured Redis and database."""
+    from app.core.config import settings
+    from app.core.database import AsyncSessionLocal
+    
+    parser = argparse.ArgumentParser(description="Skill gap analysis worker")
+    parser.add_argument("--name", help="Consumer name; keep it stable across restarts")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        await SkillAnalyzeConsumer(client, AsyncSessionLocal, name=args.name).run()
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,13 +2,13 @@
 Apply kit and activity database service.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, lambda_stmt, and_, func
 from app.models.apply import ApplyKit, JobActivity, ActivityStatus
 from app.models.resume import Resume
 from app.models.job import JobPosting
+from app.models.match import JobMatch
 from app.services.apply_kit import ApplyKitGenerator
 from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
 import json
 import logging
 
@@ -216,7 +216,7 @@ class ApplyKitService:
         if qa is not None:
             apply_kit.qa_json = json.dumps(qa)
         
-        apply_kit.updated_at = datetime.utcnow()
+        apply_kit.updated_at = func.now()
         await db.flush()
         await db.refresh(apply_kit)
         
@@ -336,7 +336,7 @@ class ApplyKitService:
         
         # Activate target version
         target_version.is_active = True
-        target_version.updated_at = datetime.utcnow()
+        target_version.updated_at = func.now()
         
         await db.flush()
         await db.refresh(target_version)
@@ -358,12 +358,12 @@ class ActivityService:
         """Set or update job activity status."""
         # Check if activity exists
         result = await db.execute(
-            select(JobActivity).where(
+            lambda_stmt(lambda: select(JobActivity).where(
                 and_(
                     JobActivity.user_id == user_id,
                     JobActivity.job_id == job_id,
                 )
-            )
+            ))
         )
         activity = result.scalar_one_or_none()
         
@@ -372,16 +372,31 @@ class ActivityService:
             activity.status = status
             if notes is not None:
                 activity.notes = notes
-            activity.updated_at = datetime.utcnow()
+            activity.updated_at = func.now()
             await db.flush()
             await db.refresh(activity)
         else:
-            # Create new
+            # Create new, seeding the cached score from the latest match
+            match_result = await db.execute(
+                select(JobMatch.match_score)
+                .where(
+                    and_(
+                        JobMatch.user_id == user_id,
+                        JobMatch.job_id == job_id,
+                    )
+                )
+                .order_by(JobMatch.created_at.desc())
+                .limit(1)
+            )
+            match_score = match_result.scalar_one_or_none()
+            
             activity = JobActivity(
                 user_id=user_id,
                 job_id=job_id,
                 status=status,
                 notes=notes,
+                match_score_cached=round(match_score) if match_score is not None else None,
+                match_updated_at=func.now() if match_score is not None else None,
             )
             db.add(activity)
             await db.flush()
@@ -397,12 +412,12 @@ class ActivityService:
     ) -> Optional[JobActivity]:
         """Get activity for a job."""
         result = await db.execute(
-            select(JobActivity).where(
+            lambda_stmt(lambda: select(JobActivity).where(
                 and_(
                     JobActivity.user_id == user_id,
                     JobActivity.job_id == job_id,
                 )
-            )
+            ))
         )
         return result.scalar_one_or_none()
     
@@ -413,8 +428,14 @@ class ActivityService:
         status: Optional[ActivityStatus] = None,
         page: int = 1,
         page_size: int = 20,
+        sort_by: str = "updated",
     ) -> Tuple[List[JobActivity], int]:
-        """Get user's activities with pagination."""
+        """
+        Get user's activities with pagination.
+        
+        sort_by is "updated" (most recently changed first) or "match_score"
+        (highest cached match score first, read off the user/status/score index).
+        """
         # Build query
         query = select(JobActivity).where(JobActivity.user_id == user_id)
         count_query = select(func.count(JobActivity.id)).where(JobActivity.user_id == user_id)
@@ -429,7 +450,10 @@ class ActivityService:
         
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.order_by(JobActivity.updated_at.desc())
+        if sort_by == "match_score":
+            query = query.order_by(JobActivity.match_score_cached.desc(), JobActivity.updated_at.desc())
+        else:
+            query = query.order_by(JobActivity.updated_at.desc())
         query = query.offset(offset).limit(page_size)
         
         # Execute query
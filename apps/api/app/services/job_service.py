@@ -2,8 +2,8 @@
 Job service for database operations.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from app.models.job import JobSource, JobPosting
+from sqlalchemy import select, lambda_stmt, and_, or_, func
+from app.models.job import JobSource, JobPosting, JobPostingRaw
 from app.schemas.job import JobSourceCreate, JobSourceUpdate, JobFilters
 from app.services.job_fetcher import JobFetcher
 from typing import List, Dict, Any, Tuple, Optional
@@ -150,9 +150,10 @@ class JobService:
             if not url_hash:
                 continue
             
-            # Check if job already exists
+            # Check if job already exists (lambda_stmt reuses the cached
+            # compiled SQL across iterations; url_hash is bound per call)
             result = await db.execute(
-                select(JobPosting).where(JobPosting.url_hash == url_hash)
+                lambda_stmt(lambda: select(JobPosting).where(JobPosting.url_hash == url_hash))
             )
             existing_job = result.scalar_one_or_none()
             
@@ -164,7 +165,7 @@ class JobService:
                 existing_job.description = job_data.get('description', existing_job.description)
                 existing_job.work_type = job_data.get('work_type', existing_job.work_type)
                 existing_job.is_active = True
-                existing_job.updated_at = datetime.utcnow()
+                existing_job.updated_at = func.now()
                 updated_count += 1
             else:
                 # Create new job
@@ -182,7 +183,7 @@ class JobService:
                     application_url=job_data.get('application_url', ''),
                     url_hash=url_hash,
                     posted_date=job_data.get('posted_date'),
-                    raw_data=json.dumps(job_data),
+                    raw=JobPostingRaw(raw_data=json.dumps(job_data)),
                 )
                 db.add(new_job)
                 new_count += 1
@@ -2,15 +2,18 @@
 Match service for database operations and match retrieval.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from app.models.match import JobMatch
+from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.match import JobMatch, match_id
+from app.models.apply import JobActivity
 from app.models.resume import Resume
 from app.models.job import JobPosting
 from app.models.preferences import UserPreferences
 from app.models.user import User
 from app.services.matcher import MatchingService
 from typing import List, Dict, Any, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import logging
 
@@ -33,20 +36,58 @@ class MatchDatabaseService:
         score_breakdown: Dict[str, float],
         why: Dict[str, Any],
         missing_skills: List[str],
+        refreshed_at: Optional[datetime] = None,
     ) -> JobMatch:
-        """Store a job match in database."""
-        match = JobMatch(
-            user_id=user_id,
-            job_id=job_id,
-            resume_id=resume_id,
+        """
+        Store a job match in database.
+        
+        The id is derived from (user_id, job_id, resume_id), so re-scoring a
+        match updates the existing row in place instead of adding a duplicate.
+        created_at stays the time the match first appeared; updated_at is set
+        to refreshed_at (or now) on every store.
+        """
+        stable_id = match_id(user_id, job_id, resume_id)
+        fields = dict(
             match_score=match_score,
             score_breakdown=json.dumps(score_breakdown),
             why_json=json.dumps(why),
             missing_skills_json=json.dumps(missing_skills),
+            updated_at=refreshed_at or func.now(),
         )
-        db.add(match)
+        
+        # A single upsert on the unique id, so concurrent stores of the same
+        # match can't both insert
+        dialect_insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        stmt = dialect_insert(JobMatch).values(
+            id=stable_id,
+            user_id=user_id,
+            job_id=job_id,
+            resume_id=resume_id,
+            **fields,
+        )
+        stmt = stmt.on_conflict_do_update(index_elements=[JobMatch.id], set_=fields)
+        match = await db.scalar(
+            stmt.returning(JobMatch),
+            execution_options={"populate_existing": True},
+        )
+        
+        # Keep the tracker's cached score in step with the latest match
+        await db.execute(
+            update(JobActivity)
+            .where(
+                and_(
+                    JobActivity.user_id == user_id,
+                    JobActivity.job_id == job_id,
+                )
+            )
+            .values(
+                match_score_cached=round(match_score),
+                match_updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
         await db.flush()
-        await db.refresh(match)
         return match
     
     @staticmethod
@@ -144,6 +185,23 @@ class MatchDatabaseService:
         
         await db.flush()
         return count
+    
+    @staticmethod
+    async def delete_stale_matches(
+        db: AsyncSession,
+        user_id: str,
+        refreshed_at: datetime,
+    ) -> int:
+        """Delete a user's matches that weren't refreshed in the pass started at refreshed_at."""
+        query = delete(JobMatch).where(
+            and_(
+                JobMatch.user_id == user_id,
+                or_(JobMatch.updated_at.is_(None), JobMatch.updated_at < refreshed_at),
+            )
+        )
+        
+        result = await db.execute(query.execution_options(synchronize_session=False))
+        return result.rowcount
 
 
 class MatchComputationService:
@@ -210,12 +268,10 @@ class MatchComputationService:
                 'message': 'No active jobs found',
             }
         
-        # Clear existing matches for this user
-        await MatchDatabaseService.clear_matches_for_user(db, user_id)
-        
         # Compute matches
         matches_computed = 0
         matches_stored = 0
+        refreshed_at = datetime.now(timezone.utc)
         
         for resume in resumes:
             # Extract resume text and skills
@@ -258,9 +314,13 @@ class MatchComputationService:
                         score_breakdown=match_result['score_breakdown'],
                         why=match_result['why'],
                         missing_skills=match_result['missing_skills'],
+                        refreshed_at=refreshed_at,
                     )
                     matches_stored += 1
         
+        # Matches are upserted in place; drop the ones that fell out
+        await MatchDatabaseService.delete_stale_matches(db, user_id, refreshed_at)
+        
         await db.commit()
         
         return {
@@ -3,7 +3,7 @@ Notification service for managing notifications and scheduling.
 Includes rate limiting and digest scheduling.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, lambda_stmt, and_, func
 from app.models.notification import NotificationSettings, NotificationLog, NotificationType
 from app.models.user import User
 from app.models.match import JobMatch
@@ -27,9 +27,9 @@ class NotificationSettingsService:
     ) -> NotificationSettings:
         """Get or create notification settings for user."""
         result = await db.execute(
-            select(NotificationSettings).where(
+            lambda_stmt(lambda: select(NotificationSettings).where(
                 NotificationSettings.user_id == user_id
-            )
+            ))
         )
         settings = result.scalar_one_or_none()
         
@@ -66,7 +66,7 @@ class NotificationSettingsService:
             if key in allowed_fields:
                 setattr(settings, key, value)
         
-        settings.updated_at = datetime.utcnow()
+        settings.updated_at = func.now()
         await db.flush()
         await db.refresh(settings)
         
@@ -115,17 +115,13 @@ class NotificationLogService:
     ) -> Optional[NotificationLog]:
         """Mark notification as sent."""
         result = await db.execute(
-            select(NotificationLog).where(NotificationLog.id == log_id)
+            update(NotificationLog)
+            .where(NotificationLog.id == log_id)
+            .values(status="sent", sent_at=func.now())
+            .returning(NotificationLog)
+            .execution_options(populate_existing=True)
         )
-        log = result.scalar_one_or_none()
-        
-        if log:
-            log.status = "sent"
-            log.sent_at = datetime.utcnow()
-            await db.flush()
-            await db.refresh(log)
-        
-        return log
+        return result.scalar_one_or_none()
     
     @staticmethod
     async def mark_failed(
@@ -254,7 +250,8 @@ class DigestService:
                 logger.warning(f"Daily digest rate limited for user {user_id}")
                 return False
             
-            # Get new matches from last 24 hours
+            # Get new matches from last 24 hours; re-scoring keeps a match's
+            # created_at, so only matches first found since yesterday count
             yesterday = datetime.utcnow() - timedelta(days=1)
             matches_result = await db.execute(
                 select(JobMatch)
@@ -459,7 +456,7 @@ class DigestService:
                 return False
             
             # Check threshold
-            threshold = float(settings.high_match_threshold)
+            threshold = settings.high_match_threshold
             if match.match_score < threshold:
                 logger.info(f"Match score {match.match_score} below threshold {threshold}")
                 return False
@@ -0,0 +1,88 @@
+"""
+Monthly partition maintenance for append-only tables.
+On Postgres, notification_logs is range-partitioned by created_at month
+(see alembic revision 010; job_matches was partitioned too until revision
+023). Partitions are created ahead of time so inserts never fall through to
+the default partition.
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from datetime import date
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Tables range-partitioned by created_at month on Postgres
+PARTITIONED_TABLES = ("notification_logs",)
+
+# Months of partitions to keep created ahead of the current month
+MONTHS_AHEAD = 2
+
+
+def month_bounds(day: date) -> Tuple[date, date]:
+    """Return the [start, end) dates of the month containing day."""
+    start = day.replace(day=1)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def partition_name(table: str, month_start: date) -> str:
+    """Partition table name, e.g. notification_logs_2025_01."""
+    return f"{table}_{month_start:%Y_%m}"
+
+
+def partition_ddl(table: str, month_start: date) -> str:
+    """CREATE TABLE statement for one monthly partition (idempotent)."""
+    start, end = month_bounds(month_start)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, start)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    months_ahead: int = MONTHS_AHEAD,
+    today: Optional[date] = None,
+) -> List[str]:
+    """
+    Create monthly partitions from the current month through months_ahead.
+
+    No-op on databases other than Postgres (SQLite dev/test databases use
+    plain tables), and for tables that were created unpartitioned.
+
+    Returns:
+        Names of the partitions ensured
+    """
+    if db.bind.dialect.name != "postgresql":
+        return []
+
+    # init_db's create_all makes plain tables; only revision 010 partitions them
+    result = await db.execute(text(
+        "SELECT c.relname FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid"
+    ))
+    partitioned = set(result.scalars())
+    tables = [table for table in PARTITIONED_TABLES if table in partitioned]
+    for table in PARTITIONED_TABLES:
+        if table not in partitioned:
+            logger.warning(f"{table} is not partitioned; skipping partition maintenance")
+
+    month_start = (today or date.today()).replace(day=1)
+    ensured = []
+
+    for _ in range(months_ahead + 1):
+        for table in tables:
+            await db.execute(text(partition_ddl(table, month_start)))
+            ensured.append(partition_name(table, month_start))
+        month_start = month_bounds(month_start)[1]
+
+    await db.commit()
+    logger.info(f"Ensured {len(ensured)} monthly partitions")
+
+    return ensured
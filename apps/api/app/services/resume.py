@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, func
 from fastapi import UploadFile, HTTPException
 
 from app.models.resume import Resume, ResumeScorecard, ResumeShareLink
@@ -329,9 +329,17 @@ class ResumeService:
         if not scorecard:
             return None
         
-        # Update view count and last viewed
-        share_link.view_count += 1
-        share_link.last_viewed_at = datetime.utcnow()
+        # Update view count and last viewed in one atomic statement so
+        # concurrent views can't lose increments
+        await db.execute(
+            update(ResumeShareLink)
+            .where(ResumeShareLink.id == share_link.id)
+            .values(
+                view_count=ResumeShareLink.view_count + 1,
+                last_viewed_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
         
         # Return privacy-safe data (NO personal info)
@@ -2,6 +2,8 @@
 Job scheduler using APScheduler.
 Schedules periodic job fetching from all active sources.
 Schedules daily batch matching for all users.
+Schedules daily creation of upcoming monthly table partitions.
+Schedules weekly clustering of read-mostly tables.
 """
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -10,6 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import AsyncSessionLocal
 from app.services.job_service import JobService
 from app.services.match_service import MatchComputationService
+from app.services.partitions import ensure_partitions
+from app.services.table_maintenance import cluster_tables
 from app.services.scheduler_monitor import get_monitor, JobStatus
 import logging
 
@@ -139,6 +143,61 @@ async def batch_compute_matches():
             )
 
 
+async def maintain_partitions():
+    """
+    Background task to create upcoming monthly partitions.
+    Idempotent, so it runs daily to tolerate missed runs.
+    """
+    job_id = "maintain_partitions"
+    execution = monitor.start_execution(job_id, "Create upcoming monthly partitions")
+    
+    async with AsyncSessionLocal() as db:
+        try:
+            partitions = await ensure_partitions(db)
+            
+            monitor.complete_execution(
+                execution,
+                JobStatus.SUCCESS,
+                metrics={"partitions_ensured": len(partitions)}
+            )
+            
+        except Exception as e:
+            logger.error(f"Error maintaining partitions: {e}")
+            await db.rollback()
+            monitor.complete_execution(
+                execution,
+                JobStatus.FAILED,
+                error_message=str(e)
+            )
+
+
+async def cluster_read_mostly_tables():
+    """
+    Background task to re-cluster read-mostly tables on their hot index.
+    Runs weekly, after the nightly market data refresh has settled.
+    """
+    job_id = "cluster_read_mostly_tables"
+    execution = monitor.start_execution(job_id, "Cluster read-mostly tables")
+    
+    async with AsyncSessionLocal() as db:
+        try:
+            tables = await cluster_tables(db)
+            
+            monitor.complete_execution(
+                execution,
+                JobStatus.SUCCESS,
+                metrics={"tables_clustered": len(tables)}
+            )
+            
+        except Exception as e:
+            logger.error(f"Error clustering tables: {e}")
+            monitor.complete_execution(
+                execution,
+                JobStatus.FAILED,
+                error_message=str(e)
+            )
+
+
 def start_scheduler():
     """Start the job scheduler."""
     if not scheduler.running:
@@ -157,6 +216,20 @@ def start_scheduler():
             max_duration_minutes=120,  # Should complete within 2 hours
         )
         
+        monitor.register_job(
+            job_id="maintain_partitions",
+            job_name="Create upcoming monthly partitions",
+            expected_interval_minutes=1440,  # Daily (24 hours)
+            max_duration_minutes=5,
+        )
+        
+        monitor.register_job(
+            job_id="cluster_read_mostly_tables",
+            job_name="Cluster read-mostly tables",
+            expected_interval_minutes=10080,  # Weekly (7 days)
+            max_duration_minutes=30,
+        )
+        
         # Schedule job fetching every hour
         scheduler.add_job(
             fetch_all_sources,
@@ -175,6 +248,24 @@ def start_scheduler():
             replace_existing=True,
         )
         
+        # Schedule partition maintenance daily at 2 AM
+        scheduler.add_job(
+            maintain_partitions,
+            trigger=CronTrigger(hour=2, minute=0),
+            id='maintain_partitions',
+            name='Create upcoming monthly partitions',
+            replace_existing=True,
+        )
+        
+        # Schedule clustering weekly on Sunday at 4 AM
+        scheduler.add_job(
+            cluster_read_mostly_tables,
+            trigger=CronTrigger(day_of_week='sun', hour=4, minute=0),
+            id='cluster_read_mostly_tables',
+            name='Cluster read-mostly tables',
+            replace_existing=True,
+        )
+        
         scheduler.start()
         logger.info("Job scheduler started - fetching jobs every hour, batch matching daily at 3 AM")
         logger.info("Scheduler monitoring enabled with health checks")
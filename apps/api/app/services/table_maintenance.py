@@ -0,0 +1,68 @@
+"""
+Periodic physical maintenance for read-mostly tables.
+On Postgres, skill_market_data is CLUSTERed on its skill_name index so a
+scoring pass over a user's missing skills reads a handful of adjacent
+pages. Tables are created with fillfactor=100, so the clustered order
+survives until the next nightly refresh.
+"""
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (table, column whose index to cluster on)
+CLUSTERED_TABLES = [
+    ("skill_market_data", "skill_name"),
+]
+
+
+async def _column_index(db: AsyncSession, table: str, column: str) -> Optional[str]:
+    """
+    Name of the single-column index on table.column, if there is one.
+
+    The name depends on how the table was created: create_all names it
+    ix_skill_market_data_skill_name, migrations/003 idx_skill_market_data_name.
+    """
+    result = await db.execute(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE tablename = :table AND indexdef LIKE :suffix "
+            "ORDER BY indexname LIMIT 1"
+        ),
+        {"table": table, "suffix": f"%({column})"},
+    )
+    return result.scalar_one_or_none()
+
+
+async def cluster_tables(db: AsyncSession) -> List[str]:
+    """
+    CLUSTER and ANALYZE read-mostly tables on their hot index.
+
+    No-op on databases other than Postgres.
+
+    Returns:
+        Names of the tables clustered
+    """
+    if db.bind.dialect.name != "postgresql":
+        return []
+
+    clustered = []
+
+    for table, column in CLUSTERED_TABLES:
+        index = await _column_index(db, table, column)
+        if index is None:
+            logger.warning(f"No index on {table}.{column}; skipping CLUSTER")
+            continue
+
+        try:
+            await db.execute(text(f"CLUSTER {table} USING {index}"))
+            await db.execute(text(f"ANALYZE {table}"))
+            await db.commit()
+            clustered.append(table)
+        except Exception as e:
+            logger.error(f"Error clustering {table}: {e}")
+            await db.rollback()
+
+    return clustered
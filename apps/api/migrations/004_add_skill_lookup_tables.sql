@@ -0,0 +1,85 @@
+-- Migration: Add Skill Lookup Tables
+-- Description: Replaces free-text category/importance/difficulty/resource type columns
+--              with SMALLINT foreign keys into small lookup tables
+-- Version: 004
+-- Date: 2025-01-18
+
+-- Lookup tables (ids must match the Lookup definitions in app/models/ai_skills.py)
+-- Id columns match the models' nullability; values the lookups don't know fall back
+-- to technical / important / intermediate / course, which are also the column defaults
+CREATE TABLE IF NOT EXISTS skill_categories (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(50) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS skill_importance_levels (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(20) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS difficulty_levels (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(20) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS resource_types (
+    id SMALLINT PRIMARY KEY,
+    name VARCHAR(50) NOT NULL UNIQUE
+);
+
+INSERT INTO skill_categories (id, name) VALUES
+    (1, 'technical'), (2, 'soft'), (3, 'certification'), (4, 'domain')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO skill_importance_levels (id, name) VALUES
+    (1, 'critical'), (2, 'important'), (3, 'nice-to-have')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO difficulty_levels (id, name) VALUES
+    (1, 'beginner'), (2, 'intermediate'), (3, 'advanced')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO resource_types (id, name) VALUES
+    (1, 'course'), (2, 'certification'), (3, 'book'), (4, 'tutorial'), (5, 'practice')
+ON CONFLICT (id) DO NOTHING;
+
+-- Skill gaps
+ALTER TABLE skill_gaps ADD COLUMN skill_category_id SMALLINT NOT NULL DEFAULT 1 REFERENCES skill_categories(id);
+ALTER TABLE skill_gaps ADD COLUMN importance_id SMALLINT NOT NULL DEFAULT 2 REFERENCES skill_importance_levels(id);
+ALTER TABLE skill_gaps ADD COLUMN difficulty_level_id SMALLINT DEFAULT 2 REFERENCES difficulty_levels(id);
+
+UPDATE skill_gaps SET
+    skill_category_id = COALESCE((SELECT id FROM skill_categories WHERE name = skill_gaps.skill_category), 1),
+    importance_id = COALESCE((SELECT id FROM skill_importance_levels WHERE name = skill_gaps.importance), 2),
+    difficulty_level_id = COALESCE((SELECT id FROM difficulty_levels WHERE name = skill_gaps.difficulty_level), 2);
+
+ALTER TABLE skill_gaps DROP COLUMN skill_category;
+ALTER TABLE skill_gaps DROP COLUMN importance;
+ALTER TABLE skill_gaps DROP COLUMN difficulty_level;
+
+-- Learning resources
+ALTER TABLE learning_resources ADD COLUMN resource_type_id SMALLINT NOT NULL DEFAULT 1 REFERENCES resource_types(id);
+ALTER TABLE learning_resources ADD COLUMN difficulty_id SMALLINT NOT NULL DEFAULT 2 REFERENCES difficulty_levels(id);
+
+UPDATE learning_resources SET
+    resource_type_id = COALESCE((SELECT id FROM resource_types WHERE name = learning_resources.resource_type), 1),
+    difficulty_id = COALESCE((SELECT id FROM difficulty_levels WHERE name = learning_resources.difficulty), 2);
+
+ALTER TABLE learning_resources DROP COLUMN resource_type;
+ALTER TABLE learning_resources DROP COLUMN difficulty;
+
+-- Skill market data
+ALTER TABLE skill_market_data ADD COLUMN skill_category_id SMALLINT NOT NULL DEFAULT 1 REFERENCES skill_categories(id);
+
+UPDATE skill_market_data SET
+    skill_category_id = COALESCE((SELECT id FROM skill_categories WHERE name = skill_market_data.skill_category), 1);
+
+ALTER TABLE skill_market_data DROP COLUMN skill_category;
+
+-- Learning paths
+ALTER TABLE learning_paths ADD COLUMN difficulty_level_id SMALLINT NOT NULL DEFAULT 2 REFERENCES difficulty_levels(id);
+
+UPDATE learning_paths SET
+    difficulty_level_id = COALESCE((SELECT id FROM difficulty_levels WHERE name = learning_paths.difficulty_level), 2);
+
+ALTER TABLE learning_paths DROP COLUMN difficulty_level;
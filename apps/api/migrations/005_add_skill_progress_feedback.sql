@@ -0,0 +1,15 @@
+-- Migration: Add Skill Progress Feedback Sidecar
+-- Description: Moves AI feedback out of skill_progress_tracking into a sidecar table
+--              so progress rows stay compact
+-- Version: 005
+-- Date: 2025-01-23
+
+CREATE TABLE IF NOT EXISTS skill_progress_feedback (
+    progress_id VARCHAR(36) PRIMARY KEY REFERENCES skill_progress_tracking(id) ON DELETE CASCADE,
+    ai_feedback TEXT
+);
+
+INSERT INTO skill_progress_feedback (progress_id, ai_feedback)
+SELECT id, ai_feedback FROM skill_progress_tracking WHERE ai_feedback IS NOT NULL;
+
+ALTER TABLE skill_progress_tracking DROP COLUMN ai_feedback;
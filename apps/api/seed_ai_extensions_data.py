@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 from app.core.database import AsyncSessionLocal
 from app.models.user import User
 from app.models.resume import Resume
-from app.models.job import JobPosting, JobSource
+from app.models.job import JobPosting, JobPostingRaw, JobSource
 from app.models.match import JobMatch
 from app.models.apply import JobActivity, ActivityStatus
 from app.services.auth import get_password_hash
@@ -513,12 +513,12 @@ async def seed_ai_extensions_data():
                     url_hash=url_hash,
                     is_active=True,
                     posted_date=datetime.utcnow() - timedelta(days=idx),
-                    raw_data=json.dumps({
+                    raw=JobPostingRaw(raw_data=json.dumps({
                         **job_data,
                         "skills_required": job_data["skills_required"],
                         "skills_nice_to_have": job_data["skills_nice_to_have"],
                         "remote_ok": job_data["remote_ok"]
-                    })
+                    }))
                 )
                 ai_jobs.append(job)
                 db.add(job)
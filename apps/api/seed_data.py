@@ -8,7 +8,7 @@ from app.core.database import AsyncSessionLocal
 from app.models.user import User, Session, AuditLog
 from app.models.resume import Resume, ResumeScorecard
 from app.models.preferences import UserPreferences
-from app.models.job import JobSource, JobPosting
+from app.models.job import JobSource, JobPosting, JobPostingRaw
 from app.models.match import JobMatch
 from app.models.apply import ApplyKit, JobActivity, ActivityStatus
 from app.models.notification import NotificationSettings, NotificationLog
@@ -330,7 +330,7 @@ async def seed_database():
                     url_hash=url_hash,
                     is_active=True,
                     posted_date=datetime.utcnow() - timedelta(days=idx),
-                    raw_data=json.dumps(job_data)
+                    raw=JobPostingRaw(raw_data=json.dumps(job_data))
                 )
                 job_postings.append(job)
             
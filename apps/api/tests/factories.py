@@ -356,15 +356,15 @@ class AIFactory:
             user_id=user_id,
             job_id=job_id,
             base_resume_id=base_resume_id,
-            optimized_content=json.dumps(optimized_content),
+            optimized_content=optimized_content,
             changes_explanation="Enhanced summary with job-relevant keywords. Added AWS and Docker skills. Improved experience descriptions with quantifiable achievements.",
             ats_score=92.0,
             match_score=88.0,
-            keyword_density=json.dumps({
+            keyword_density={
                 "total_keywords": 15,
                 "matched_keywords": ["python", "javascript", "react", "aws"],
                 "density_score": 85.0
-            }),
+            },
             version_number=1,
             created_at=self.factory.get_time_offset(),
             **kwargs
@@ -403,15 +403,15 @@ class AIFactory:
             id=self.factory.get_unique_id(),
             user_id=user_id,
             job_id=job_id,
-            questions=json.dumps(questions),
-            talking_points=json.dumps(talking_points),
-            company_insights=json.dumps({"culture": "Fast-paced, innovative"}),
-            star_examples=json.dumps([]),
-            preparation_checklist=json.dumps([
+            questions=questions,
+            talking_points=talking_points,
+            company_insights={"culture": "Fast-paced, innovative"},
+            star_examples=[],
+            preparation_checklist=[
                 "Review your resume",
                 "Research the company",
                 "Prepare STAR examples"
-            ]),
+            ],
             difficulty_level=difficulty_level,
             estimated_prep_time=120,
             created_at=self.factory.get_time_offset(),
@@ -455,11 +455,11 @@ class AIFactory:
             id=self.factory.get_unique_id(),
             user_id=user_id,
             job_id=job_id,
-            missing_skills=json.dumps(missing_skills),
-            learning_recommendations=json.dumps(learning_recommendations),
-            estimated_timeline=json.dumps({"aws": {"hours": 40, "weeks": 4}}),
-            priority_score=json.dumps({"aws": 95.0, "docker": 75.0}),
-            market_demand=json.dumps({"aws": {"demand_score": 93}}),
+            missing_skills=missing_skills,
+            learning_recommendations=learning_recommendations,
+            estimated_timeline={"aws": {"hours": 40, "weeks": 4}},
+            priority_score={"aws": 95.0, "docker": 75.0},
+            market_demand={"aws": {"demand_score": 93}},
             total_missing_skills=2,
             critical_skills_count=1,
             estimated_total_hours=60,
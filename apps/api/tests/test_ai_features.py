@@ -4,17 +4,30 @@ Tests AI-powered resume versioning, interview preparation, and skill gap analysi
 Uses mocks for deterministic testing without external AI dependencies.
 """
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import patch, MagicMock, AsyncMock
 from app.core.config import settings
 from app.models.user import User
+from app.services.auth import create_access_token
 from app.models.resume import Resume
 from app.models.job import JobPosting
-from app.services.ai.resume_versioning import ResumeVersioningEngine
+from app.models.ai_resume import AIResumeVersion, ResumeOptimizationLog
+from app.models.ai_interview import InterviewKit, InterviewQuestion, CompanyInsight
+from app.models.ai_skills import (
+    SkillMarketData, SkillGap, LearningResource, SkillProgressTracking, SkillProgressFeedback
+)
+from app.services.ai.resume_versioning import (
+    ResumeVersioningEngine, ScoringCtx, content_fingerprints
+)
 from app.services.ai.interview_prep import InterviewPreparationEngine
+from app.services.ai import skill_analyzer
 from app.services.ai.skill_analyzer import SkillAnalyzerEngine
-from uuid import uuid4
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
 import json
 
 
@@ -76,6 +89,33 @@ def mock_job_requirements():
     }
 
 
+@pytest.fixture
+async def job_and_resume(db_session: AsyncSession, mock_resume_data):
+    """A stored job posting and parsed resume for a new user."""
+    user_id = str(uuid4())
+    job = JobPosting(
+        source_id=str(uuid4()),
+        title="Platform Engineer",
+        company="Acme",
+        description="Python services on Kubernetes",
+        requirements="Required: Docker, Kubernetes",
+        application_url="https://acme.example/jobs/1",
+        url_hash="a" * 64,
+    )
+    resume = Resume(
+        user_id=user_id,
+        filename="resume.pdf",
+        file_path="/tmp/resume.pdf",
+        file_size=1024,
+        mime_type="application/pdf",
+        parsed_data=json.dumps(mock_resume_data),
+        is_parsed=True,
+    )
+    db_session.add_all([job, resume])
+    await db_session.commit()
+    return user_id, job, resume
+
+
 # ============================================================
 # Resume Versioning Engine Tests
 # ============================================================
@@ -112,6 +152,71 @@ class TestResumeVersioningEngine:
         result = engine._parse_resume_content("not valid json")
         assert result == {}
     
+    async def test_generate_version_logs_in_same_commit(self, db_session: AsyncSession, job_and_resume):
+        """Test a generated version and its log are stored, and failures are logged."""
+        user_id, job, resume = job_and_resume
+        
+        engine = ResumeVersioningEngine()
+        version = await engine.generate_version(db_session, user_id, job.id, resume.id)
+        with pytest.raises(HTTPException) as exc_info:
+            await engine.generate_version(db_session, user_id, job.id, str(uuid4()), regenerate=True)
+        
+        logs = (await db_session.execute(
+            select(ResumeOptimizationLog).where(ResumeOptimizationLog.user_id == user_id)
+        )).scalars().all()
+        assert version["created_at"]
+        assert exc_info.value.status_code == 404
+        assert sorted((log.success, log.version_id) for log in logs) == [
+            (False, None), (True, version["id"])
+        ]
+    
+    async def test_get_version_returns_newest_active(self, db_session: AsyncSession):
+        """Test regenerated versions don't break the latest version lookup."""
+        user_id, job_id = str(uuid4()), str(uuid4())
+        versions = [
+            AIResumeVersion(
+                user_id=user_id,
+                job_id=job_id,
+                base_resume_id=str(uuid4()),
+                optimized_content={},
+                changes_explanation="Optimized.",
+                ats_score=50.0,
+                match_score=50.0,
+                created_at=datetime(2025, 1, day, tzinfo=timezone.utc),
+            )
+            for day in (1, 2)
+        ]
+        db_session.add_all(versions)
+        await db_session.commit()
+        
+        version = await ResumeVersioningEngine().get_version(db_session, user_id, job_id)
+        assert version["id"] == versions[1].id
+    
+    async def test_parse_job_requirements(self):
+        """Test skills match whole words and keywords keep first-seen order."""
+        engine = ResumeVersioningEngine()
+        job = JobPosting(
+            title="Backend Engineer",
+            company="Acme",
+            description="Maintain Python services on AWS",
+            requirements="Docker, GitHub, Python",
+        )
+        requirements = engine._parse_job_requirements(job)
+        assert requirements["skills"] == ["python", "aws", "docker"]
+        assert requirements["keywords"] == ["maintain", "python", "services", "aws", "docker", "github"]
+        
+        # Parsing is memoized on the job text; callers still get their own lists
+        requirements["skills"].append("go")
+        assert engine._parse_job_requirements(job)["skills"] == ["python", "aws", "docker"]
+    
+    async def test_parse_job_requirements_caps_keywords(self):
+        """Test only the first 20 unique keywords are kept."""
+        engine = ResumeVersioningEngine()
+        words = [f"kw{a}{b}" for a in "ab" for b in "abcdefghijklmno"]
+        job = JobPosting(title="Engineer", company="Acme", description=" ".join(words * 3))
+        keywords = engine._parse_job_requirements(job)["keywords"]
+        assert keywords == words[:20]
+    
     async def test_calculate_ats_score(self, mock_resume_data, mock_job_requirements):
         """Test ATS score calculation."""
         engine = ResumeVersioningEngine()
@@ -138,6 +243,62 @@ class TestResumeVersioningEngine:
         assert "density_score" in analysis
         assert isinstance(analysis["density_score"], float)
     
+    async def test_optimize_keywords_skips_present_skills_any_case(self):
+        """Test job skills already on the resume aren't added again, whatever their case."""
+        engine = ResumeVersioningEngine()
+        content = {"skills": ["python", "Docker"]}
+        job_requirements = {"skills": ["Python", "docker", "AWS", "aws"]}
+        optimized = await engine._optimize_keywords(content, job_requirements)
+        assert optimized["skills"] == ["python", "Docker", "Aws"]
+    
+    async def test_optimize_resume_leaves_base_resume_intact(self, mock_resume_data, mock_job_requirements):
+        """Test optimization replaces changed sections instead of mutating the base resume."""
+        engine = ResumeVersioningEngine()
+        original = json.loads(json.dumps(mock_resume_data))
+        optimized = await engine._optimize_resume(
+            mock_resume_data, mock_job_requirements, ["keywords", "ats_score", "formatting"]
+        )
+        
+        assert mock_resume_data == original
+        assert optimized["skills"][-2:] == ["Docker", "Kubernetes"]
+        assert all(exp["achievements"] for exp in optimized["experience"])
+        assert optimized["education"] is mock_resume_data["education"]
+        
+        explanation = engine._generate_explanation(mock_resume_data, optimized, mock_job_requirements)
+        assert "Added relevant skills: docker, kubernetes" in explanation
+    
+    async def test_match_score_title_words(self):
+        """Test title relevance needs a shared word, not a substring."""
+        engine = ResumeVersioningEngine()
+        job_requirements = {"skills": [], "title": "Data Engineer"}
+        assert engine._calculate_match_score({"title": "Senior Engineer"}, job_requirements) == 25.0
+        assert engine._calculate_match_score({"title": "Engineering Manager"}, job_requirements) == 0.0
+    
+    async def test_analyze_keywords_matches_text_tokens(self):
+        """Test keywords match whole words in resume text, not section names."""
+        engine = ResumeVersioningEngine()
+        content = {
+            "summary": "Built Python services",
+            "experience": [{"description": "Shipped Docker images"}]
+        }
+        job_requirements = {"keywords": ["python", "docker", "experience", "ship"]}
+        analysis = engine._analyze_keywords(content, job_requirements)
+        assert analysis["matched_keywords"] == ["python", "docker"]
+        assert analysis["missing_keywords"] == ["experience", "ship"]
+    
+    async def test_scores_with_shared_context(self, mock_resume_data, mock_job_requirements):
+        """Test a prebuilt scoring context gives the same scores as building per call."""
+        engine = ResumeVersioningEngine()
+        ctx = ScoringCtx.build(mock_resume_data, mock_job_requirements)
+        assert ctx.job_skills_lc == {"python", "aws", "docker", "kubernetes"}
+        
+        assert engine._calculate_ats_score(mock_resume_data, mock_job_requirements, ctx) == \
+            engine._calculate_ats_score(mock_resume_data, mock_job_requirements)
+        assert engine._calculate_match_score(mock_resume_data, mock_job_requirements, ctx) == \
+            engine._calculate_match_score(mock_resume_data, mock_job_requirements)
+        assert engine._analyze_keywords(mock_resume_data, mock_job_requirements, ctx) == \
+            engine._analyze_keywords(mock_resume_data, mock_job_requirements)
+    
     async def test_generate_explanation(self, mock_resume_data, mock_job_requirements):
         """Test explanation generation."""
         engine = ResumeVersioningEngine()
@@ -161,6 +322,8 @@ class TestResumeVersioningEngine:
         assert "skills_removed" in differences
         assert "sections_changed" in differences
         assert "go" in [s.lower() for s in differences["skills_added"]]
+        assert differences["skills_added"] == ["go", "rust"]
+        assert differences["skills_removed"] == []
     
     async def test_calculate_similarity(self, mock_resume_data):
         """Test similarity calculation."""
@@ -176,6 +339,49 @@ class TestResumeVersioningEngine:
         content_b["summary"] = "Different summary"
         similarity = engine._calculate_similarity(content_a, content_b)
         assert similarity < 100.0
+    
+    async def test_content_fingerprints(self, mock_resume_data):
+        """Test field fingerprints ignore key order and treat None as missing."""
+        reordered = {key: mock_resume_data[key] for key in reversed(mock_resume_data)}
+        assert content_fingerprints(reordered) == content_fingerprints(mock_resume_data)
+        assert content_fingerprints({"summary": None}) == {}
+        
+        engine = ResumeVersioningEngine()
+        assert engine._changed_fields({"summary": None}, {}) == frozenset()
+    
+    async def test_generate_version_stores_fingerprints(self, db_session: AsyncSession, job_and_resume):
+        """Test compare reads stored fingerprints instead of rehashing content."""
+        user_id, job, resume = job_and_resume
+        
+        engine = ResumeVersioningEngine()
+        version_a = await engine.generate_version(db_session, user_id, job.id, resume.id)
+        version_b = await engine.generate_version(
+            db_session, user_id, job.id, resume.id, optimization_focus=["formatting"], regenerate=True
+        )
+        stored = await db_session.get(AIResumeVersion, version_a["id"])
+        assert stored.content_fingerprints == content_fingerprints(version_a["optimized_content"])
+        
+        with patch(
+            "app.services.ai.resume_versioning.content_fingerprints",
+            side_effect=AssertionError("fingerprints recomputed"),
+        ):
+            comparison = await engine.compare_versions(db_session, user_id, version_a["id"], version_b["id"])
+        assert 0 <= comparison["comparison"]["similarity_score"] <= 100
+    
+    async def test_changed_fields_shared_by_comparison(self, mock_resume_data):
+        """Test differences and similarity agree when given the same changed fields."""
+        engine = ResumeVersioningEngine()
+        content_a = mock_resume_data.copy()
+        content_b = mock_resume_data.copy()
+        content_b["summary"] = "Different summary"
+        
+        changed = engine._changed_fields(content_a, content_b)
+        assert changed == {"summary"}
+        
+        differences = engine._calculate_differences(content_a, content_b, changed)
+        assert differences["sections_changed"] == ["summary"]
+        assert engine._calculate_similarity(content_a, content_b, changed) == \
+            engine._calculate_similarity(content_a, content_b)
 
 
 # ============================================================
@@ -203,6 +409,29 @@ class TestInterviewPreparationEngine:
         assert "Leadership" in engine.star_competencies
         assert "Problem Solving" in engine.star_competencies
     
+    async def test_parse_resume_content_cached(self, mock_resume_data):
+        """Test a resume blob is decoded once and invalid blobs fall back to {}."""
+        engine = InterviewPreparationEngine()
+        blob = json.dumps(mock_resume_data)
+        first = engine._parse_resume_content(blob)
+        assert first == mock_resume_data
+        assert engine._parse_resume_content(blob) is first
+        assert engine._parse_resume_content("not valid json") == {}
+    
+    async def test_analyze_user_answer_cues(self):
+        """Test answer feedback picks up specificity and strength cues."""
+        engine = InterviewPreparationEngine()
+        specific = await engine._analyze_user_answer(
+            "Tell me about a project", "behavioral", "I led two Projects with my teammates.", {}
+        )
+        vague = await engine._analyze_user_answer(
+            "Tell me about a project", "behavioral", "it went well", {}
+        )
+        assert specific["feedback"]["specificity"] == "Good use of specific examples"
+        assert specific["strengths"][1] == "Relevant experience mentioned"
+        assert vague["feedback"]["specificity"] == "Add more specific examples"
+        assert vague["strengths"][1] == "Good foundation"
+    
     async def test_extract_skills_from_text(self):
         """Test skill extraction from job text."""
         engine = InterviewPreparationEngine()
@@ -213,6 +442,34 @@ class TestInterviewPreparationEngine:
         assert "javascript" in skills
         assert "aws" in skills
     
+    async def test_extract_skills_whole_words(self):
+        """Test skills only match as whole words."""
+        engine = InterviewPreparationEngine()
+        skills = engine._extract_skills("Maintain our JavaScript and C++ services, CI/CD on Linux.")
+        assert skills == ["javascript", "ci/cd", "c++", "linux"]
+    
+    async def test_classify_jobs_matches_per_record(self):
+        """Test batch classification agrees with the per-posting extractors."""
+        engine = InterviewPreparationEngine()
+        jobs = [
+            JobPosting(title="Senior Engineer", company="TechCorp", description="Python, AWS and Docker", requirements="Go"),
+            JobPosting(title="Junior Analyst", company="First Bank", description="SQL", requirements="Excel"),
+            JobPosting(title="Nurse", company="HealthCare Plus", description="Patient care", requirements=""),
+        ]
+        
+        results = engine.classify_jobs(jobs)
+        
+        assert results == [
+            {
+                "skills": engine._extract_skills(f"{job.description} {job.requirements}"),
+                "seniority": engine._extract_seniority(job.title),
+                "industry": engine._extract_industry(job.company),
+            }
+            for job in jobs
+        ]
+        assert results[0]["skills"] == ["python", "aws", "docker", "go"]
+        assert results[2]["skills"] == []
+    
     async def test_extract_seniority_senior(self):
         """Test seniority extraction for senior roles."""
         engine = InterviewPreparationEngine()
@@ -233,6 +490,12 @@ class TestInterviewPreparationEngine:
         assert engine._extract_seniority("Software Engineer") == "mid"
         assert engine._extract_seniority("Developer") == "mid"
     
+    async def test_extract_seniority_whole_words(self):
+        """Test seniority keywords only match whole title words."""
+        engine = InterviewPreparationEngine()
+        assert engine._extract_seniority("Sr. Backend Engineer") == "senior"
+        assert engine._extract_seniority("Staffing Coordinator") == "mid"
+    
     async def test_extract_industry(self):
         """Test industry extraction from company name."""
         engine = InterviewPreparationEngine()
@@ -293,6 +556,63 @@ class TestInterviewPreparationEngine:
         time_advanced = engine._calculate_prep_time(10, "advanced")
         assert time_basic > 0
         assert time_advanced > time_basic
+    
+    async def test_company_insights_cached(self, db_session: AsyncSession):
+        """Test repeated company insight lookups are served from the cache."""
+        engine = InterviewPreparationEngine()
+        first = await engine.get_company_insights(db_session, "TechCorp Inc")
+        first["values"].append("Mutated")
+        
+        # No session needed on a cache hit
+        second = await engine.get_company_insights(None, "TechCorp Inc")
+        
+        assert "Mutated" not in second["values"]
+        assert second["questions_to_ask"] == first["questions_to_ask"]
+    
+    async def test_company_insights_upserted_once(self, db_session: AsyncSession):
+        """Test separate engines share one stored insight row per company."""
+        first = await InterviewPreparationEngine().get_company_insights(db_session, "Upsert Corp")
+        second = await InterviewPreparationEngine().get_company_insights(db_session, "Upsert Corp")
+        
+        rows = await db_session.execute(
+            select(CompanyInsight).where(CompanyInsight.company_name == "Upsert Corp")
+        )
+        assert len(rows.scalars().all()) == 1
+        assert second == first
+    
+    @pytest.mark.parametrize("error", [SQLAlchemyError("boom"), TypeError("bad row")])
+    async def test_generate_interview_kit_keeps_insights_on_write_failure(self, db_session: AsyncSession, job_and_resume, error):
+        """Test a failed kit write rolls back the kit but keeps company insights, whatever the error."""
+        user_id, job, _ = job_and_resume
+        job_id, company = job.id, job.company
+        
+        engine = InterviewPreparationEngine()
+        with patch.object(engine, "_create_star_records", AsyncMock(side_effect=error)):
+            with pytest.raises(type(error)):
+                await engine.generate_interview_kit(db_session, user_id, job_id)
+        
+        kits = await db_session.execute(select(InterviewKit).where(InterviewKit.user_id == user_id))
+        insights = await db_session.execute(
+            select(CompanyInsight).where(CompanyInsight.company_name == company)
+        )
+        assert kits.scalars().all() == []
+        assert insights.scalar_one_or_none() is not None
+    
+    async def test_generate_interview_kit_reuses_existing_kit(self, db_session: AsyncSession, job_and_resume):
+        """Test kit generation end to end, then that the saved kit is returned."""
+        user_id, job, _ = job_and_resume
+        
+        engine = InterviewPreparationEngine()
+        kit = await engine.generate_interview_kit(db_session, user_id, job.id)
+        again = await engine.generate_interview_kit(db_session, user_id, job.id)
+        
+        assert len(kit["questions"]) > 0
+        assert again == kit
+        
+        stored = await db_session.execute(
+            select(InterviewQuestion.order_index).where(InterviewQuestion.kit_id == kit["id"])
+        )
+        assert sorted(stored.scalars()) == list(range(len(kit["questions"])))
 
 
 # ============================================================
@@ -335,6 +655,12 @@ class TestSkillAnalyzerEngine:
         assert "market_demand" in python_skill
         assert "avg_salary_impact" in python_skill
     
+    async def test_skill_database_shared_read_only(self):
+        """Test engines share one skill database that can't be modified."""
+        assert SkillAnalyzerEngine().skill_database is SkillAnalyzerEngine().skill_database
+        with pytest.raises(TypeError):
+            SkillAnalyzerEngine().skill_database["cobol"] = {}
+    
     async def test_extract_user_skills(self, mock_resume_data):
         """Test user skill extraction from resume."""
         engine = SkillAnalyzerEngine()
@@ -344,6 +670,55 @@ class TestSkillAnalyzerEngine:
         skill_names = [s["name"] for s in skills]
         assert "python" in skill_names
     
+    async def test_extract_user_skills_once_per_skill(self):
+        """Test experience mentions add each unlisted skill once, in skill database order."""
+        engine = SkillAnalyzerEngine()
+        skills = engine._extract_user_skills({
+            "skills": ["Python"],
+            "experience": [
+                {"description": "Python and Docker services"},
+                {"description": "Docker on AWS"},
+            ],
+        })
+        assert [(s["name"], s["level"]) for s in skills] == [("python", 3), ("aws", 2), ("docker", 2)]
+    
+    async def test_extract_required_skills_whole_words(self):
+        """Test skill names inside other words aren't counted as requirements."""
+        engine = SkillAnalyzerEngine()
+        job_requirements = {
+            "description": "A good JavaScript engineer to maintain our services",
+            "requirements": "Docker",
+            "seniority": "senior"
+        }
+        skills = engine._extract_required_skills(job_requirements)
+        assert [s["name"] for s in skills] == ["javascript", "docker"]
+        assert {s["required_level"] for s in skills} == {4}
+    
+    async def test_extract_required_skills_importance_from_nearby_cues(self):
+        """Test each skill takes its importance from the closest cue word."""
+        engine = SkillAnalyzerEngine()
+        job_requirements = {
+            "description": "We build our platform in Python, which is required. " + "x" * 80,
+            "requirements": "Experience with Kubernetes is a plus. " + "y" * 80 + " Also Redis."
+        }
+        importance = {s["name"]: s["importance"] for s in engine._extract_required_skills(job_requirements)}
+        assert importance == {"python": "critical", "kubernetes": "nice-to-have", "redis": "important"}
+    
+    async def test_extract_required_skills_reuses_job_scan(self):
+        """Test the same job text is scanned once and each call gets its own dicts."""
+        engine = SkillAnalyzerEngine()
+        job_requirements = {"description": "Python and Docker required", "requirements": "AWS is a plus"}
+        first = engine._extract_required_skills({**job_requirements, "seniority": "junior"})
+        first[0]["importance"] = "changed"
+        
+        with patch.object(skill_analyzer, "_SKILL_MATCHER") as matcher:
+            second = engine._extract_required_skills({**job_requirements, "seniority": "senior"})
+        matcher.finditer.assert_not_called()
+        assert [(s["name"], s["importance"]) for s in second] == [
+            ("python", "critical"), ("aws", "critical"), ("docker", "critical")
+        ]
+        assert {s["required_level"] for s in second} == {4}
+        
     async def test_calculate_learning_timeline(self):
         """Test learning timeline calculation."""
         engine = SkillAnalyzerEngine()
@@ -357,6 +732,21 @@ class TestSkillAnalyzerEngine:
         assert "kubernetes" in timeline
         assert "docker" in timeline
     
+    async def test_learning_timeline_order_and_weeks(self):
+        """Test critical skills come first, ties keep their order, and weeks accumulate."""
+        engine = SkillAnalyzerEngine()
+        skill_gaps = [
+            {"skill_name": "go", "importance": "nice-to-have", "estimated_learning_hours": 80},
+            {"skill_name": "docker", "importance": "important", "estimated_learning_hours": 40},
+            {"skill_name": "kubernetes", "importance": "critical", "estimated_learning_hours": 60},
+            {"skill_name": "aws", "importance": "critical", "estimated_learning_hours": 30}
+        ]
+        timeline = engine._calculate_learning_timeline(skill_gaps)
+        assert list(timeline) == ["kubernetes", "aws", "docker", "go"]
+        assert [(t["start_week"], t["end_week"]) for t in timeline.values()] == [(0, 1), (1, 2), (2, 3), (3, 5)]
+        assert timeline["go"] == {"hours": 80, "start_week": 3, "end_week": 5, "priority": "nice-to-have"}
+        assert engine._calculate_learning_timeline([]) == {}
+    
     async def test_calculate_priority_scores(self, mock_job_requirements):
         """Test priority score calculation."""
         engine = SkillAnalyzerEngine()
@@ -371,15 +761,141 @@ class TestSkillAnalyzerEngine:
         # Critical skill should have higher priority
         assert scores["kubernetes"] > scores["docker"]
     
+    async def test_identify_skill_gaps_scores(self):
+        """Test complete and partial gap scores; met requirements are not gaps."""
+        engine = SkillAnalyzerEngine()
+        user_skills = [{"name": "python", "level": 3}, {"name": "docker", "level": 3}]
+        required_skills = [
+            {"name": "kubernetes", "required_level": 3, "importance": "critical", "category": "technical", "market_demand": 85, "salary_impact": 18000},
+            {"name": "python", "required_level": 4, "importance": "critical", "category": "technical", "market_demand": 95, "salary_impact": 15000},
+            {"name": "docker", "required_level": 3, "importance": "important", "category": "technical", "market_demand": 89, "salary_impact": 12000}
+        ]
+        skill_gaps = await engine._identify_skill_gaps(user_skills, required_skills)
+        gaps = {g["skill_name"]: g for g in skill_gaps}
+        assert set(gaps) == {"kubernetes", "python"}
+        assert gaps["kubernetes"]["gap_score"] == 100.0
+        assert gaps["kubernetes"]["current_level"] == 0
+        assert gaps["python"]["gap_score"] == 25.0
+        assert gaps["python"]["current_level"] == 3
+        # Base hours by difficulty, scaled by the gap
+        assert gaps["kubernetes"]["estimated_learning_hours"] == 80
+        assert gaps["python"]["estimated_learning_hours"] == 10
+        assert isinstance(gaps["python"]["estimated_learning_hours"], int)
+    
+    async def test_skill_gap_lookup_names(self, db_session: AsyncSession):
+        """Test lookup names read, write and filter through the SMALLINT id columns."""
+        analysis_id = str(uuid4())
+        db_session.add_all([
+            SkillGap(
+                analysis_id=analysis_id, user_id="user-1", skill_name=name,
+                skill_category="technical", importance=importance,
+                required_level=3, gap_score=50.0, estimated_learning_hours=40
+            )
+            for name, importance in (("docker", "critical"), ("go", "nice-to-have"))
+        ])
+        await db_session.commit()
+        
+        critical = (await db_session.execute(
+            select(SkillGap.skill_name).where(
+                SkillGap.analysis_id == analysis_id, SkillGap.importance == "critical"
+            )
+        )).scalars().all()
+        assert critical == ["docker"]
+        
+        gap = SkillGap()
+        with pytest.raises(ValueError, match="Unknown importance 'urgent'"):
+            gap.importance = "urgent"
+    
+    async def test_get_market_data_stored_and_fallback(self, db_session: AsyncSession):
+        """Test stored market data is used where present and the skill database elsewhere."""
+        db_session.add(SkillMarketData(
+            skill_name="docker",
+            skill_category="technical",
+            demand_score=61.0,
+            job_postings_count=1200,
+            confidence_score=90.0,
+        ))
+        await db_session.commit()
+        
+        engine = SkillAnalyzerEngine()
+        market_data = await engine._get_market_data(db_session, ["docker", "kubernetes"])
+        assert market_data["docker"]["demand_score"] == 61.0
+        assert market_data["docker"]["job_postings_count"] == 1200
+        assert market_data["kubernetes"]["demand_score"] == 85
+        assert await engine._get_market_data(db_session, []) == {}
+    
+    async def test_update_skill_progress_stores_json(self, db_session: AsyncSession):
+        """Test progress updates store certifications and feedback as compact JSON."""
+        user_id = str(uuid4())
+        engine = SkillAnalyzerEngine()
+        result = await engine.update_skill_progress(db_session, user_id, "aws", {
+            "current_level": 2.5,
+            "progress_percentage": 60.0,
+            "hours_invested": 30.0,
+            "certifications_earned": ["AWS Cloud Practitioner"],
+        })
+        
+        record = (await db_session.execute(
+            select(SkillProgressTracking).where(SkillProgressTracking.user_id == user_id)
+        )).scalar_one()
+        feedback = await db_session.get(SkillProgressFeedback, record.id)
+        assert record.certifications_earned == '["AWS Cloud Practitioner"]'
+        assert json.loads(feedback.ai_feedback) == result["ai_feedback"]
+    
+    async def test_update_skill_progress_upserts_one_record(self, db_session: AsyncSession):
+        """Test repeat updates change one record, keep unsent fields and track the previous level."""
+        user_id = str(uuid4())
+        engine = SkillAnalyzerEngine()
+        await engine.update_skill_progress(db_session, user_id, "docker", {
+            "current_level": 1.0,
+            "progress_percentage": 20.0,
+            "hours_invested": 10.0,
+            "progress_notes": "Started the course",
+        })
+        result = await engine.update_skill_progress(db_session, user_id, "docker", {
+            "current_level": 2.0,
+            "progress_percentage": 80.0,
+        })
+        
+        records = (await db_session.execute(
+            select(SkillProgressTracking).where(SkillProgressTracking.user_id == user_id)
+        )).scalars().all()
+        assert len(records) == 1
+        record = records[0]
+        assert (record.previous_level, record.current_level) == (1.0, 2.0)
+        assert record.hours_invested == 10.0
+        assert record.progress_notes == "Started the course"
+        feedback = await db_session.get(SkillProgressFeedback, record.id)
+        assert json.loads(feedback.ai_feedback) == result["ai_feedback"]
+        assert result["ai_feedback"]["overall_assessment"] == "Good progress"
+        
+    async def test_calculate_readiness_score(self):
+        """Test readiness score from coverage and critical gap penalty."""
+        engine = SkillAnalyzerEngine()
+        required_skills = [{"name": f"skill{i}"} for i in range(4)]
+        skill_gaps = [{"importance": "critical"}, {"importance": "important"}]
+        assert engine._calculate_readiness_score([], required_skills, skill_gaps) == 40.0
+        assert engine._calculate_readiness_score([], [], []) == 100.0
+    
     async def test_get_learning_resources_for_skill(self):
         """Test learning resource retrieval."""
         engine = SkillAnalyzerEngine()
         resources = engine._get_learning_resources_for_skill("python", "intermediate")
-        assert isinstance(resources, list)
+        assert isinstance(resources, tuple)
         assert len(resources) > 0
         assert all("title" in r for r in resources)
         assert all("provider" in r for r in resources)
     
+    async def test_generic_learning_resources_cached(self):
+        """Test generic resources are named after the skill and built once per skill."""
+        engine = SkillAnalyzerEngine()
+        resources = engine._get_learning_resources_for_skill("terraform", "intermediate")
+        assert resources[0]["title"] == "Complete Terraform Guide"
+        assert engine._get_learning_resources_for_skill("terraform", "advanced") is resources
+        with pytest.raises(TypeError):
+            resources[0]["title"] = "Changed"
+        assert engine._get_skill_info("cobol") == engine._get_skill_info("fortran")
+    
     async def test_generate_progress_feedback(self):
         """Test progress feedback generation."""
         engine = SkillAnalyzerEngine()
@@ -394,6 +910,49 @@ class TestSkillAnalyzerEngine:
         
         feedback = engine._generate_progress_feedback(progress_record, progress_data)
         assert isinstance(feedback, dict)
+    
+    async def test_analyze_skill_gaps_stores_documents(self, db_session: AsyncSession, job_and_resume):
+        """Test analysis and learning path documents round-trip without re-encoding."""
+        user_id, job, _ = job_and_resume
+        
+        engine = SkillAnalyzerEngine()
+        analysis = await engine.analyze_skill_gaps(db_session, user_id, job.id)
+        stored = await engine.get_skill_analysis(db_session, user_id, job.id)
+        assert stored["missing_skills"] == analysis["missing_skills"]
+        assert {gap["skill_name"] for gap in stored["missing_skills"]} >= {"docker", "kubernetes"}
+        
+        path = await engine.get_learning_path(db_session, user_id, analysis["id"])
+        assert path["priority_order"] == [step["skill"] for step in path["learning_steps"]]
+        assert set(path["skill_progression"]) == set(path["priority_order"])
+        
+        gaps = (await db_session.execute(
+            select(SkillGap).where(SkillGap.analysis_id == analysis["id"])
+        )).scalars().all()
+        assert {gap.skill_name for gap in gaps} == {gap["skill_name"] for gap in analysis["missing_skills"]}
+        assert all(gap.importance and gap.difficulty_level for gap in gaps)
+        
+        resources = (await db_session.execute(
+            select(LearningResource).where(LearningResource.user_id == user_id)
+        )).scalars().all()
+        gap_names = {gap.id: gap.skill_name for gap in gaps}
+        assert len(resources) == len(analysis["learning_recommendations"])
+        assert {gap_names[r.skill_gap_id] for r in resources} == set(gap_names.values())
+    
+    async def test_analyze_skill_gaps_reuses_same_content(self, db_session: AsyncSession, job_and_resume, mock_resume_data):
+        """Test an analysis is reused for identical inputs and redone when the resume changes."""
+        user_id, job, resume = job_and_resume
+        
+        engine = SkillAnalyzerEngine()
+        first = await engine.analyze_skill_gaps(db_session, user_id, job.id)
+        with patch.object(engine, "_extract_user_skills", side_effect=AssertionError("recomputed")):
+            again = await engine.analyze_skill_gaps(db_session, user_id, job.id)
+        assert again["id"] == first["id"]
+        
+        resume.parsed_data = json.dumps({**mock_resume_data, "skills": ["Docker"]})
+        await db_session.commit()
+        updated = await engine.analyze_skill_gaps(db_session, user_id, job.id)
+        assert updated["id"] != first["id"]
+        assert "docker" not in {gap["skill_name"] for gap in updated["missing_skills"]}
 
 
 # ============================================================
@@ -423,6 +982,66 @@ class TestAIFeaturesIntegration:
         assert ats_score >= 0
         assert match_score >= 0
     
+    async def test_interview_analytics_endpoint(self, client: AsyncClient, test_user: User, db_session: AsyncSession):
+        """Test interview analytics read the latest kit and its question stats."""
+        job_id = str(uuid4())
+        kit = InterviewKit(
+            user_id=test_user.id,
+            job_id=job_id,
+            questions=[],
+            talking_points=[],
+            difficulty_level="advanced",
+            estimated_prep_time=90,
+        )
+        db_session.add(kit)
+        await db_session.flush()
+        db_session.add_all([
+            InterviewQuestion(kit_id=kit.id, user_id=test_user.id, question_text="Q1", category="technical",
+                              is_practiced=True, feedback_score=80.0),
+            InterviewQuestion(kit_id=kit.id, user_id=test_user.id, question_text="Q2", category="technical"),
+            InterviewQuestion(kit_id=kit.id, user_id=test_user.id, question_text="Q3", category="behavioral"),
+        ])
+        await db_session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+        
+        response = await client.get(f"{settings.API_V1_STR}/ai/interview/analytics/{job_id}", headers=headers)
+        missing = await client.get(f"{settings.API_V1_STR}/ai/interview/analytics/{uuid4()}", headers=headers)
+        
+        assert response.status_code == 200
+        analytics = response.json()["analytics"]
+        assert analytics["kit_id"] == kit.id
+        assert analytics["total_questions"] == 3
+        assert analytics["practiced_questions"] == 1
+        assert analytics["overall_avg_score"] == 80.0
+        assert analytics["category_breakdown"]["technical"]["total"] == 2
+        assert analytics["difficulty_level"] == "advanced"
+        assert missing.json()["kit_exists"] is False
+    
+    async def test_interview_questions_endpoint_json_columns(self, client: AsyncClient, test_user: User, db_session: AsyncSession):
+        """Test question JSON columns come back as lists and dicts."""
+        kit = InterviewKit(user_id=test_user.id, job_id=str(uuid4()), questions=[], talking_points=[])
+        db_session.add(kit)
+        await db_session.flush()
+        db_session.add(InterviewQuestion(
+            kit_id=kit.id,
+            user_id=test_user.id,
+            question_text="Q1",
+            category="technical",
+            suggested_answer={"approach": "STAR", "key_points": ["Scope"]},
+            key_points=["Scope"],
+            follow_up_questions=["Why?"],
+        ))
+        await db_session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+        
+        response = await client.get(f"{settings.API_V1_STR}/ai/interview/questions/{kit.id}", headers=headers)
+        
+        assert response.status_code == 200
+        question = response.json()["questions"][0]
+        assert question["suggested_answer"] == {"approach": "STAR", "key_points": ["Scope"]}
+        assert question["key_points"] == ["Scope"]
+        assert question["follow_up_questions"] == ["Why?"]
+    
     async def test_interview_prep_question_generation(self, mock_resume_data, mock_job_requirements):
         """Test interview question generation workflow."""
         engine = InterviewPreparationEngine()
@@ -447,6 +1066,26 @@ class TestAIFeaturesIntegration:
         )
         assert len(company_questions) > 0
     
+    async def test_interview_prep_technical_question_text(self, mock_resume_data, mock_job_requirements):
+        """Test technical templates are filled from the job's skills."""
+        engine = InterviewPreparationEngine()
+        questions = await engine._generate_technical_questions(mock_resume_data, mock_job_requirements, "intermediate")
+        texts = [q["text"] for q in questions]
+        assert texts[:2] == [
+            "Explain your experience with python",
+            "How would you approach aws implementation?",
+        ]
+        assert texts[4] == "How do you approach system design for scalable applications?"
+    
+    async def test_interview_prep_question_ids(self, mock_resume_data, mock_job_requirements):
+        """Test generated questions get distinct, ascending UUID7 ids."""
+        engine = InterviewPreparationEngine()
+        questions = await engine._generate_questions(mock_resume_data, mock_job_requirements, "intermediate")
+        ids = [q["id"] for q in questions]
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+        assert all(UUID(qid).version == 7 for qid in ids)
+    
     async def test_interview_prep_talking_points(self, mock_resume_data, mock_job_requirements):
         """Test talking points generation."""
         engine = InterviewPreparationEngine()
@@ -273,6 +273,71 @@ class TestActivityService:
         assert updated.status == ActivityStatus.APPLIED
         assert updated.notes == "Applied on company website"
     
+    async def test_store_match_updates_cached_score(self, db_session: AsyncSession, test_user: User):
+        """Test that storing a match refreshes the activity's cached score."""
+        from app.services.match_service import MatchDatabaseService
+        
+        job_id = "test-job-cached"
+        
+        await ActivityService.set_activity_status(
+            db=db_session,
+            user_id=test_user.id,
+            job_id=job_id,
+            status=ActivityStatus.INTERESTED,
+        )
+        
+        await MatchDatabaseService.store_match(
+            db=db_session,
+            user_id=test_user.id,
+            job_id=job_id,
+            resume_id="test-resume",
+            match_score=87.6,
+            score_breakdown={},
+            why={},
+            missing_skills=[],
+        )
+        
+        activity = await ActivityService.get_activity(
+            db=db_session,
+            user_id=test_user.id,
+            job_id=job_id,
+        )
+        await db_session.refresh(activity)
+        
+        assert activity.match_score_cached == 88
+        assert activity.match_updated_at is not None
+    
+    async def test_get_activities_sorted_by_match_score(self, db_session: AsyncSession, test_user: User):
+        """Test the tracker list can be ordered by cached match score."""
+        from app.services.match_service import MatchDatabaseService
+        
+        for job_id, score in (("job-low", 41.0), ("job-high", 92.0), ("job-mid", 67.0)):
+            await ActivityService.set_activity_status(
+                db=db_session,
+                user_id=test_user.id,
+                job_id=job_id,
+                status=ActivityStatus.INTERESTED,
+            )
+            await MatchDatabaseService.store_match(
+                db=db_session,
+                user_id=test_user.id,
+                job_id=job_id,
+                resume_id="test-resume",
+                match_score=score,
+                score_breakdown={},
+                why={},
+                missing_skills=[],
+            )
+        
+        activities, total = await ActivityService.get_activities(
+            db=db_session,
+            user_id=test_user.id,
+            sort_by="match_score",
+        )
+        
+        assert total == 3
+        assert [a.job_id for a in activities] == ["job-high", "job-mid", "job-low"]
+    
     async def test_get_activity(self, db: AsyncSession, test_user: User):
         """Test retrieving activity."""
         job_id = "test-job-789"
@@ -531,3 +596,81 @@ class TestActivityEndpoints:
         """Test GET /api/v1/tracker/summary endpoint."""
         # Placeholder for integration test
         pass
+
+
+class TestResponseSchemas:
+    """Test building response schemas from ORM rows."""
+    
+    def test_apply_kit_from_orm_fast_decodes_json(self):
+        """Test that JSON text columns are decoded."""
+        from app.schemas.apply import ApplyKitResponse
+        
+        kit = ApplyKit(
+            id="kit-1",
+            user_id="user-1",
+            job_id="job-1",
+            cover_letter="Dear team",
+            tailored_bullets_json=json.dumps(["Shipped X"]),
+            qa_json=json.dumps({"Why us?": "Because"}),
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        
+        response = ApplyKitResponse.from_orm_fast(kit)
+        
+        assert response.tailored_bullets_json == ["Shipped X"]
+        assert response.qa_json == {"Why us?": "Because"}
+    
+    def test_activity_from_orm_fast_maps_status(self):
+        """Test that the model status enum is mapped to its string value."""
+        from app.schemas.apply import JobActivityResponse
+        
+        activity = JobActivity(
+            id="activity-1",
+            user_id="user-1",
+            job_id="job-1",
+            status=ActivityStatus.APPLIED,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        
+        response = JobActivityResponse.from_orm_fast(activity)
+        
+        assert response.status == "applied"
+        assert json.loads(response.model_dump_json())["status"] == "applied"
+    
+    def test_set_status_request_validates_literal(self):
+        """Test that status requests accept known values and reject others."""
+        from pydantic import ValidationError
+        from app.schemas.apply import SetActivityStatusRequest
+        
+        request = SetActivityStatusRequest(status="interview")
+        assert ActivityStatus(request.status) is ActivityStatus.INTERVIEW
+        
+        with pytest.raises(ValidationError):
+            SetActivityStatusRequest(status="ghosted")
+    
+    def test_activity_list_envelope_matches_model_dump(self):
+        """Test that the spliced list envelope matches the wrapper model's JSON."""
+        from app.core.responses import list_envelope
+        from app.schemas.apply import (
+            JobActivityResponse,
+            JobActivityListResponse,
+            ACTIVITY_LIST_ADAPTER,
+        )
+        
+        activity = JobActivity(
+            id="activity-1",
+            user_id="user-1",
+            job_id="job-1",
+            status=ActivityStatus.OFFER,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        items = [JobActivityResponse.from_orm_fast(activity)]
+        meta = dict(total=1, page=1, page_size=20, total_pages=1)
+        
+        body = list_envelope("activities", ACTIVITY_LIST_ADAPTER.dump_json(items), **meta)
+        expected = JobActivityListResponse.model_construct(activities=items, **meta)
+        
+        assert json.loads(body) == json.loads(expected.model_dump_json())
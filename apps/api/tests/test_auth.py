@@ -212,3 +212,26 @@ async def test_register_weak_password(client: AsyncClient):
         }
     )
     assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_email_domain_case(client: AsyncClient):
+    """Test an email differing only in domain case is the same account."""
+    await client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={
+            "email": "casing@example.com",
+            "password": "TestPass123!",
+            "full_name": "First User"
+        }
+    )
+    
+    response = await client.post(
+        f"{settings.API_V1_STR}/auth/register",
+        json={
+            "email": "casing@Example.COM",
+            "password": "TestPass123!",
+            "full_name": "Second User"
+        }
+    )
+    assert response.status_code == 400
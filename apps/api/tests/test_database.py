@@ -0,0 +1,45 @@
+"""
+Tests for database session helpers.
+"""
+import pytest
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import gather_reads
+from app.models.job import JobPosting
+
+
+@pytest.mark.asyncio
+class TestGatherReads:
+    """Test concurrent reads on side sessions."""
+    
+    async def test_results_are_attached_to_caller_session(self, db_session: AsyncSession):
+        """Test ORM results come back attached to the caller's session, in order."""
+        job = JobPosting(
+            source_id=str(uuid4()),
+            title="Backend Engineer",
+            company="Acme",
+            application_url="https://acme.example/jobs/1",
+            url_hash="a" * 64,
+        )
+        db_session.add(job)
+        await db_session.commit()
+        db_session.expunge(job)
+        
+        async def get_job(session, job_id):
+            return await session.get(JobPosting, job_id)
+        
+        async def count_jobs(session):
+            return len((await session.scalars(select(JobPosting.id))).all())
+        
+        loaded, missing, count = await gather_reads(
+            db_session,
+            lambda session: get_job(session, job.id),
+            lambda session: get_job(session, str(uuid4())),
+            count_jobs,
+        )
+        
+        assert loaded in db_session
+        assert loaded.title == "Backend Engineer"
+        assert missing is None
+        assert count == 1
@@ -0,0 +1,34 @@
+"""
+Tests for time-ordered UUID7 identifiers.
+"""
+import time
+from uuid import UUID
+from app.core.ids import uuid7, uuid7_batch
+
+
+class TestUUID7:
+    """Test UUID7 layout and ordering."""
+    
+    def test_version_variant_and_timestamp(self):
+        """Test the version, variant and leading millisecond timestamp."""
+        before = time.time_ns() // 1_000_000
+        value = UUID(uuid7())
+        after = time.time_ns() // 1_000_000
+        
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+        assert before <= value.int >> 80 <= after
+    
+    def test_later_ids_sort_later(self):
+        """Test ids from later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        assert uuid7() > first
+    
+    def test_batch_is_ascending_and_unique(self):
+        """Test a batch comes back sorted with no duplicates."""
+        ids = uuid7_batch(50)
+        
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 50
+        assert uuid7_batch(0) == []
@@ -518,3 +518,62 @@ class TestJobSourceUserIsolation:
         # This is by design - job sources are shared resources
         assert delete_response.status_code in [204, 403, 404]
 
+
+
+@pytest.mark.asyncio
+class TestStoreJobs:
+    """Test job storage service."""
+    
+    async def test_store_jobs_writes_raw_sidecar(self, db_session: AsyncSession):
+        """Test that the original payload is stored in the raw sidecar table."""
+        from sqlalchemy import select
+        from app.models.job import JobPostingRaw
+        from app.services.job_service import JobService
+        
+        job_data = {
+            "title": "Backend Engineer",
+            "company": "Acme",
+            "application_url": "https://example.com/jobs/1",
+            "url_hash": "raw-sidecar-hash",
+        }
+        
+        stats = await JobService._store_jobs(db_session, str(uuid4()), [job_data])
+        
+        assert stats["new"] == 1
+        result = await db_session.execute(select(JobPostingRaw))
+        raw = result.scalar_one()
+        assert '"Backend Engineer"' in raw.raw_data
+
+
+class TestJobSourceSchema:
+    """Test job source schema validation."""
+    
+    def test_name_escaped_only_when_unsafe(self):
+        """Test that plain names pass through and HTML is escaped."""
+        from app.schemas.job import JobSourceCreate
+        
+        plain = JobSourceCreate(name="Remote OK", source_type="rss", url="https://remoteok.com/rss")
+        assert plain.name == "Remote OK"
+        
+        unsafe = JobSourceCreate(name="<b>R&D</b>", source_type="rss", url="https://example.com/rss")
+        assert unsafe.name == "&lt;b&gt;R&amp;D&lt;/b&gt;"
+    
+    def test_source_type_rejects_unknown(self):
+        """Test that unknown source types list the allowed values."""
+        from pydantic import ValidationError
+        from app.schemas.job import JobSourceCreate
+        
+        with pytest.raises(ValidationError, match="source_type must be one of: rss, api, html"):
+            JobSourceCreate(name="Feed", source_type="csv", url="https://example.com/feed")
+    
+    def test_job_filters_parse_query_strings(self):
+        """Test that job filters coerce query strings and accept any stored work type."""
+        from app.schemas.job import JobFilters
+        
+        filters = JobFilters.model_validate({"work_type": "hybrid", "is_active": "false", "page": "2"})
+        assert filters.work_type == "hybrid"
+        assert filters.is_active is False
+        assert filters.page == 2
+        
+        # Imported jobs keep the source's employment type as-is
+        assert JobFilters(work_type="onsite").work_type == "onsite"
@@ -284,3 +284,160 @@ class TestMatchScore:
         assert 'strengths' in why
         assert isinstance(why['reasons'], list)
         assert isinstance(why['strengths'], list)
+
+
+@pytest.mark.asyncio
+class TestMatchStorage:
+    """Test match persistence."""
+    
+    async def test_match_id_is_deterministic(self):
+        """Test that match ids depend only on (user, job, resume)."""
+        from app.models.match import match_id
+        
+        assert match_id("u1", "j1", "r1") == match_id("u1", "j1", "r1")
+        assert match_id("u1", "j1", "r1") != match_id("u1", "j1", "r2")
+    
+    async def test_store_match_upserts(self, db_session):
+        """Test that storing the same match twice updates it in place."""
+        from sqlalchemy import select, func
+        from app.models.match import JobMatch
+        from app.services.match_service import MatchDatabaseService
+        
+        for score in (70.0, 82.5):
+            match = await MatchDatabaseService.store_match(
+                db=db_session,
+                user_id="user-1",
+                job_id="job-1",
+                resume_id="resume-1",
+                match_score=score,
+                score_breakdown={},
+                why={},
+                missing_skills=[],
+            )
+        
+        count = await db_session.scalar(select(func.count(JobMatch.internal_id)))
+        assert count == 1
+        assert match.match_score == 82.5
+    
+    async def test_match_from_orm_decodes_json(self):
+        """Test building the response schema from a stored match."""
+        from datetime import datetime
+        from app.models.match import JobMatch
+        from app.schemas.match import match_from_orm
+        
+        match = JobMatch(
+            id="match-1",
+            user_id="user-1",
+            job_id="job-1",
+            resume_id="resume-1",
+            match_score=75.0,
+            score_breakdown='{"tf_idf": 60.0}',
+            why_json='{"reasons": ["Python"]}',
+            missing_skills_json="",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        
+        response = match_from_orm(match)
+        
+        assert response.score_breakdown == {"tf_idf": 60.0}
+        assert response.why == {"reasons": ["Python"]}
+        assert response.missing_skills is None
+    
+    async def test_match_from_orm_tolerates_malformed_json(self):
+        """Test that a corrupt JSON column maps to None instead of failing."""
+        from datetime import datetime
+        from app.models.match import JobMatch
+        from app.schemas.match import match_from_orm
+        
+        match = JobMatch(
+            id="match-2",
+            user_id="user-1",
+            job_id="job-1",
+            resume_id="resume-1",
+            match_score=40.0,
+            score_breakdown="{not json",
+            why_json='{"reasons": []}',
+            missing_skills_json='["Go"]',
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        
+        response = match_from_orm(match)
+        
+        assert response.score_breakdown is None
+        assert response.missing_skills == ["Go"]
+    
+    async def test_match_response_skips_json_field_validation(self):
+        """Test that decoded JSON fields pass through response validation untouched."""
+        from datetime import datetime
+        from app.schemas.match import JobMatchResponse
+        
+        breakdown = {"tf_idf": 60, "skill_overlap": 40}
+        response = JobMatchResponse(
+            id="match-3",
+            user_id="user-1",
+            job_id="job-1",
+            resume_id="resume-1",
+            match_score=50.0,
+            score_breakdown=breakdown,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+        )
+        
+        assert response.score_breakdown is breakdown
+    
+    async def test_delete_stale_matches_keeps_refreshed(self, db_session):
+        """Test that only matches not refreshed in the latest pass are deleted."""
+        from datetime import datetime, timedelta, timezone
+        from sqlalchemy import select
+        from app.models.match import JobMatch
+        from app.services.match_service import MatchDatabaseService
+        
+        earlier = datetime.now(timezone.utc) - timedelta(minutes=5)
+        latest = earlier + timedelta(minutes=5)
+        for job_id, refreshed_at in (("job-1", earlier), ("job-2", earlier), ("job-2", latest)):
+            await MatchDatabaseService.store_match(
+                db=db_session,
+                user_id="user-1",
+                job_id=job_id,
+                resume_id="resume-1",
+                match_score=75.0,
+                score_breakdown={},
+                why={},
+                missing_skills=[],
+                refreshed_at=refreshed_at,
+            )
+        
+        deleted = await MatchDatabaseService.delete_stale_matches(db_session, "user-1", latest)
+        
+        remaining = await db_session.scalars(select(JobMatch.job_id))
+        assert deleted == 1
+        assert remaining.all() == ["job-2"]
+    
+    async def test_concurrent_stores_keep_one_row(self, db_session):
+        """Test that racing stores of the same match leave a single row."""
+        import asyncio
+        from sqlalchemy import select, func
+        from app.models.match import JobMatch
+        from app.services.match_service import MatchDatabaseService
+        from tests.conftest import TestSessionLocal
+        
+        async def store(score):
+            async with TestSessionLocal() as session:
+                await MatchDatabaseService.store_match(
+                    db=session,
+                    user_id="user-1",
+                    job_id="job-1",
+                    resume_id="resume-1",
+                    match_score=score,
+                    score_breakdown={},
+                    why={},
+                    missing_skills=[],
+                )
+                await session.commit()
+        
+        await asyncio.gather(*(store(score) for score in (60.0, 70.0, 80.0)))
+        
+        count = await db_session.scalar(select(func.count(JobMatch.internal_id)))
+        assert count == 1
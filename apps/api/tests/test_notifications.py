@@ -8,7 +8,7 @@ from app.services.notification_service import (
 )
 from app.services.email_service import EmailTemplates, EmailService
 from app.models.notification import NotificationType
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 
 class TestNotificationSettings:
@@ -51,13 +51,13 @@ class TestNotificationSettings:
             db_session,
             user_id,
             email_enabled=False,
-            daily_digest_time="14:00",
-            high_match_threshold="75",
+            daily_digest_time=time(14, 0),
+            high_match_threshold=75,
         )
         
         assert updated.email_enabled is False
-        assert updated.daily_digest_time == "14:00"
-        assert updated.high_match_threshold == "75"
+        assert updated.daily_digest_time == time(14, 0)
+        assert updated.high_match_threshold == 75
 
 
 class TestRateLimiter:
@@ -216,3 +216,25 @@ class TestNotificationDefaults:
         ]
         
         assert len(enabled_types) == 6
+
+
+class TestNotificationSettingsSchema:
+    """Test notification settings schema parsing."""
+    
+    def test_parses_native_types_and_keeps_wire_format(self):
+        """Test that HH:MM and numeric strings parse once and dump as before."""
+        from app.schemas.notification import NotificationSettingsBase
+        
+        settings = NotificationSettingsBase(daily_digest_time="07:30", high_match_threshold="90")
+        
+        assert settings.daily_digest_time == time(7, 30)
+        assert settings.high_match_threshold == 90
+        assert settings.model_dump(mode="json")["daily_digest_time"] == "07:30"
+    
+    def test_rejects_out_of_range_threshold(self):
+        """Test that thresholds above 100 are rejected."""
+        from pydantic import ValidationError
+        from app.schemas.notification import NotificationSettingsUpdate
+        
+        with pytest.raises(ValidationError):
+            NotificationSettingsUpdate(high_match_threshold=150)
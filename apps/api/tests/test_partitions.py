@@ -0,0 +1,44 @@
+"""
+Tests for monthly partition maintenance helpers.
+"""
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.partitions import month_bounds, partition_name, partition_ddl, ensure_partitions
+
+
+class TestPartitionHelpers:
+    """Test partition naming and DDL generation."""
+    
+    def test_month_bounds(self):
+        """Test month bounds, including the December rollover."""
+        assert month_bounds(date(2025, 1, 17)) == (date(2025, 1, 1), date(2025, 2, 1))
+        assert month_bounds(date(2025, 12, 31)) == (date(2025, 12, 1), date(2026, 1, 1))
+    
+    def test_partition_name(self):
+        """Test partition table naming."""
+        assert partition_name("notification_logs", date(2025, 1, 1)) == "notification_logs_2025_01"
+    
+    def test_partition_ddl(self):
+        """Test partition DDL covers exactly one month."""
+        ddl = partition_ddl("job_matches", date(2025, 3, 9))
+        
+        assert "CREATE TABLE IF NOT EXISTS job_matches_2025_03 PARTITION OF job_matches" in ddl
+        assert "FROM ('2025-03-01') TO ('2025-04-01')" in ddl
+    
+    @pytest.mark.asyncio
+    async def test_ensure_partitions_noop_on_sqlite(self, db_session: AsyncSession):
+        """Test partition maintenance is skipped on non-Postgres databases."""
+        assert await ensure_partitions(db_session) == []
+    
+    @pytest.mark.asyncio
+    async def test_ensure_partitions_skips_plain_tables(self):
+        """Test tables created unpartitioned (by create_all) get no partitions."""
+        db = AsyncMock()
+        db.bind = MagicMock()
+        db.bind.dialect.name = "postgresql"
+        db.execute.return_value = MagicMock(scalars=MagicMock(return_value=[]))
+        
+        assert await ensure_partitions(db, today=date(2025, 3, 9)) == []
+        assert db.execute.await_count == 1
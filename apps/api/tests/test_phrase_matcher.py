@@ -0,0 +1,36 @@
+"""
+Tests for whole-word skill phrase matching.
+"""
+import pytest
+from app.services.ai import phrase_matcher
+from app.services.ai.phrase_matcher import PhraseMatcher
+
+
+SKILLS = ("python", "java", "javascript", "node.js", "ci/cd", "machine learning", "go", "ai")
+TEXT = "python3, node.js and ci/cd; machine learning (java) - a good javascript ai_ops team, go, ai"
+
+
+class TestPhraseMatcher:
+    """Test phrases match only as whole words."""
+    
+    def test_find_whole_words(self):
+        """Test substrings of longer words don't match."""
+        assert PhraseMatcher(SKILLS).find(TEXT) == {
+            "node.js", "ci/cd", "machine learning", "java", "javascript", "go", "ai"
+        }
+    
+    def test_finditer_offsets(self):
+        """Test each hit reports where the phrase starts."""
+        hits = list(PhraseMatcher(SKILLS).finditer(TEXT))
+        assert all(TEXT[start:start + len(phrase)] == phrase for start, phrase in hits)
+        assert [phrase for _, phrase in hits].count("ai") == 1
+    
+    def test_no_phrases(self):
+        """Test an empty matcher finds nothing."""
+        assert PhraseMatcher(()).find(TEXT) == set()
+    
+    @pytest.mark.skipif(not phrase_matcher.AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")
+    def test_automaton_matches_regex(self):
+        """Test the Aho-Corasick scan finds the same phrases as the regex."""
+        matcher = PhraseMatcher(SKILLS)
+        assert matcher.find(TEXT) == {match.group(0) for match in matcher._regex.finditer(TEXT)}
@@ -523,3 +523,45 @@ class TestPreferencesDefaults:
         # Should fail because resume not parsed
         assert response.status_code == 400
 
+
+
+class TestPreferencesSchemas:
+    """Test desired role normalization in preference schemas."""
+    
+    def test_input_prefers_desired_roles(self):
+        """Test that input schemas rebuild desired_role from desired_roles."""
+        from app.schemas.preferences import PreferencesUpdate
+        
+        prefs = PreferencesUpdate(desired_role="Engineer", desired_roles=["Backend", "Platform"])
+        
+        assert prefs.desired_role == "Backend, Platform"
+        assert prefs.desired_roles == ["Backend", "Platform"]
+    
+    def test_response_fills_missing_roles(self):
+        """Test that responses derive desired_roles for legacy single-role rows."""
+        from datetime import datetime
+        from app.schemas.preferences import PreferencesResponse
+        
+        now = datetime.utcnow()
+        prefs = PreferencesResponse(
+            id="pref-1",
+            user_id="user-1",
+            desired_role="Data Engineer",
+            desired_roles=[],
+            created_at=now,
+            updated_at=now,
+        )
+        
+        assert prefs.desired_roles == ["Data Engineer"]
+        assert prefs.desired_role == "Data Engineer"
+    
+    def test_salary_range_checked_after_construction(self):
+        """Test that max_salary below min_salary is rejected."""
+        from pydantic import ValidationError
+        from app.schemas.preferences import PreferencesCreate
+        
+        assert PreferencesCreate(min_salary=50000, max_salary=90000).max_salary == 90000
+        assert PreferencesCreate(max_salary=90000).min_salary is None
+        
+        with pytest.raises(ValidationError, match="max_salary must be greater than or equal to min_salary"):
+            PreferencesCreate(min_salary=200000, max_salary=100000)
@@ -0,0 +1,49 @@
+"""
+Tests for the orjson-backed response class.
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from app.core.responses import ORJSONPydanticResponse, list_envelope
+from app.schemas.notification import NotificationSettingsBase
+from app.schemas.match import RecomputeMatchesResponse
+
+
+class TestORJSONPydanticResponse:
+    """Test rendering of plain, model and pre-encoded content."""
+    
+    def test_native_types_render_like_pydantic(self):
+        """Test that datetimes, UUIDs and Decimals render in the Pydantic wire format."""
+        created = datetime(2025, 1, 20, 9, 30, tzinfo=timezone.utc)
+        resume_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        
+        body = ORJSONPydanticResponse(
+            {"id": resume_id, "created_at": created, "salary": Decimal("1.50")}
+        ).body
+        
+        assert json.loads(body) == {
+            "id": "12345678-1234-5678-1234-567812345678",
+            "created_at": "2025-01-20T09:30:00Z",
+            "salary": "1.50",
+        }
+    
+    def test_nested_models_keep_field_serializers(self):
+        """Test that models nested in plain content still use their serializers."""
+        body = ORJSONPydanticResponse({"settings": NotificationSettingsBase()}).body
+        
+        assert json.loads(body)["settings"]["daily_digest_time"] == "09:00"
+    
+    def test_list_envelope(self):
+        """Test splicing pagination fields around a pre-encoded array."""
+        body = list_envelope("items", b"[1,2]", total=2, page=1)
+        
+        assert json.loads(ORJSONPydanticResponse(body).body) == {"items": [1, 2], "total": 2, "page": 1}
+    
+    def test_model_content(self):
+        """Test that model content is dumped with model_dump_json."""
+        response = RecomputeMatchesResponse(
+            matches_computed=3, matches_stored=2, min_score=30.0, message="done"
+        )
+        
+        assert json.loads(ORJSONPydanticResponse(response).body)["matches_stored"] == 2
@@ -7,6 +7,8 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.models.user import User
+from app.models.resume import Resume, ResumeScorecard
+from app.services.resume import ResumeService
 from uuid import uuid4
 
 
@@ -462,6 +464,27 @@ class TestResumePublicScorecard:
         response = await client.get(f"{settings.API_V1_STR}/resume/public/invalid-token")
         assert response.status_code == 404
     
+    async def test_public_scorecard_increments_view_count(self, db_session: AsyncSession, test_user: User):
+        """Test that each public view increments the share link view count."""
+        resume = Resume(
+            user_id=test_user.id, filename="resume.pdf", file_path="/tmp/resume.pdf",
+            file_size=100, mime_type="application/pdf", is_parsed=True
+        )
+        db_session.add(resume)
+        await db_session.flush()
+        db_session.add(ResumeScorecard(
+            resume_id=resume.id, user_id=test_user.id, ats_score=80, contact_score=20,
+            sections_score=15, keywords_score=20, formatting_score=15, impact_score=10
+        ))
+        share_link = await ResumeService.create_share_link(db_session, resume.id, test_user.id)
+        
+        for _ in range(2):
+            assert await ResumeService.get_public_scorecard(db_session, share_link.share_token) is not None
+        
+        await db_session.refresh(share_link)
+        assert share_link.view_count == 2
+        assert share_link.last_viewed_at is not None
+    
     async def test_public_scorecard_no_personal_info(self, client: AsyncClient, auth_headers: dict, sample_pdf_bytes: bytes):
         """Test that public scorecard doesn't expose personal information."""
         # Upload resume
@@ -569,3 +592,39 @@ class TestResumeDelete:
         )
         assert scorecard_response.status_code == 404
 
+
+
+class TestParsedProfileSchema:
+    """Test parsed profile schema validation."""
+    
+    def test_experience_and_education_keep_known_and_extra_keys(self):
+        """Test that parser output validates into typed items without losing keys."""
+        from app.schemas.resume import ParsedProfile
+        
+        profile = ParsedProfile(
+            experience=[
+                {"title": "Engineer 2020 - Present", "period": "2020 - Present", "description": "Built APIs "},
+                {"company": "Acme", "position": "Developer", "achievements": ["Shipped v2"]},
+            ],
+            education=[{"degree": "B.S. Computer Science", "institution": "", "year": ""}],
+        )
+        
+        assert profile.experience[0].period == "2020 - Present"
+        assert profile.experience[1].company == "Acme"
+        assert profile.education[0].degree == "B.S. Computer Science"
+        
+        dumped = profile.model_dump(exclude_none=True)
+        assert dumped["experience"][1]["achievements"] == ["Shipped v2"]
+    
+    def test_parsed_items_keep_values_as_given(self):
+        """Test that non-string values still validate and missing keys are not dumped as null."""
+        from app.schemas.resume import ParsedProfile
+        
+        profile = ParsedProfile(
+            experience=[{"company": "Acme", "duration": 3}],
+            education=[{"degree": "B.S.", "year": 2018}],
+        )
+        
+        dumped = profile.model_dump()
+        assert dumped["experience"] == [{"company": "Acme", "duration": 3}]
+        assert dumped["education"] == [{"degree": "B.S.", "year": 2018}]
@@ -0,0 +1,299 @@
+"""
+Tests for the queued skill gap analysis (Redis Streams producer and consumer).
+Redis is replaced by a small in-memory stream so no server is needed.
+"""
+import pytest
+from httpx import AsyncClient
+import asyncio
+from unittest.mock import MagicMock, AsyncMock
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.main import app as fastapi_app
+from app.models.user import User
+from app.services.auth import create_access_token
+from app.api.v1.ai_skills import get_skill_queue
+from app.services.ai import skill_queue
+from app.services.ai.skill_queue import (
+    SkillAnalyzeProducer, SkillAnalyzeConsumer, STREAM, RETRY_KEY, task_key
+)
+
+
+class FakeStreamRedis:
+    """The Redis hash, sorted set and stream commands the queue uses, kept in memory."""
+    
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.entries = []
+        self.delivered = {}
+        self.acked = set()
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def _hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+    
+    def _xadd(self, stream, fields, **kwargs):
+        entry_id = f"{len(self.entries) + 1}-0"
+        self.entries.append((entry_id, {k: str(v) for k, v in fields.items()}))
+        return entry_id
+    
+    def _zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+    
+    async def hset(self, key, mapping):
+        self._hset(key, mapping)
+    
+    async def xack(self, stream, group, entry_id):
+        self.acked.add(entry_id)
+    
+    async def zrangebyscore(self, key, min, max, start=None, num=None):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, score in members if score <= max][:num]
+    
+    def register_script(self, script):
+        # Only the retry promotion script is registered: ZREM, then XADD if removed
+        async def promote_retry(keys, args):
+            retry_key, stream = keys
+            if self.zsets.get(retry_key, {}).pop(args[0], None) is None:
+                return 0
+            self._xadd(stream, dict(zip(args[2::2], args[3::2])))
+            return 1
+        return promote_retry
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    async def xgroup_create(self, *args, **kwargs):
+        return True
+    
+    def _pending(self, consumer=None):
+        return [
+            e for e in self.entries
+            if e[0] in self.delivered and e[0] not in self.acked
+            and (consumer is None or self.delivered[e[0]] == consumer)
+        ]
+    
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        if streams[STREAM] == "0":
+            entries = self._pending(consumer)
+        else:
+            entries = [e for e in self.entries if e[0] not in self.delivered]
+            self.delivered.update((entry_id, consumer) for entry_id, _ in entries)
+        return [(STREAM, entries)] if entries else []
+    
+    async def xautoclaim(self, stream, group, consumer, min_idle_time, start_id="0-0", count=None):
+        # Every pending entry counts as idle long enough
+        entries = [e for e in self._pending() if self.delivered[e[0]] != consumer]
+        self.delivered.update((entry_id, consumer) for entry_id, _ in entries)
+        return ["0-0", entries, []]
+
+
+class FakePipeline:
+    """Buffers commands like a redis-py pipeline and applies them on execute."""
+    
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def hset(self, key, mapping):
+        self.commands.append(lambda: self.redis_client._hset(key, mapping))
+    
+    def expire(self, key, seconds):
+        self.commands.append(lambda: None)
+    
+    def zadd(self, key, mapping):
+        self.commands.append(lambda: self.redis_client._zadd(key, mapping))
+    
+    def xadd(self, stream, fields, **kwargs):
+        self.commands.append(lambda: self.redis_client._xadd(stream, fields))
+    
+    def xack(self, stream, group, entry_id):
+        self.commands.append(lambda: self.redis_client.acked.add(entry_id))
+    
+    async def execute(self):
+        return [command() for command in self.commands]
+
+
+def _consumer(redis_client, analyze, name="test"):
+    engine = MagicMock()
+    engine.analyze_skill_gaps = analyze
+    return SkillAnalyzeConsumer(redis_client, MagicMock(), engine=engine, name=name)
+
+
+@pytest.mark.asyncio
+class TestSkillQueue:
+    """Test enqueueing, processing and retrying skill analysis tasks."""
+    
+    async def test_enqueue_marks_task_queued(self):
+        """Test a task gets a queued status hash and one stream entry."""
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1", regenerate=True)
+        
+        status = await SkillAnalyzeProducer(redis_client).get_status(task_id)
+        assert status == {"status": "queued", "user_id": "user-1", "job_id": "job-1"}
+        [(_, fields)] = redis_client.entries
+        assert fields["task_id"] == task_id
+        assert fields["regenerate"] == "1"
+        assert fields["attempt"] == "1"
+    
+    async def test_consumer_completes_and_acks(self):
+        """Test a processed task is marked completed with its analysis id."""
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        analyze = AsyncMock(return_value={"id": "analysis-1"})
+        consumer = _consumer(redis_client, analyze)
+        
+        [(entry_id, fields)] = await consumer.read()
+        await consumer.handle(entry_id, fields)
+        
+        assert redis_client.hashes[task_key(task_id)]["status"] == "completed"
+        assert redis_client.hashes[task_key(task_id)]["analysis_id"] == "analysis-1"
+        assert entry_id in redis_client.acked
+        assert analyze.await_args.kwargs["include_market_data"] is True
+        assert analyze.await_args.kwargs["regenerate"] is False
+    
+    async def test_consumer_retries_with_backoff(self, monkeypatch):
+        """Test a failed attempt is re-queued with a later retry time, then given up on."""
+        monkeypatch.setattr(skill_queue, "RETRY_BASE_SECONDS", 0.0)
+        monkeypatch.setattr(skill_queue, "MAX_ATTEMPTS", 2)
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        consumer = _consumer(redis_client, AsyncMock(side_effect=RuntimeError("database unavailable")))
+        
+        [(entry_id, fields)] = await consumer.read()
+        await consumer.handle(entry_id, fields)
+        assert redis_client.hashes[task_key(task_id)]["status"] == "queued"
+        assert entry_id in redis_client.acked
+        assert await consumer.read() == []
+        
+        assert await consumer.promote_due_retries() == 1
+        assert redis_client.zsets[RETRY_KEY] == {}
+        [(retry_id, retry_fields)] = await consumer.read()
+        assert retry_fields["attempt"] == "2"
+        await consumer.handle(retry_id, retry_fields)
+        assert redis_client.hashes[task_key(task_id)]["status"] == "failed"
+        assert redis_client.hashes[task_key(task_id)]["error"] == "database unavailable"
+        assert await consumer.promote_due_retries() == 0
+    
+    async def test_retry_waits_for_backoff(self):
+        """Test a retry isn't re-queued before its backoff has passed."""
+        redis_client = FakeStreamRedis()
+        await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        consumer = _consumer(redis_client, AsyncMock(side_effect=RuntimeError("database unavailable")))
+        
+        [(entry_id, fields)] = await consumer.read()
+        await consumer.handle(entry_id, fields)
+        assert await consumer.promote_due_retries() == 0
+        assert len(redis_client.zsets[RETRY_KEY]) == 1
+    
+    async def test_consumer_does_not_retry_missing_inputs(self):
+        """Test a missing resume or job fails the task without a retry."""
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        consumer = _consumer(redis_client, AsyncMock(side_effect=ValueError("Resume or job posting not found")))
+        
+        [(entry_id, fields)] = await consumer.read()
+        await consumer.handle(entry_id, fields)
+        assert redis_client.hashes[task_key(task_id)]["status"] == "failed"
+        assert len(redis_client.entries) == 1
+    
+    async def test_consumer_rereads_unacknowledged(self):
+        """Test entries delivered but never acknowledged are read again as pending."""
+        redis_client = FakeStreamRedis()
+        await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        consumer = _consumer(redis_client, AsyncMock(return_value={"id": "analysis-1"}))
+        
+        [(entry_id, _)] = await consumer.read()
+        [(pending_id, _)] = await consumer.read(pending=True)
+        assert pending_id == entry_id
+    
+    async def test_other_consumer_claims_stale_entries(self):
+        """Test entries left by a consumer that never comes back are claimed by another."""
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        await _consumer(redis_client, AsyncMock(), name="dead").read()
+        consumer = _consumer(redis_client, AsyncMock(return_value={"id": "analysis-1"}), name="live")
+        
+        assert await consumer.read(pending=True) == []
+        [(entry_id, fields)] = await consumer.claim_stale()
+        await consumer.handle(entry_id, fields)
+        assert redis_client.hashes[task_key(task_id)]["status"] == "completed"
+    
+    async def test_trimmed_pending_entry_is_acked(self):
+        """Test a pending entry trimmed from the stream is acknowledged and skipped."""
+        redis_client = FakeStreamRedis()
+        analyze = AsyncMock()
+        consumer = _consumer(redis_client, analyze)
+        
+        await consumer.handle("1-0", None)
+        assert "1-0" in redis_client.acked
+        analyze.assert_not_awaited()
+    
+    async def test_malformed_entry_is_failed_and_acked(self):
+        """Test an entry missing fields is marked failed and acknowledged instead of crashing."""
+        redis_client = FakeStreamRedis()
+        analyze = AsyncMock()
+        consumer = _consumer(redis_client, analyze)
+        
+        await consumer.handle("1-0", {"task_id": "task-1", "attempt": "x"})
+        await consumer.handle("2-0", {"user_id": "user-1"})
+        
+        assert redis_client.hashes[task_key("task-1")]["status"] == "failed"
+        assert {"1-0", "2-0"} <= redis_client.acked
+        analyze.assert_not_awaited()
+    
+    async def test_run_survives_redis_errors(self, monkeypatch):
+        """Test a Redis error backs off and the consumer keeps processing."""
+        monkeypatch.setattr(skill_queue, "REDIS_ERROR_BACKOFF_SECONDS", 0)
+        redis_client = FakeStreamRedis()
+        task_id = await SkillAnalyzeProducer(redis_client).enqueue("user-1", "job-1")
+        stop = asyncio.Event()
+        
+        async def analyze(*args, **kwargs):
+            stop.set()
+            return {"id": "analysis-1"}
+        
+        consumer = _consumer(redis_client, analyze)
+        read = redis_client.xreadgroup
+        
+        async def flaky_read(*args, **kwargs):
+            redis_client.xreadgroup = read
+            raise RedisConnectionError("connection reset")
+        
+        redis_client.xreadgroup = flaky_read
+        await asyncio.wait_for(consumer.run(stop), timeout=5)
+        
+        assert redis_client.hashes[task_key(task_id)]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+class TestSkillQueueEndpoints:
+    """Test the queued analysis endpoints."""
+    
+    async def test_queue_and_poll_task(self, client: AsyncClient, test_user: User):
+        """Test queueing answers 202 and only the owner can poll the task."""
+        redis_client = FakeStreamRedis()
+        fastapi_app.dependency_overrides[get_skill_queue] = lambda: SkillAnalyzeProducer(redis_client)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': test_user.id})}"}
+        
+        response = await client.post(
+            "/api/v1/ai/skills/analyze/tasks", json={"job_id": "job-1"}, headers=headers
+        )
+        assert response.status_code == 202
+        task_id = response.json()["task_id"]
+        
+        response = await client.get(f"/api/v1/ai/skills/analysis/tasks/{task_id}", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "queued"
+        assert response.json()["analysis"] is None
+        
+        redis_client.hashes[task_key(task_id)]["user_id"] = "someone-else"
+        response = await client.get(f"/api/v1/ai/skills/analysis/tasks/{task_id}", headers=headers)
+        assert response.status_code == 404
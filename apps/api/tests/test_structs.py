@@ -0,0 +1,105 @@
+"""
+Tests for list response encoding (msgspec structs with Pydantic fallback).
+"""
+import json
+import pytest
+from datetime import datetime
+from app.models.job import JobPosting
+from app.models.match import JobMatch
+from app.models.notification import NotificationLog, NotificationType
+from app.schemas.job import JobPostingResponse
+from app.schemas.match import match_from_orm
+from app.schemas.notification import NotificationLogResponse
+from app.schemas import structs
+
+
+NOW = datetime(2025, 1, 20, 9, 30, 0)
+
+
+def make_job() -> JobPosting:
+    return JobPosting(
+        id="job-1",
+        source_id="source-1",
+        title="Backend Engineer",
+        company="Acme",
+        application_url="https://acme.example/jobs/1",
+        salary_min=90000,
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def make_match() -> JobMatch:
+    return JobMatch(
+        id="match-1",
+        user_id="user-1",
+        job_id="job-1",
+        resume_id="resume-1",
+        match_score=81.5,
+        score_breakdown='{"tf_idf": 70.0}',
+        why_json='{"reasons": ["Python"]}',
+        missing_skills_json='["Go"]',
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def make_log() -> NotificationLog:
+    return NotificationLog(
+        id="log-1",
+        user_id="user-1",
+        notification_type=NotificationType.DAILY_DIGEST,
+        recipient_email="user@example.com",
+        subject="Your daily digest",
+        status="sent",
+        sent_at=NOW,
+        created_at=NOW,
+    )
+
+
+class TestListEncoding:
+    """Test that encoded lists match the Pydantic response schemas."""
+    
+    def test_job_postings_match_pydantic(self):
+        """Test job posting list encoding."""
+        job = make_job()
+        
+        expected = [json.loads(JobPostingResponse.from_orm_fast(job).model_dump_json())]
+        
+        assert json.loads(structs.dump_job_postings([job])) == expected
+    
+    def test_matches_match_pydantic(self):
+        """Test match list encoding, including decoded JSON columns."""
+        match = make_match()
+        
+        expected = [json.loads(match_from_orm(match).model_dump_json())]
+        
+        assert json.loads(structs.dump_matches([match])) == expected
+    
+    def test_notification_logs_match_pydantic(self):
+        """Test notification log list encoding."""
+        log = make_log()
+        
+        expected = [json.loads(NotificationLogResponse.from_orm_fast(log).model_dump_json())]
+        
+        assert json.loads(structs.dump_notification_logs([log])) == expected
+
+
+class TestMsgspecEncoding:
+    """Test the msgspec encoder against the Pydantic fallback."""
+    
+    @pytest.mark.parametrize("dump, make_row", [
+        (structs.dump_job_postings, make_job),
+        (structs.dump_matches, make_match),
+        (structs.dump_notification_logs, make_log),
+    ])
+    def test_msgspec_matches_fallback(self, monkeypatch, dump, make_row):
+        """Test msgspec structs encode the same JSON as the Pydantic fallback."""
+        pytest.importorskip("msgspec")
+        assert structs.enabled()
+        
+        encoded = dump([make_row()])
+        monkeypatch.setattr(structs.settings, "MSGSPEC_RESPONSES", False)
+        
+        assert json.loads(encoded) == json.loads(dump([make_row()]))
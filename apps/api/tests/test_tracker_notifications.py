@@ -194,7 +194,7 @@ class TestNotificationSettings:
         assert settings.user_id == test_user.id
         assert settings.email_enabled is True
         assert settings.daily_digest_enabled is True
-        assert settings.high_match_threshold == "85"
+        assert settings.high_match_threshold == 85
     
     async def test_update_settings(self, db: AsyncSession, test_user: User):
         """Test updating notification settings."""
@@ -204,12 +204,12 @@ class TestNotificationSettings:
             user_id=test_user.id,
             email_enabled=False,
             daily_digest_enabled=False,
-            high_match_threshold="90",
+            high_match_threshold=90,
         )
         
         assert updated.email_enabled is False
         assert updated.daily_digest_enabled is False
-        assert updated.high_match_threshold == "90"
+        assert updated.high_match_threshold == 90
     
     async def test_settings_persistence(self, db: AsyncSession, test_user: User):
         """Test that settings persist across calls."""